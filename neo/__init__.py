@@ -13,4 +13,20 @@ import logging
 logging_handler = logging.StreamHandler()
 
 from neo.core import *
-from neo.io import *
+
+# not a star import, which would import all the ios listed in neo.io.__all__
+from neo.io import get_io, list_candidate_ios, detect_io
+
+from neo import core, io
+
+# only a star import of neo imports all the ios, as they are listed in neo.io.__all__
+__all__ = [name for name in dir(core) if not name.startswith("_")] + io.__all__
+
+
+def __getattr__(name):
+    # io classes are imported lazily by neo.io, only on first access
+    from neo import io
+
+    if name in io._io_registry or name in ("iolist", "io_by_extension"):
+        return getattr(io, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
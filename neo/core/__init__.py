@@ -22,6 +22,7 @@ Classes:
 
 .. autoclass:: Event
 .. autoclass:: Epoch
+.. autoclass:: CategoricalLabels
 
 .. autoclass:: SpikeTrain
 .. autoclass:: ImageSequence
@@ -40,6 +41,7 @@ from neo.core.irregularlysampledsignal import IrregularlySampledSignal
 # Import FilterClasses
 from neo.core import filters
 
+from neo.core.categoricallabels import CategoricalLabels
 from neo.core.event import Event
 from neo.core.epoch import Epoch
 
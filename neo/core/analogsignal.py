@@ -86,6 +86,11 @@ def _new_AnalogSignalArray(
     return obj
 
 
+def _same_quantity(a, b):
+    """Return True if the quantity scalars `a` and `b` have the same value and the same units"""
+    return a.dimensionality.items() == b.dimensionality.items() and a.magnitude == b.magnitude
+
+
 class AnalogSignal(BaseSignal):
     """
     Array of one or more continuous analog signals.
@@ -534,6 +539,37 @@ class AnalogSignal(BaseSignal):
 
         return obj
 
+    def _time_slice_windows(self, t_starts, t_stops, deep_copy=True):
+        """
+        Batched version of :meth:`time_slice`, returning one slice per
+        window (t_starts[k], t_stops[k]).
+
+        The start and stop indices of all windows are computed at once. If
+        `deep_copy` is False the slices are views on the data of this signal.
+        """
+        sampling_rate = self.sampling_rate.rescale(pq.Hz).magnitude
+        starts = t_starts.rescale(pq.s).magnitude
+        stops = t_stops.rescale(pq.s).magnitude
+
+        i = np.rint((starts - self.t_start.rescale(pq.s).magnitude) * sampling_rate).astype(np.int64)
+        j = i + np.rint((stops - starts) * sampling_rate).astype(np.int64)
+
+        if np.any(i < 0) or np.any(j > len(self)):
+            raise ValueError("t_start, t_stop have to be within the analog signal duration")
+
+        # computing all new start times at once avoids a unit conversion per window
+        new_t_starts = self.t_start + i * self.sampling_period.rescale(self.t_start.units)
+
+        slices = []
+        for start, stop, new_t_start in zip(i, j, new_t_starts):
+            obj = super().__getitem__(slice(int(start), int(stop)))
+            obj.array_annotations = deepcopy(self.array_annotations)
+            if deep_copy:
+                obj = deepcopy(obj)
+            obj.t_start = new_t_start
+            slices.append(obj)
+        return slices
+
     def time_shift(self, t_shift):
         """
         Shifts a :class:`AnalogSignal` to start at a new time.
@@ -707,7 +743,7 @@ class AnalogSignal(BaseSignal):
 
         return rectified_signal
 
-    def concatenate(self, *signals, overwrite=False, padding=False):
+    def concatenate(self, *signals, overwrite=False, padding=False, filename=None):
         """
         Concatenate multiple neo.AnalogSignal objects across time.
 
@@ -716,6 +752,9 @@ class AnalogSignal(BaseSignal):
         Note that timestamps of concatenated signals might shift in oder to
         align the sampling times of all signals.
 
+        The position of every signal in the output is computed once, then all
+        signals are written into a single preallocated array.
+
         Parameters
         ----------
         signals: neo.AnalogSignal objects
@@ -735,6 +774,10 @@ class AnalogSignal(BaseSignal):
             forward in time by maximum one sampling period to
             align the sampling times of both signals.
             Default: False
+        filename : str | Path | None
+            If given, the concatenated data are written to a numpy.memmap
+            created at this path instead of being held in memory.
+            Default: None
 
         Returns
         -------
@@ -753,23 +796,44 @@ class AnalogSignal(BaseSignal):
         signals = [self] + list(signals)
 
         # Check required common attributes: units, sampling_rate and shape[-1]
+        # Comparing quantities is slow, so they are only compared if the plain values differ
         shared_attributes = ["units", "sampling_rate"]
-        attribute_values = [tuple((getattr(anasig, attr) for attr in shared_attributes)) for anasig in signals]
-        # add shape dimensions that do not relate to time
-        attribute_values = [(attribute_values[i] + (signals[i].shape[1:],)) for i in range(len(signals))]
-        if not all([attrs == attribute_values[0] for attrs in attribute_values]):
-            raise MergeError(f"AnalogSignals have to share {shared_attributes} attributes to be concatenated.")
-        units, sr, shape = attribute_values[0]
-
-        # find gaps between Analogsignals
-        combined_time_ranges = self._concatenate_time_ranges([(s.t_start, s.t_stop) for s in signals])
-        missing_time_ranges = self._invert_time_ranges(combined_time_ranges)
-        if len(missing_time_ranges):
-            diffs = np.diff(np.asarray(missing_time_ranges), axis=1)
-        else:
-            diffs = []
+        units, sr, shape = self.units, self.sampling_rate, self.shape[1:]
+        for anasig in signals[1:]:
+            if (
+                (anasig.dimensionality.items() != units.dimensionality.items() and anasig.units != units)
+                or (not _same_quantity(anasig.sampling_rate, sr) and anasig.sampling_rate != sr)
+                or anasig.shape[1:] != shape
+            ):
+                raise MergeError(f"AnalogSignals have to share {shared_attributes} attributes to be concatenated.")
+
+        # Position (in samples) of every signal in the output
+        time_units = self.t_start.units
+        t_starts = np.array(
+            [
+                (
+                    anasig.t_start.magnitude
+                    if anasig.t_start.dimensionality.items() == time_units.dimensionality.items()
+                    else anasig.t_start.rescale(time_units).magnitude
+                )
+                for anasig in signals
+            ],
+            dtype="float64",
+        )
+        lengths = np.array([anasig.shape[0] for anasig in signals], dtype="int64")
+        rate = (sr * time_units).simplified.magnitude
+        t_start = t_starts.min()
+        offsets = np.rint((t_starts - t_start) * rate).astype("int64")
+        n_samples = max(
+            int(np.rint((np.max(t_starts + lengths / rate) - t_start) * rate)), int(np.max(offsets + lengths))
+        )
+
+        # find gaps between AnalogSignals
+        order = np.argsort(t_starts, kind="stable")
+        covered_until = np.maximum.accumulate(t_starts[order] + lengths[order] / rate)
+        gaps = t_starts[order][1:] - covered_until[:-1]
 
-        if padding is False and any(diffs > signals[0].sampling_period):
+        if padding is False and np.any(gaps > 1 / rate):
             raise MergeError(
                 f"Signals are not continuous. Can not concatenate signals with gaps. "
                 f"Please provide a padding value."
@@ -785,11 +849,6 @@ class AnalogSignal(BaseSignal):
                     "Invalid type of padding value. Please provide a bool value " "or a quantities object."
                 )
 
-        t_start = min([a.t_start for a in signals])
-        t_stop = max([a.t_stop for a in signals])
-        n_samples = int(np.rint(((t_stop - t_start) * sr).rescale("dimensionless").magnitude))
-        shape = (n_samples,) + shape
-
         # Collect attributes and annotations across all concatenated signals
         kwargs = {}
         common_annotations = signals[0].annotations
@@ -808,37 +867,28 @@ class AnalogSignal(BaseSignal):
             else:
                 kwargs[name] = f"concatenation ({attr})"
 
+        shape = (n_samples,) + shape
+        if filename is None:
+            buffer = np.empty(shape=shape, dtype=self.dtype)
+        else:
+            buffer = np.memmap(filename, mode="w+", shape=shape, dtype=self.dtype)
+
+        # Only the samples not covered by any signal need padding
+        ends = np.maximum.accumulate(offsets[order] + lengths[order])
+        if offsets[order][0] > 0 or np.any(offsets[order][1:] > ends[:-1]) or ends[-1] < n_samples:
+            buffer[...] = padding
+
+        # With overwrite, later signals are written last so that they take precedence
+        write_order = range(len(signals)) if overwrite else range(len(signals) - 1, -1, -1)
+        for k in write_order:
+            buffer[offsets[k] : offsets[k] + lengths[k]] = signals[k].magnitude
+
         conc_signal = AnalogSignal(
-            np.full(shape=shape, fill_value=padding, dtype=signals[0].dtype),
+            buffer,
             sampling_rate=sr,
-            t_start=t_start,
+            t_start=t_start * time_units,
             units=units,
             **kwargs,
         )
 
-        if not overwrite:
-            signals = signals[::-1]
-        while len(signals) > 0:
-            conc_signal.splice(signals.pop(0), copy=False)
-
         return conc_signal
-
-    def _concatenate_time_ranges(self, time_ranges):
-        time_ranges = sorted(time_ranges)
-        new_ranges = time_ranges[:1]
-        for t_start, t_stop in time_ranges[1:]:
-            # time range are non continuous -> define new range
-            if t_start > new_ranges[-1][1]:
-                new_ranges.append((t_start, t_stop))
-            # time range is continuous -> extend time range
-            elif t_stop > new_ranges[-1][1]:
-                new_ranges[-1] = (new_ranges[-1][0], t_stop)
-        return new_ranges
-
-    def _invert_time_ranges(self, time_ranges):
-        i = 0
-        new_ranges = []
-        while i < len(time_ranges) - 1:
-            new_ranges.append((time_ranges[i][1], time_ranges[i + 1][0]))
-            i += 1
-        return new_ranges
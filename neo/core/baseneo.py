@@ -197,6 +197,11 @@ def _container_name(class_name):
         return _reference_name(class_name) + "s"
 
 
+# key of the memo passed to deepcopy by BaseNeo.shared_copy(): data objects
+# found in the memo under this key share their data arrays instead of copying them
+_share_data_memo_key = "neo_share_data"
+
+
 class BaseNeo:
     """
     This is the base class from which all Neo objects inherit.
@@ -394,6 +399,22 @@ class BaseNeo:
         """
         self.merge_annotations(*others)
 
+    def shared_copy(self):
+        """
+        Create a copy that shares its data arrays with this object.
+
+        The copy is built like :func:`copy.deepcopy` (names, annotations and,
+        for containers, all children and their relationships are copied),
+        except that the data arrays of all data objects (signals, spike times
+        and waveforms, event and epoch times, array annotations) are
+        read-only views on the original arrays. This makes it cheap to derive
+        many variants of a large Block.
+
+        Modifying the data of the original object in place also modifies the
+        copy. Use :func:`copy.deepcopy` to get an independent, writable copy.
+        """
+        return deepcopy(self, {_share_data_memo_key: True})
+
     def set_parent(self, obj):
         """
         Set the appropriate "parent" attribute of this object
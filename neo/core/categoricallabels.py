@@ -0,0 +1,167 @@
+"""
+This module defines :class:`CategoricalLabels`, a compact representation of
+the labels of an :class:`Event` or :class:`Epoch`.
+
+Labels are stored as integer codes into a vocabulary of categories. This
+saves memory for long event streams that use a few distinct labels, and the
+codes can be sliced, merged and paired without building the strings.
+"""
+
+import numpy as np
+
+from neo.core.baseneo import _share_data_memo_key
+
+
+def _code_dtype(n_categories):
+    return np.min_scalar_type(max(n_categories - 1, 0))
+
+
+class CategoricalLabels:
+    """
+    Labels stored as integer codes into a vocabulary of unique labels
+
+    Slicing returns a new :class:`CategoricalLabels` that shares the vocabulary.
+    :meth:`to_array` (or :func:`np.asarray`) gives back the labels as a
+    numpy array of dtype 'U'.
+
+    Parameters
+    ----------
+    codes: numpy.ndarray 1d of integers | list
+        For each label, its index in `categories`
+    categories: numpy.ndarray 1d dtype='U' | list
+        The vocabulary of unique labels
+
+    Examples
+    --------
+
+    >>> from neo.core import CategoricalLabels
+    >>>
+    >>> labels = CategoricalLabels.from_labels(['start', 'stop', 'start'])
+    >>> labels.categories
+    array(['start', 'stop'], dtype='<U5')
+    >>> labels.codes
+    array([0, 1, 0], dtype=uint8)
+    >>> labels.to_array()
+    array(['start', 'stop', 'start'], dtype='<U5')
+
+    """
+
+    def __init__(self, codes, categories):
+        codes = np.asarray(codes)
+        if codes.size == 0:
+            codes = codes.astype(_code_dtype(0))
+        if codes.dtype.kind not in "iu":
+            raise TypeError(f"Label codes must be integers, not {codes.dtype}")
+        categories = np.asarray(categories)
+        if categories.dtype.kind != "U":
+            categories = categories.astype("U")
+        # the vocabulary is shared between slices and copies, so it is made read-only
+        if categories.flags.writeable:
+            categories = categories.view()
+            categories.flags.writeable = False
+        self.codes = codes
+        self.categories = categories
+
+    @classmethod
+    def from_labels(cls, labels):
+        """
+        Create :class:`CategoricalLabels` from an array or list of labels
+        """
+        if isinstance(labels, cls):
+            return labels
+        categories, codes = np.unique(np.asarray(labels, dtype="U"), return_inverse=True)
+        return cls(codes.reshape(-1).astype(_code_dtype(categories.size)), categories)
+
+    def to_array(self):
+        """
+        Return the labels as a numpy array of dtype 'U'
+        """
+        return self.categories[self.codes]
+
+    def __array__(self, dtype=None, copy=None):
+        labels = self.to_array()
+        if dtype is not None:
+            labels = labels.astype(dtype)
+        return labels
+
+    @property
+    def size(self):
+        return self.codes.size
+
+    @property
+    def shape(self):
+        return self.codes.shape
+
+    @property
+    def ndim(self):
+        return self.codes.ndim
+
+    @property
+    def dtype(self):
+        return self.categories.dtype
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __iter__(self):
+        return iter(self.to_array())
+
+    def __getitem__(self, i):
+        codes = self.codes[i]
+        if np.ndim(codes) == 0:
+            return self.categories[codes]
+        return self.__class__(codes, self.categories)
+
+    def __deepcopy__(self, memo):
+        if memo.get(_share_data_memo_key, False):
+            # see BaseNeo.shared_copy()
+            codes = self.codes.view()
+            codes.flags.writeable = False
+        else:
+            codes = self.codes.copy()
+        return self.__class__(codes, self.categories)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.to_array()!r})"
+
+
+def concatenate_labels(labels1, labels2):
+    """
+    Concatenate two label arrays, each of them a numpy array or :class:`CategoricalLabels`.
+
+    If one of them is categorical, so is the result: the codes are remapped
+    onto the union of both vocabularies, without building the strings.
+    """
+    if not isinstance(labels1, CategoricalLabels) and not isinstance(labels2, CategoricalLabels):
+        return np.hstack([labels1, labels2])
+    labels1 = CategoricalLabels.from_labels(labels1)
+    labels2 = CategoricalLabels.from_labels(labels2)
+    if labels1.categories is labels2.categories or np.array_equal(labels1.categories, labels2.categories):
+        categories = labels1.categories
+        codes1, codes2 = labels1.codes, labels2.codes
+    else:
+        categories = np.union1d(labels1.categories, labels2.categories)
+        codes1 = np.searchsorted(categories, labels1.categories)[labels1.codes]
+        codes2 = np.searchsorted(categories, labels2.categories)[labels2.codes]
+    codes = np.concatenate([codes1, codes2]).astype(_code_dtype(categories.size))
+    return CategoricalLabels(codes, categories)
+
+
+def join_labels(labels1, labels2, sep="-"):
+    """
+    Join two label arrays of the same length element-wise, as 'label1-label2'.
+
+    For :class:`CategoricalLabels`, only the distinct pairs of labels are built
+    as strings.
+    """
+    if not isinstance(labels1, CategoricalLabels) and not isinstance(labels2, CategoricalLabels):
+        return np.char.add(np.char.add(np.asarray(labels1, dtype="U"), sep), np.asarray(labels2, dtype="U"))
+    labels1 = CategoricalLabels.from_labels(labels1)
+    labels2 = CategoricalLabels.from_labels(labels2)
+    n_categories2 = labels2.categories.size
+    pairs = labels1.codes.astype("int64") * n_categories2 + labels2.codes
+    unique_pairs, codes = np.unique(pairs, return_inverse=True)
+    categories = join_labels(
+        labels1.categories[unique_pairs // n_categories2], labels2.categories[unique_pairs % n_categories2], sep=sep
+    )
+    return CategoricalLabels(codes.reshape(-1).astype(_code_dtype(categories.size)), categories)
@@ -6,6 +6,11 @@ object inherit from.  It provides shared methods for all container types.
 """
 
 from copy import deepcopy
+from itertools import chain
+from numbers import Real
+import operator
+
+import numpy as np
 
 from neo.core import filters
 from neo.core.baseneo import BaseNeo, _reference_name, _container_name
@@ -101,6 +106,154 @@ def filterdata(data, targdict=None, objects=None, **kwargs):
         return results
 
 
+def _annotation_column(values):
+    """
+    Pack a list of annotation values into a 1D array.
+
+    Strings and real numbers are packed into arrays of the corresponding dtype, so that
+    they can be compared with vectorized operations. Anything else is kept in an
+    array of objects.
+    """
+    types = {type(value) for value in values}
+    if all(issubclass(t, str) for t in types):
+        return np.array(values, dtype=str)
+    if all(issubclass(t, Real) for t in types):
+        try:
+            column = np.array(values)
+        except OverflowError:
+            column = None
+        if column is not None and column.dtype.kind in "biuf":
+            return column
+    column = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        column[i] = value
+    return column
+
+
+def _index_snapshot(objects):
+    """
+    Snapshot of the instance attributes and annotations of the indexed objects,
+    as flat lists which are compared in bulk by :meth:`_AnnotationIndex.is_valid`.
+    """
+    # map and chain avoid a Python level loop, as the snapshot is taken before each query
+    annotations = list(map(operator.attrgetter("annotations"), objects))
+    return (
+        list(map(len, map(vars, objects))),
+        list(map(len, annotations)),
+        list(chain.from_iterable(annotations)),
+        list(chain.from_iterable(map(dict.values, annotations))),
+    )
+
+
+class _AnnotationIndex:
+    """
+    Columnar index of the attributes and annotations of the children of a container.
+
+    For each annotation key, the index stores the positions of the objects having
+    this annotation together with their values packed in an array, so that filter
+    conditions are evaluated with vectorized operations over the whole column
+    instead of object by object.
+    """
+
+    def __init__(self, children):
+        self.children = tuple(children)
+        objects = unique_objs(self.children)
+        self.objects = tuple(objects)
+        self.snapshot = _index_snapshot(objects)
+        self.is_container = np.array([isinstance(obj, Container) for obj in objects], dtype=bool)
+
+        classes = []
+        class_ids = []
+        annotations = {}
+        instance_attributes = {}
+        for i, obj in enumerate(objects):
+            if obj.__class__ not in classes:
+                classes.append(obj.__class__)
+            class_ids.append(classes.index(obj.__class__))
+            for key, value in obj.annotations.items():
+                positions, values = annotations.setdefault(key, ([], []))
+                positions.append(i)
+                values.append(value)
+            for key in vars(obj):
+                instance_attributes.setdefault(key, []).append(i)
+
+        self.classes = classes
+        self.class_ids = np.array(class_ids, dtype=np.int64)
+        self.columns = {
+            key: (np.array(positions, dtype=np.int64), _annotation_column(values))
+            for key, (positions, values) in annotations.items()
+        }
+        self.instance_attributes = {
+            key: np.array(positions, dtype=np.int64) for key, positions in instance_attributes.items()
+        }
+
+    def is_valid(self, children):
+        """
+        Check that the index still describes the given children, i.e. that no
+        child has been added or removed, and that no instance attribute has been
+        added or removed and no annotation has been added, removed or replaced on
+        an indexed object since the index was created.
+        """
+        if len(children) != len(self.children) or not all(map(operator.is_, children, self.children)):
+            return False
+        num_attributes, num_annotations, keys, values = _index_snapshot(self.objects)
+        if num_attributes != self.snapshot[0] or num_annotations != self.snapshot[1] or keys != self.snapshot[2]:
+            return False
+        # annotation values are compared by identity, which detects replaced values
+        # without comparing (possibly large) values
+        return all(map(operator.is_, values, self.snapshot[3]))
+
+    def _attribute_positions(self, key):
+        """
+        Return a boolean mask of the objects having an attribute with name `key`.
+        """
+        class_has_attr = np.array([hasattr(cls, key) for cls in self.classes], dtype=bool)
+        mask = class_has_attr[self.class_ids]
+        if key in self.instance_attributes:
+            mask[self.instance_attributes[key]] = True
+        return mask
+
+    def _match(self, targdict, candidates):
+        """
+        Return a boolean mask of the candidate objects matching *any* of the search terms in targdict.
+
+        As in :func:`filterdata`, the search terms are tested in sorted order, and only
+        on the objects which did not match any of the previous terms.
+        """
+        match = np.zeros(len(self.objects), dtype=bool)
+        for key, value in sorted(targdict.items()):
+            for i in np.flatnonzero(candidates & ~match & self._attribute_positions(key)):
+                obj = self.objects[i]
+                if hasattr(obj, key) and getattr(obj, key) == value:
+                    match[i] = True
+            if key in self.columns:
+                positions, values = self.columns[key]
+                selected = candidates[positions] & ~match[positions]
+                if not isinstance(value, filters.FilterCondition):
+                    value = filters.Equals(value)
+                positions = positions[selected]
+                match[positions[value.evaluate_array(values[selected])]] = True
+        return match
+
+    def filter(self, targdicts, objects=None, data=True, container=False):
+        """
+        Return the objects matching all dicts of search terms in targdicts,
+        see :func:`filterdata`.
+        """
+        mask = np.zeros(len(self.objects), dtype=bool)
+        if data:
+            mask |= ~self.is_container
+        if container:
+            mask |= self.is_container
+        if objects:
+            allowed = [i for i, cls in enumerate(self.classes) if cls in objects or cls.__name__ in objects]
+            mask &= np.isin(self.class_ids, allowed)
+        for targdict in targdicts:
+            if targdict:
+                mask &= self._match(targdict, mask)
+        return [self.objects[i] for i in np.flatnonzero(mask)]
+
+
 class Container(BaseNeo):
     """
     This is the base class from which Neo container objects inherit.  It
@@ -405,6 +558,9 @@ class Container(BaseNeo):
             data = True
             container = True
 
+        if recursive and getattr(self, "_annotation_index", None) is not None:
+            return self._filter_with_index(targdict, data=data, container=container, objects=objects, **kwargs)
+
         children = []
         # get the objects we want
         if data:
@@ -424,6 +580,72 @@ class Container(BaseNeo):
         else:
             return filtered
 
+    def create_annotation_index(self):
+        """
+        Create an index of the attributes and annotations of all children of
+        this container (recursively), which is then used by :meth:`filter`.
+
+        With the index, filter conditions are evaluated with vectorized NumPy
+        operations over columns of annotation values, instead of object by
+        object, which makes repeated queries on containers with many children
+        much faster. The results are the same as without the index.
+
+        The index is rebuilt automatically when children are added or removed,
+        or when annotations are added, removed or replaced, with :meth:`annotate`
+        or by editing the `annotations` dict directly. Annotation values that are
+        modified in place (e.g. appending to a list) are not detected, call this
+        method again after such changes.
+        """
+        self._annotation_index = _AnnotationIndex(self._children_recur_for_index())
+
+    def remove_annotation_index(self):
+        """
+        Remove the annotation index created by :meth:`create_annotation_index`.
+        """
+        self._annotation_index = None
+
+    def _children_recur_for_index(self):
+        """
+        All data children followed by all container children, obtained recursively,
+        in the order used by :meth:`filter`. Duplicates are not removed here, this is
+        done once when building the annotation index.
+        """
+        # using the Container implementation, which does not remove duplicate objects
+        return Container.data_children_recur.fget(self) + self.container_children_recur
+
+    def _filter_with_index(self, targdict=None, data=True, container=False, objects=None, **kwargs):
+        """
+        Implementation of :meth:`filter` (with recursive=True) using the annotation index.
+        """
+        children = self._children_recur_for_index()
+        if not self._annotation_index.is_valid(children):
+            self._annotation_index = _AnnotationIndex(children)
+
+        as_spiketrainlist = objects == SpikeTrain
+        if objects:
+            if hasattr(objects, "lower") or isinstance(objects, type):
+                objects = [objects]
+        elif objects is not None:
+            return []
+
+        if targdict is None:
+            targdict = kwargs
+        elif not kwargs:
+            pass
+        elif hasattr(targdict, "keys"):
+            targdict = [targdict, kwargs]
+        else:
+            targdict = targdict + [kwargs]
+        if hasattr(targdict, "keys"):
+            targdict = [targdict]
+
+        results = self._annotation_index.filter(targdict, objects=objects, data=data, container=container)
+
+        if as_spiketrainlist or (results and all(isinstance(obj, SpikeTrain) for obj in results)):
+            return SpikeTrainList(items=results)
+        else:
+            return results
+
     def list_children_by_class(self, cls):
         """
         List all children of a particular class recursively.
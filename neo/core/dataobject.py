@@ -11,7 +11,7 @@ import warnings
 import quantities as pq
 import numpy as np
 
-from neo.core.baseneo import BaseNeo, _check_annotations
+from neo.core.baseneo import BaseNeo, _check_annotations, _share_data_memo_key
 
 
 def _normalize_array_annotations(value, length):
@@ -137,6 +137,69 @@ def _normalize_array_annotations(value, length):
     return value
 
 
+def _concatenate_array_annotations(values):
+    """Concatenate the columns of one array annotation taken from several objects
+
+    Quantity columns are rescaled to the units of the first column and concatenated
+    as plain arrays, so the units are attached once to the result.
+
+    Parameters
+    ----------
+    values : list of np.ndarray
+        The columns to be joined, in order.
+
+    Returns
+    -------
+    np.ndarray
+        A new contiguous array holding all the values.
+
+    Raises
+    ------
+    ValueError
+        In case Quantity columns have incompatible units
+    """
+    first = values[0]
+    if isinstance(first, pq.Quantity):
+        try:
+            magnitudes = [first.magnitude] + [value.rescale(first.units).magnitude for value in values[1:]]
+        except ValueError:
+            raise ValueError("Could not merge array annotations due to different units")
+        return pq.Quantity(np.concatenate(magnitudes), units=first.units)
+    return np.concatenate(values)
+
+
+def _window_indices(times, t_starts, t_stops):
+    """Find the entries of `times` falling into each of several closed time windows
+
+    All windows are resolved with a single pair of :func:`np.searchsorted` calls,
+    instead of one full comparison pass over `times` per window.
+
+    Parameters
+    ----------
+    times : np.ndarray
+        1-dimensional array of time stamps, not necessarily sorted.
+    t_starts, t_stops : np.ndarray
+        Bounds of the windows, in the same units as `times`. Both bounds are included.
+
+    Returns
+    -------
+    list
+        One index per window. If `times` is sorted these are slices, so that indexing
+        with them returns views. Otherwise they are arrays of integer indices in
+        increasing order, i.e. the order of the original entries is preserved.
+    """
+    if times.size < 2 or np.all(times[1:] >= times[:-1]):
+        lo = np.searchsorted(times, t_starts, side="left")
+        hi = np.searchsorted(times, t_stops, side="right")
+        return [slice(int(i), int(j)) for i, j in zip(lo, hi)]
+
+    order = np.argsort(times, kind="stable")
+    sorted_times = times[order]
+    lo = np.searchsorted(sorted_times, t_starts, side="left")
+    hi = np.searchsorted(sorted_times, t_stops, side="right")
+    return [np.sort(order[i:j]) for i, j in zip(lo, hi)]
+
+
 class DataObject(BaseNeo, pq.Quantity):
     """
     This is the base class from which all objects containing data inherit
@@ -245,6 +308,23 @@ class DataObject(BaseNeo, pq.Quantity):
 
         return index_annotations
 
+    def _array_annotate_from(self, other, index):
+        """
+        Set the array annotations of this object to those of `other` at `index`
+
+        This object must be the result of indexing `other` with `index`. The array
+        annotations of `other` have already been validated, so the columns are only
+        indexed and are not checked again. As for the data, indexing with a slice gives
+        views on the columns of `other` while any other index gives copies.
+        """
+        array_annotations = ArrayDict(self._get_arr_ann_length())
+        for key, value in other.array_annotations_at_index(index).items():
+            if isinstance(value, np.ndarray) and value.ndim == 1:
+                dict.__setitem__(array_annotations, key, value)
+            else:
+                array_annotations[key] = value
+        self.array_annotations = array_annotations
+
     def _merge_array_annotations(self, other):
         """
         Merges array annotations of 2 different objects.
@@ -268,25 +348,15 @@ class DataObject(BaseNeo, pq.Quantity):
 
         merged_array_annotations = {}
         omitted_keys_self = []
-        # Concatenating arrays for each key
+        # Concatenating arrays for each key, the result is a new array so no copy is needed
         for key in self.array_annotations:
-            try:
-                value = deepcopy(self.array_annotations[key])
-                other_value = deepcopy(other.array_annotations[key])
-                # Quantities need to be rescaled to common unit
-                if isinstance(value, pq.Quantity):
-                    try:
-                        other_value = other_value.rescale(value.units)
-                    except ValueError:
-                        raise ValueError("Could not merge array annotations " "due to different units")
-                    merged_array_annotations[key] = np.append(value, other_value) * value.units
-                else:
-                    merged_array_annotations[key] = np.append(value, other_value)
-
-            except KeyError:
+            if key not in other.array_annotations:
                 # Save the  omitted keys to be able to print them
                 omitted_keys_self.append(key)
                 continue
+            merged_array_annotations[key] = _concatenate_array_annotations(
+                [self.array_annotations[key], other.array_annotations[key]]
+            )
         # Also save omitted keys from 'other'
         omitted_keys_other = [key for key in other.array_annotations if key not in self.array_annotations]
 
@@ -394,6 +464,18 @@ class DataObject(BaseNeo, pq.Quantity):
             length = 1
         return length
 
+    def _new_for_deepcopy(self):
+        """
+        Create the new object that is filled in by :meth:`__deepcopy__`
+        """
+        cls = self.__class__
+        necessary_attrs = {}
+        # Units need to be specified explicitly for analogsignals/irregularlysampledsignals
+        for k in self._necessary_attrs + (("units",),):
+            necessary_attrs[k[0]] = getattr(self, k[0], self)
+        # Create object using constructor with necessary attributes
+        return cls(**necessary_attrs)
+
     def __deepcopy__(self, memo):
         """
         Create a deep copy of the data object.
@@ -404,13 +486,12 @@ class DataObject(BaseNeo, pq.Quantity):
         :param memo: (dict) Objects that have been deep copied already
         :return: (DataObject) Deep copy of the input DataObject
         """
-        cls = self.__class__
-        necessary_attrs = {}
-        # Units need to be specified explicitly for analogsignals/irregularlysampledsignals
-        for k in self._necessary_attrs + (("units",),):
-            necessary_attrs[k[0]] = getattr(self, k[0], self)
-        # Create object using constructor with necessary attributes
-        new_obj = cls(**necessary_attrs)
+        share_data = memo.get(_share_data_memo_key, False)
+        if share_data:
+            # see BaseNeo.shared_copy()
+            new_obj = _read_only_view(self)
+        else:
+            new_obj = self._new_for_deepcopy()
         # Add all attributes
         new_obj.__dict__.update(self.__dict__)
         memo[id(self)] = new_obj
@@ -424,13 +505,40 @@ class DataObject(BaseNeo, pq.Quantity):
                 setattr(new_obj, k, None)
                 continue
             try:
-                setattr(new_obj, k, deepcopy(v, memo))
+                if share_data:
+                    setattr(new_obj, k, _share_value(v, memo))
+                else:
+                    setattr(new_obj, k, deepcopy(v, memo))
             except TypeError:
                 setattr(new_obj, k, v)
 
         return new_obj
 
 
+def _read_only_view(array):
+    """
+    Return a read-only view of a numpy array (or subclass), sharing its data
+    """
+    view = array.view(type(array))
+    view.flags.writeable = False
+    return view
+
+
+def _share_value(value, memo):
+    """
+    Copy an attribute of a data object for BaseNeo.shared_copy(): arrays are shared
+    as read-only views, everything else is deep copied.
+    """
+    if isinstance(value, np.ndarray) and value.ndim > 0 and not isinstance(value, DataObject):
+        return _read_only_view(value)
+    if isinstance(value, ArrayDict):
+        new_value = ArrayDict(value.length, value.check_function)
+        # the array annotations are already checked, do not check them again
+        dict.update(new_value, {k: _share_value(v, memo) for k, v in value.items()})
+        return new_value
+    return deepcopy(value, memo)
+
+
 class ArrayDict(dict):
     """Dictionary subclass to handle array annotations
 
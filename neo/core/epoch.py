@@ -12,7 +12,8 @@ import numpy as np
 import quantities as pq
 
 from neo.core.baseneo import BaseNeo, merge_annotations
-from neo.core.dataobject import DataObject, ArrayDict
+from neo.core.categoricallabels import CategoricalLabels, concatenate_labels
+from neo.core.dataobject import DataObject, ArrayDict, _window_indices
 
 
 def _new_epoch(
@@ -60,9 +61,13 @@ class Epoch(DataObject):
         The length(s) of each time period.
         If a scalar/float, the same value is used for all time periods.
         If None, generates an empty array
-    labels: numpy.array 1D dtype='U' | list | None, default: None
+    labels: numpy.array 1D dtype='U' | list | CategoricalLabels | None, default: None
         Names or labels for the time periods.
-        If None, creates an empty array
+        If None, creates an empty array.
+        Labels given as :class:`CategoricalLabels` are kept as integer codes through
+        slicing and merging; the :attr:`labels` attribute still returns a numpy array of dtype 'U'.
+        This array is built from the codes and is read-only: to change the labels,
+        assign a new array to :attr:`labels`.
     units: quantity units | str | None, default: None
         The units for the time
         Required if the times is a list or NumPy, not required if it is a :class:`Quantity`
@@ -143,7 +148,8 @@ class Epoch(DataObject):
         if labels is None:
             labels = np.array([], dtype="U")
         else:
-            labels = np.array(labels)
+            if not isinstance(labels, CategoricalLabels):
+                labels = np.array(labels)
             if labels.size != times.size and labels.size:
                 raise ValueError("Labels array has different length to times")
         if units is None:
@@ -205,7 +211,7 @@ class Epoch(DataObject):
             self.__class__,
             self.times,
             self.durations,
-            self.labels,
+            self._labels,
             self.units,
             self.name,
             self.file_origin,
@@ -218,7 +224,7 @@ class Epoch(DataObject):
     def __array_finalize__(self, obj):
         super().__array_finalize__(obj)
         self._durations = getattr(obj, "durations", None)
-        self._labels = getattr(obj, "labels", None)
+        self._labels = getattr(obj, "_labels", None)
         self.annotations = getattr(obj, "annotations", None)
         self.name = getattr(obj, "name", None)
         self.file_origin = getattr(obj, "file_origin", None)
@@ -268,7 +274,7 @@ class Epoch(DataObject):
         obj = self.duplicate_with_new_data(
             times=self.view(pq.Quantity).rescale(dim),
             durations=self.durations.rescale(dim),
-            labels=self.labels,
+            labels=self._labels,
             units=units,
         )
 
@@ -284,12 +290,12 @@ class Epoch(DataObject):
         obj = super().__getitem__(i)
         obj._durations = self.durations[i]
         if self._labels is not None and self._labels.size > 0:
-            obj._labels = self.labels[i]
+            obj._labels = self._labels[i]
         else:
-            obj._labels = self.labels
+            obj._labels = self._labels
         try:
             # Array annotations need to be sliced accordingly
-            obj.array_annotate(**deepcopy(self.array_annotations_at_index(i)))
+            obj._array_annotate_from(self, i)
             obj._copy_data_complement(self)
         except AttributeError:  # If Quantity was returned, not Epoch
             obj.times = obj
@@ -323,7 +329,7 @@ class Epoch(DataObject):
         otherdurations = other.durations.rescale(self.durations.units)
         times = np.hstack([self.times, othertimes]) * self.times.units
         durations = np.hstack([self.durations, otherdurations]) * self.durations.units
-        labels = np.hstack([self.labels, other.labels])
+        labels = concatenate_labels(self._labels, other._labels)
         kwargs = {}
         for name in ("name", "description", "file_origin"):
             attr_self = getattr(self, name)
@@ -395,6 +401,27 @@ class Epoch(DataObject):
 
         return new_epc
 
+    def _time_slice_windows(self, t_starts, t_stops, deep_copy=True):
+        """
+        Batched version of :meth:`time_slice`, returning one :class:`Epoch`
+        per window [t_starts[k], t_stops[k]].
+
+        The epochs of all windows are located with a single
+        :func:`np.searchsorted` pass. If `deep_copy` is False and the epoch
+        times are sorted, the slices are views on the data of this
+        :class:`Epoch`.
+        """
+        starts = t_starts.rescale(self.units).magnitude
+        stops = t_stops.rescale(self.units).magnitude
+
+        new_epcs = []
+        for indices in _window_indices(self.magnitude, starts, stops):
+            new_epc = self[indices]
+            if deep_copy:
+                new_epc = deepcopy(new_epc)
+            new_epcs.append(new_epc)
+        return new_epcs
+
     def time_shift(self, t_shift):
         """
         Shifts an :class:`Epoch` by an amount of time.
@@ -410,7 +437,9 @@ class Epoch(DataObject):
             New instance of an :class:`Epoch` object starting at t_shift later than the
             original :class:`Epoch` (the original :class:`Epoch` is not modified).
         """
-        new_epc = self.duplicate_with_new_data(times=self.times + t_shift, durations=self.durations, labels=self.labels)
+        new_epc = self.duplicate_with_new_data(
+            times=self.times + t_shift, durations=self.durations, labels=self._labels
+        )
 
         # Here we can safely copy the array annotations since we know that
         # the length of the Epoch does not change.
@@ -419,15 +448,40 @@ class Epoch(DataObject):
         return new_epc
 
     def set_labels(self, labels):
-        if self.labels is not None and self.labels.size > 0 and len(labels) != self.size:
+        if self._labels is not None and self._labels.size > 0 and len(labels) != self.size:
             raise ValueError(f"Labels array has different length to times " f"({len(labels)} != {self.size})")
-        self._labels = np.array(labels)
+        if isinstance(labels, CategoricalLabels):
+            self._labels = labels
+        else:
+            self._labels = np.array(labels)
 
     def get_labels(self):
+        if isinstance(self._labels, CategoricalLabels):
+            # writing into this array would not change the codes
+            labels = self._labels.to_array()
+            labels.flags.writeable = False
+            return labels
         return self._labels
 
     labels = property(get_labels, set_labels)
 
+    @property
+    def categorical_labels(self):
+        """
+        The labels as :class:`CategoricalLabels`.
+
+        To store the labels of this :class:`Epoch` as integer codes, use
+        `epc.labels = epc.categorical_labels`.
+        """
+        return CategoricalLabels.from_labels(self._labels)
+
+    def _new_for_deepcopy(self):
+        """
+        Create the new object that is filled in by :meth:`__deepcopy__`
+        """
+        # pass the stored labels, so that categorical labels are not turned into strings
+        return self.__class__(times=self.times, durations=self.durations, labels=self._labels, units=self.units)
+
     def set_durations(self, durations):
         if self.durations is not None and self.durations.size > 0 and len(durations) != self.size:
             raise ValueError("Durations array has different length to times " f"({len(durations)} != {self.size})")
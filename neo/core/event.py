@@ -11,7 +11,8 @@ import numpy as np
 import quantities as pq
 
 from neo.core.baseneo import merge_annotations
-from neo.core.dataobject import DataObject, ArrayDict
+from neo.core.categoricallabels import CategoricalLabels, concatenate_labels, join_labels
+from neo.core.dataobject import DataObject, ArrayDict, _window_indices
 from neo.core.epoch import Epoch
 
 
@@ -54,8 +55,12 @@ class Event(DataObject):
     ----------
     times: quantity array 1d | list
         The times of the events
-    labels: numpy.ndarray 1d dtype='U' | list
-        Names or labels for the events
+    labels: numpy.ndarray 1d dtype='U' | list | CategoricalLabels
+        Names or labels for the events. Labels given as :class:`CategoricalLabels`
+        are kept as integer codes through slicing, merging and :meth:`to_epoch`;
+        the :attr:`labels` attribute still returns a numpy array of dtype 'U'.
+        This array is built from the codes and is read-only: to change the labels,
+        assign a new array to :attr:`labels`.
     units: quantity units | None, default: None
         If times are list the units of the times
         If times is a quantity array this is ignored
@@ -114,7 +119,8 @@ class Event(DataObject):
         if labels is None:
             labels = np.array([], dtype="U")
         else:
-            labels = np.array(labels)
+            if not isinstance(labels, CategoricalLabels):
+                labels = np.array(labels)
             if labels.size != times.size and labels.size:
                 raise ValueError("Labels array has different length to times")
         if units is None:
@@ -171,7 +177,7 @@ class Event(DataObject):
         return _new_event, (
             self.__class__,
             np.array(self),
-            self.labels,
+            self._labels,
             self.units,
             self.name,
             self.file_origin,
@@ -183,7 +189,7 @@ class Event(DataObject):
 
     def __array_finalize__(self, obj):
         super().__array_finalize__(obj)
-        self._labels = getattr(obj, "labels", None)
+        self._labels = getattr(obj, "_labels", None)
         self.annotations = getattr(obj, "annotations", None)
         self.name = getattr(obj, "name", None)
         self.file_origin = getattr(obj, "file_origin", None)
@@ -243,7 +249,7 @@ class Event(DataObject):
             return self.copy()
 
         # Rescale the object into a new object
-        obj = self.duplicate_with_new_data(times=self.view(pq.Quantity).rescale(dim), labels=self.labels, units=units)
+        obj = self.duplicate_with_new_data(times=self.view(pq.Quantity).rescale(dim), labels=self._labels, units=units)
 
         # Expected behavior is deepcopy, so deepcopying array_annotations
         obj.array_annotations = deepcopy(self.array_annotations)
@@ -273,7 +279,7 @@ class Event(DataObject):
         """
         othertimes = other.times.rescale(self.times.units)
         times = np.hstack([self.times, othertimes]) * self.times.units
-        labels = np.hstack([self.labels, other.labels])
+        labels = concatenate_labels(self._labels, other._labels)
         kwargs = {}
         for name in ("name", "description", "file_origin"):
             attr_self = getattr(self, name)
@@ -283,7 +289,6 @@ class Event(DataObject):
             else:
                 kwargs[name] = f"merge({attr_self}, {attr_other})"
 
-        print("Event: merge annotations")
         merged_annotations = merge_annotations(self.annotations, other.annotations)
 
         kwargs.update(merged_annotations)
@@ -312,22 +317,47 @@ class Event(DataObject):
         else:
             obj.labels = self._labels
         try:
-            obj.array_annotate(**deepcopy(self.array_annotations_at_index(i)))
+            obj._array_annotate_from(self, i)
             obj._copy_data_complement(self)
         except AttributeError:  # If Quantity was returned, not Event
             obj.times = obj
         return obj
 
     def set_labels(self, labels):
-        if self.labels is not None and self.labels.size > 0 and len(labels) != self.size:
+        if self._labels is not None and self._labels.size > 0 and len(labels) != self.size:
             raise ValueError(f"Labels array has different length to times " f"({len(labels)} != {self.size})")
-        self._labels = np.array(labels)
+        if isinstance(labels, CategoricalLabels):
+            self._labels = labels
+        else:
+            self._labels = np.array(labels)
 
     def get_labels(self):
+        if isinstance(self._labels, CategoricalLabels):
+            # writing into this array would not change the codes
+            labels = self._labels.to_array()
+            labels.flags.writeable = False
+            return labels
         return self._labels
 
     labels = property(get_labels, set_labels)
 
+    @property
+    def categorical_labels(self):
+        """
+        The labels as :class:`CategoricalLabels`.
+
+        To store the labels of this :class:`Event` as integer codes, use
+        `evt.labels = evt.categorical_labels`.
+        """
+        return CategoricalLabels.from_labels(self._labels)
+
+    def _new_for_deepcopy(self):
+        """
+        Create the new object that is filled in by :meth:`__deepcopy__`
+        """
+        # pass the stored labels, so that categorical labels are not turned into strings
+        return self.__class__(times=self.times, labels=self._labels, units=self.units)
+
     def duplicate_with_new_data(self, times, labels, units=None):
         """
         Create a new :class:`Event` with the same metadata
@@ -378,6 +408,26 @@ class Event(DataObject):
 
         return new_evt
 
+    def _time_slice_windows(self, t_starts, t_stops, deep_copy=True):
+        """
+        Batched version of :meth:`time_slice`, returning one `Event` per
+        window [t_starts[k], t_stops[k]].
+
+        The events of all windows are located with a single
+        :func:`np.searchsorted` pass. If `deep_copy` is False and the event
+        times are sorted, the slices are views on the times of this `Event`.
+        """
+        starts = t_starts.rescale(self.units).magnitude
+        stops = t_stops.rescale(self.units).magnitude
+
+        new_evts = []
+        for indices in _window_indices(self.magnitude, starts, stops):
+            new_evt = self[indices]
+            if deep_copy:
+                new_evt = deepcopy(new_evt)
+            new_evts.append(new_evt)
+        return new_evts
+
     def time_shift(self, t_shift):
         """
         Shifts an :class:`Event` by an amount of time.
@@ -393,7 +443,7 @@ class Event(DataObject):
             New instance of an :class:`Event` object starting at t_shift later than the
             original :class:`Event` (the original :class:`Event` is not modified).
         """
-        new_evt = self.duplicate_with_new_data(times=self.times + t_shift, labels=self.labels)
+        new_evt = self.duplicate_with_new_data(times=self.times + t_shift, labels=self._labels)
 
         # Here we can safely copy the array annotations since we know that
         # the length of the Event does not change.
@@ -426,6 +476,7 @@ class Event(DataObject):
         labels of the events that indicate the epoch start
         If `durations` is not given, then the event labels A and B bounding
         the epoch are used to set the labels of the epochs in the form 'A-B'.
+        Categorical labels give categorical epoch labels.
         """
 
         if pairwise:
@@ -436,14 +487,14 @@ class Event(DataObject):
                 raise ValueError("Pairwise conversion of events to epochs" " requires an even number of events")
             times = self.times[::2]
             durations = self.times[1::2] - times
-            labels = np.array([f"{a}-{b}" for a, b in zip(self.labels[::2], self.labels[1::2])])
+            labels = join_labels(self._labels[::2], self._labels[1::2])
         elif durations is None:
             # Mode 1
             times = self.times[:-1]
             durations = np.diff(self.times)
-            labels = np.array([f"{a}-{b}" for a, b in zip(self.labels[:-1], self.labels[1:])])
+            labels = join_labels(self._labels[:-1], self._labels[1:])
         else:
             # Mode 3
             times = self.times
-            labels = self.labels
+            labels = self._labels
         return Epoch(times=times, durations=durations, labels=labels)
@@ -21,9 +21,23 @@ The provided classes allow users to select filter conditions and use them with
 """
 
 from abc import ABC, abstractmethod
-from numbers import Number
+from numbers import Number, Real
 from typing import Union, Any
 
+import numpy as np
+
+
+def _is_vectorizable(compare: np.ndarray, control: Any) -> bool:
+    """
+    Check whether comparing all values of `compare` with `control` using NumPy
+    gives the same results as comparing them one by one in Python.
+    """
+    if compare.dtype.kind in "biuf":
+        return isinstance(control, Real) and not isinstance(control, np.ndarray)
+    if compare.dtype.kind == "U":
+        return isinstance(control, str)
+    return False
+
 
 class FilterCondition(ABC):
     """
@@ -68,6 +82,26 @@ class FilterCondition(ABC):
         This method should be implemented in subclasses.
         """
 
+    def evaluate_array(self, compare: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the filter condition for each value of an array.
+
+        Parameters:
+        -----------
+        compare: np.ndarray
+        1D array of values to be compared with the control value.
+
+        Returns
+        -------
+        np.ndarray: boolean array, True where the condition is satisfied.
+
+        Notes
+        -----
+        This implementation calls :meth:`evaluate` for each value. Subclasses
+        override it with vectorized NumPy operations where these give the same result.
+        """
+        return np.fromiter((bool(self.evaluate(value)) for value in compare), dtype=bool, count=len(compare))
+
 
 class Equals(FilterCondition):
     """
@@ -80,6 +114,11 @@ class Equals(FilterCondition):
     def evaluate(self, compare: Any) -> bool:
         return compare == self.control
 
+    def evaluate_array(self, compare: np.ndarray) -> np.ndarray:
+        if _is_vectorizable(compare, self.control):
+            return compare == self.control
+        return super().evaluate_array(compare)
+
 
 class IsNot(FilterCondition):
     """
@@ -92,6 +131,11 @@ class IsNot(FilterCondition):
     def evaluate(self, compare: Any) -> bool:
         return compare != self.control
 
+    def evaluate_array(self, compare: np.ndarray) -> np.ndarray:
+        if _is_vectorizable(compare, self.control):
+            return compare != self.control
+        return super().evaluate_array(compare)
+
 
 class LessThanOrEquals(FilterCondition):
     """
@@ -104,6 +148,11 @@ class LessThanOrEquals(FilterCondition):
     def evaluate(self, compare: Number) -> bool:
         return compare <= self.control
 
+    def evaluate_array(self, compare: np.ndarray) -> np.ndarray:
+        if _is_vectorizable(compare, self.control):
+            return compare <= self.control
+        return super().evaluate_array(compare)
+
 
 class GreaterThanOrEquals(FilterCondition):
     """
@@ -116,6 +165,11 @@ class GreaterThanOrEquals(FilterCondition):
     def evaluate(self, compare: Number) -> bool:
         return compare >= self.control
 
+    def evaluate_array(self, compare: np.ndarray) -> np.ndarray:
+        if _is_vectorizable(compare, self.control):
+            return compare >= self.control
+        return super().evaluate_array(compare)
+
 
 class LessThan(FilterCondition):
     """
@@ -128,6 +182,11 @@ class LessThan(FilterCondition):
     def evaluate(self, compare: Number) -> bool:
         return compare < self.control
 
+    def evaluate_array(self, compare: np.ndarray) -> np.ndarray:
+        if _is_vectorizable(compare, self.control):
+            return compare < self.control
+        return super().evaluate_array(compare)
+
 
 class GreaterThan(FilterCondition):
     """
@@ -140,6 +199,11 @@ class GreaterThan(FilterCondition):
     def evaluate(self, compare: Number) -> bool:
         return compare > self.control
 
+    def evaluate_array(self, compare: np.ndarray) -> np.ndarray:
+        if _is_vectorizable(compare, self.control):
+            return compare > self.control
+        return super().evaluate_array(compare)
+
 
 class IsIn(FilterCondition):
     """
@@ -157,6 +221,14 @@ class IsIn(FilterCondition):
 
         raise SyntaxError("parameter not of type list, tuple, set or int")
 
+    def evaluate_array(self, compare: np.ndarray) -> np.ndarray:
+        if isinstance(self.control, (list, tuple, set)):
+            if all(_is_vectorizable(compare, control) for control in self.control):
+                return np.isin(compare, list(self.control))
+        elif isinstance(self.control, int) and _is_vectorizable(compare, self.control):
+            return compare == self.control
+        return super().evaluate_array(compare)
+
 
 class InRange(FilterCondition):
     """
@@ -203,3 +275,16 @@ class InRange(FilterCondition):
         if self.left_closed and not self.right_closed:
             return self.lower_bound < compare <= self.upper_bound
         return self.lower_bound < compare < self.upper_bound
+
+    def evaluate_array(self, compare: np.ndarray) -> np.ndarray:
+        if not (_is_vectorizable(compare, self.lower_bound) and _is_vectorizable(compare, self.upper_bound)):
+            return super().evaluate_array(compare)
+        if self.left_closed:
+            lower = compare > self.lower_bound
+        else:
+            lower = compare >= self.lower_bound
+        if self.right_closed:
+            upper = compare < self.upper_bound
+        else:
+            upper = compare <= self.upper_bound
+        return lower & upper
@@ -183,34 +183,58 @@ class ImageSequence(BaseSignal):
         of interest to get the list of pixels to average.
         Return a list of :class:`AnalogSignal` for each regionofinterest
         """
-
-        if len(region) == 0:
-            raise ValueError("no regions of interest have been given")
-
-        region_pixel = []
-        for i, b in enumerate(region):
-            r = region[i].pixels_in_region()
-            if not r:
-                raise ValueError("region " + str(i) + "is empty")
-            else:
-                region_pixel.append(r)
+        signal = self.signal_from_regions(*region)
         analogsignal_list = []
-        for i in region_pixel:
-            data = []
-            for frame in range(len(self)):
-                picture_data = []
-                for v in i:
-                    picture_data.append(self.view(pq.Quantity)[frame][v[0]][v[1]])
-                average = picture_data[0]
-                for b in range(1, len(picture_data)):
-                    average += picture_data[b]
-                data.append((average * 1.0) / len(i))
+        for i in range(signal.shape[1]):
             analogsignal_list.append(
-                AnalogSignal(data, units=self.units, t_start=self.t_start, sampling_rate=self.sampling_rate)
+                AnalogSignal(
+                    signal.magnitude[:, i : i + 1],
+                    units=self.units,
+                    t_start=self.t_start,
+                    sampling_rate=self.sampling_rate,
+                )
             )
 
         return analogsignal_list
 
+    def signal_from_regions(self, *region, chunk_size=1024):
+        """
+        Method that takes 1 or multiple regionofinterest and averages, in every frame,
+        the pixels of each region of interest.
+        Return a single :class:`AnalogSignal` with one channel per regionofinterest
+
+        The pixels of all regions are gathered at once for chunks of `chunk_size` frames
+        and summed per region, so memory stays bounded for long (e.g. memmap backed) sequences.
+        """
+
+        if len(region) == 0:
+            raise ValueError("no regions of interest have been given")
+
+        rows, columns, counts = [], [], []
+        for i, roi in enumerate(region):
+            pixels = roi.pixel_coordinates()
+            if pixels.shape[0] == 0:
+                raise ValueError("region " + str(i) + "is empty")
+            rows.append(pixels[:, 0])
+            columns.append(pixels[:, 1])
+            counts.append(pixels.shape[0])
+        rows = np.concatenate(rows)
+        columns = np.concatenate(columns)
+        counts = np.array(counts)
+        # start of each region in the gathered pixels
+        offsets = np.cumsum(counts) - counts
+
+        image_data = self.magnitude
+        dtype = np.result_type(image_data.dtype, 1.0)
+        data = np.zeros((image_data.shape[0], len(region)), dtype=dtype)
+        for start in range(0, image_data.shape[0], chunk_size):
+            stop = min(start + chunk_size, image_data.shape[0])
+            pixel_values = image_data[start:stop, rows, columns].astype(dtype, copy=False)
+            data[start:stop] = np.add.reduceat(pixel_values, offsets, axis=1)
+        data /= counts
+
+        return AnalogSignal(data, units=self.units, t_start=self.t_start, sampling_rate=self.sampling_rate)
+
     def _repr_pretty_(self, pp, cycle):
         """
         Handle pretty-printing the :class:`ImageSequence`.
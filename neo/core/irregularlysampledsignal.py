@@ -28,7 +28,7 @@ import quantities as pq
 from neo.core.baseneo import MergeError, merge_annotations, intersect_annotations
 from neo.core.basesignal import BaseSignal
 from neo.core.analogsignal import AnalogSignal
-from neo.core.dataobject import DataObject
+from neo.core.dataobject import DataObject, _window_indices
 
 
 def _new_IrregularlySampledSignal(
@@ -536,6 +536,30 @@ class IrregularlySampledSignal(BaseSignal):
 
         return new_st
 
+    def _time_slice_windows(self, t_starts, t_stops, deep_copy=True):
+        """
+        Batched version of :meth:`time_slice`, returning one
+        :class:`IrregularlySampledSignal` per window [t_starts[k], t_stops[k]].
+
+        For sorted sample times, the samples of all windows are located with
+        a single :func:`np.searchsorted` pass and, if `deep_copy` is False,
+        the slices are views on the data of this signal. Other cases are
+        handled by :meth:`time_slice`.
+        """
+        starts = t_starts.rescale(self.times.units).magnitude
+        stops = t_stops.rescale(self.times.units).magnitude
+
+        new_sigs = []
+        for k, indices in enumerate(_window_indices(self.times.magnitude, starts, stops)):
+            if isinstance(indices, slice) and indices.stop > indices.start:
+                new_sig = self[indices]
+                if deep_copy:
+                    new_sig = deepcopy(new_sig)
+            else:
+                new_sig = self.time_slice(t_starts[k], t_stops[k])
+            new_sigs.append(new_sig)
+        return new_sigs
+
     def time_shift(self, t_shift):
         """
         Shifts a :class:`IrregularlySampledSignal` to start at a new time.
@@ -1,5 +1,7 @@
 from math import floor, ceil
 
+import numpy as np
+
 from neo.core.baseneo import BaseNeo
 from neo.core.imagesequence import ImageSequence
 
@@ -39,6 +41,31 @@ class RegionOfInterest(BaseNeo):
         """
         return self.image_sequence.signal_from_region(self)
 
+    def pixel_coordinates(self):
+        """
+        Return the pixels within the region as an integer array of shape (n_pixels, 2),
+        in the same order and with the same coordinates as :meth:`pixels_in_region`.
+        """
+        return np.asarray(self.pixels_in_region(), dtype=int).reshape(-1, 2)
+
+    def mask(self, shape=None):
+        """
+        Return a boolean mask which is True for the pixels within the region.
+
+        The pixel coordinates index the mask like they index the frames of the
+        image sequence in :meth:`ImageSequence.signal_from_region`, i.e.
+        ``mask[pixel[0], pixel[1]]``. Pixels outside of `shape` are ignored.
+        `shape` defaults to the shape of the frames of the image sequence.
+        """
+        if shape is None:
+            shape = self.image_sequence.shape[1:]
+        pixels = self.pixel_coordinates()
+        in_bounds = np.all((pixels >= 0) & (pixels < np.asarray(shape)), axis=1)
+        pixels = pixels[in_bounds]
+        mask = np.zeros(shape, dtype=bool)
+        mask[pixels[:, 0], pixels[:, 1]] = True
+        return mask
+
 
 class CircularRegionOfInterest(RegionOfInterest):
     """Representation of a circular ROI
@@ -77,15 +104,20 @@ class CircularRegionOfInterest(RegionOfInterest):
         else:
             return False
 
+    def pixel_coordinates(self):
+        """Returns an array of the pixels whose *centres* are within the circle"""
+        x, y = _pixel_grid(
+            int(floor(self.x - self.radius)),
+            int(ceil(self.x + self.radius)),
+            int(floor(self.y - self.radius)),
+            int(ceil(self.y + self.radius)),
+        )
+        inside = (x - self.x) * (x - self.x) + (y - self.y) * (y - self.y) <= self.radius * self.radius
+        return np.stack([x[inside], y[inside]], axis=1)
+
     def pixels_in_region(self):
         """Returns a list of pixels whose *centres* are within the circle"""
-        pixel_in_list = []
-        for y in range(int(floor(self.y - self.radius)), int(ceil(self.y + self.radius))):
-            for x in range(int(floor(self.x - self.radius)), int(ceil(self.x + self.radius))):
-                if self.is_inside(x, y):
-                    pixel_in_list.append([x, y])
-
-        return pixel_in_list
+        return self.pixel_coordinates().tolist()
 
 
 class RectangularRegionOfInterest(RegionOfInterest):
@@ -131,16 +163,22 @@ class RectangularRegionOfInterest(RegionOfInterest):
         else:
             return False
 
-    def pixels_in_region(self):
-        """Returns a list of pixels whose *centres* are within the rectangle"""
-        pixel_list = []
+    def pixel_coordinates(self):
+        """Returns an array of the pixels whose *centres* are within the rectangle"""
         h = self.height
         w = self.width
-        for y in range(int(floor(self.y - h / 2.0)), int(ceil(self.y + h / 2.0))):
-            for x in range(int(floor(self.x - w / 2.0)), int(ceil(self.x + w / 2.0))):
-                if self.is_inside(x, y):
-                    pixel_list.append([x, y])
-        return pixel_list
+        x, y = _pixel_grid(
+            int(floor(self.x - w / 2.0)),
+            int(ceil(self.x + w / 2.0)),
+            int(floor(self.y - h / 2.0)),
+            int(ceil(self.y + h / 2.0)),
+        )
+        inside = (self.x - w / 2.0 <= x) & (x < self.x + w / 2.0) & (self.y - h / 2.0 <= y) & (y < self.y + h / 2.0)
+        return np.stack([x[inside], y[inside]], axis=1)
+
+    def pixels_in_region(self):
+        """Returns a list of pixels whose *centres* are within the rectangle"""
+        return self.pixel_coordinates().tolist()
 
 
 class PolygonRegionOfInterest(RegionOfInterest):
@@ -171,62 +209,68 @@ class PolygonRegionOfInterest(RegionOfInterest):
         self.vertices = vertices
 
     def polygon_ray_casting(self, bounding_points, bounding_box_positions):
-
-        # from https://stackoverflow.com/questions/217578/how-can-i-determine-whether-a-2d-point-is-within-a-polygon
-        # user  Noresourses
-
-        # Arrays containing the x- and y-coordinates of the polygon's vertices.
-        vertx = [point[0] for point in bounding_points]
-        verty = [point[1] for point in bounding_points]
-        # Number of vertices in the polygon
-        nvert = len(bounding_points)
-        # Points that are inside
-        points_inside = []
-
-        # For every candidate position within the bounding box
-        for idx, pos in enumerate(bounding_box_positions):
-            testx, testy = (pos[0], pos[1])
-            c = 0
-            for i in range(0, nvert):
-                j = i - 1 if i != 0 else nvert - 1
-                if ((verty[i] * 1.0 > testy * 1.0) != (verty[j] * 1.0 > testy * 1.0)) and (
-                    testx * 1.0
-                    < (vertx[j] * 1.0 - vertx[i] * 1.0)
-                    * (testy * 1.0 - verty[i] * 1.0)
-                    / (verty[j] * 1.0 - verty[i] * 1.0)
-                    + vertx[i] * 1.0
-                ):
-                    c += 1
-            # If odd, that means that we are inside the polygon
-            if c % 2 == 1:
-                points_inside.append(pos)
-
+        """
+        Return the positions of `bounding_box_positions` which are inside
+        the polygon with vertices `bounding_points`.
+        """
+        positions = np.asarray(bounding_box_positions, dtype=float).reshape(-1, 2)
+        inside = points_in_polygon(bounding_points, positions[:, 0], positions[:, 1])
+        points_inside = [pos for pos, is_inside in zip(bounding_box_positions, inside) if is_inside]
         return points_inside
 
-    def pixels_in_region(self):
+    def pixel_coordinates(self):
+        """Returns an array of the pixels whose *centres* are within the polygon"""
+        vertices = np.asarray(self.vertices, dtype=float)
+        min_x, min_y = vertices.min(axis=0)
+        max_x, max_y = vertices.max(axis=0)
+        x, y = _pixel_grid(int(floor(min_x)), int(ceil(max_x)), int(floor(min_y)), int(ceil(max_y)))
+        inside = points_in_polygon(self.vertices, x, y)
+        return np.stack([x[inside], y[inside]], axis=1)
 
-        min_x, max_x, min_y, max_y = (
-            self.vertices[0][0],
-            self.vertices[0][0],
-            self.vertices[0][1],
-            self.vertices[0][1],
-        )
+    def pixels_in_region(self):
+        return [tuple(pixel) for pixel in self.pixel_coordinates().tolist()]
 
-        for i in self.vertices:
-            if i[0] < min_x:
-                min_x = i[0]
-            if i[0] > max_x:
-                max_x = i[0]
-            if i[1] < min_y:
-                min_y = i[1]
-            if i[1] > max_y:
-                max_y = i[1]
 
-        list_coord = []
-        for y in range(int(floor(min_y)), int(ceil(max_y))):
-            for x in range(int(floor(min_x)), int(ceil(max_x))):
-                list_coord.append((x, y))
+def _pixel_grid(x_start, x_stop, y_start, y_stop):
+    # x and y coordinates of all pixels of a bounding box, y in the outer loop (row-major)
+    y, x = np.meshgrid(np.arange(y_start, y_stop), np.arange(x_start, x_stop), indexing="ij")
+    return x.ravel(), y.ravel()
 
-        pixel_list = self.polygon_ray_casting(self.vertices, list_coord)
 
-        return pixel_list
+def points_in_polygon(vertices, x, y):
+    """
+    Even-odd ray casting test of many points against a polygon.
+
+    Parameters
+    ----------
+    vertices: sequence of (x, y)
+        The vertices of the polygon
+    x, y: np.array
+        The coordinates of the points to test
+
+    Returns
+    -------
+    inside: np.array of bool
+        True for the points which are inside the polygon
+
+    Notes
+    -----
+    Adapted from https://stackoverflow.com/questions/217578/how-can-i-determine-whether-a-2d-point-is-within-a-polygon
+    The loop is over the edges of the polygon, each edge being tested against all the points at once.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    vertices = np.asarray(vertices, dtype=float).reshape(-1, 2)
+    inside = np.zeros(x.shape, dtype=bool)
+    nvert = vertices.shape[0]
+    for i in range(nvert):
+        j = i - 1 if i != 0 else nvert - 1
+        vertx_i, verty_i = vertices[i]
+        vertx_j, verty_j = vertices[j]
+        if verty_i == verty_j:
+            # horizontal edge, never crossed by a horizontal ray
+            continue
+        crossing = (verty_i > y) != (verty_j > y)
+        crossing &= x < (vertx_j - vertx_i) * (y - verty_i) / (verty_j - verty_i) + vertx_i
+        inside ^= crossing
+    return inside
@@ -9,6 +9,8 @@ from :module:`neo.core.container`.
 from datetime import datetime
 from copy import deepcopy
 
+import numpy as np
+import quantities as pq
 
 from neo.core.analogsignal import AnalogSignal
 from neo.core.container import Container
@@ -17,10 +19,36 @@ from neo.core.epoch import Epoch
 from neo.core.event import Event
 from neo.core.imagesequence import ImageSequence
 from neo.core.irregularlysampledsignal import IrregularlySampledSignal
+from neo.core.spiketrain import SpikeTrain, _normalize_time_bound
 from neo.core.spiketrainlist import SpikeTrainList
 from neo.core.view import ChannelView
 
 
+def _reset_sliced_time(sliced, t_shift, in_place=True):
+    """
+    Shift the times of an object returned by a time slice by `t_shift`.
+
+    Signals get new sample times without copying their data. The times of spike trains,
+    events and epochs are shifted in place if `in_place` is True, so `sliced` must not share
+    them with another object. Otherwise a shifted copy is returned, as by `time_shift`.
+    """
+    if isinstance(sliced, AnalogSignal):
+        sliced.t_start = sliced.t_start + t_shift
+        return sliced
+    if isinstance(sliced, IrregularlySampledSignal):
+        sliced.times = sliced.times + t_shift
+        return sliced
+    times = sliced.magnitude
+    shift = t_shift.rescale(sliced.units).magnitude
+    if not (in_place and times.flags.writeable and np.can_cast(shift.dtype, times.dtype, "same_kind")):
+        return sliced.time_shift(t_shift)
+    times += shift
+    if isinstance(sliced, SpikeTrain):
+        sliced.t_start = _normalize_time_bound(sliced.t_start + t_shift, sliced.dimensionality, sliced.dtype)
+        sliced.t_stop = _normalize_time_bound(sliced.t_stop + t_shift, sliced.dimensionality, sliced.dtype)
+    return sliced
+
+
 class Segment(Container):
     """
     A container for data sharing a common time basis.
@@ -210,7 +238,7 @@ class Segment(Container):
         t_stop = max(t_stops)
         return t_stop
 
-    def time_slice(self, t_start=None, t_stop=None, reset_time=False, **kwargs):
+    def time_slice(self, t_start=None, t_stop=None, reset_time=False, deep_copy=True, **kwargs):
         """
         Creates a time slice of a Segment containing slices of all child
         objects.
@@ -225,6 +253,10 @@ class Segment(Container):
             If True the time stamps of all sliced objects are set to fall
             in the range from t_start to t_stop.
             If False, original time stamps are retained.
+        deep_copy: bool, optional, default: True
+            If True, the sliced objects are deep copies of the original
+            objects. If False, they share their data with the objects of this
+            Segment wherever possible, see :meth:`time_slices`.
         **kwargs
             Additional keyword arguments used for initialization of the sliced
             Segment object.
@@ -234,6 +266,13 @@ class Segment(Container):
         subseg: Segment
             Temporal slice of the original Segment from t_start to t_stop.
         """
+        if not deep_copy:
+            if t_start is None:
+                t_start = self.t_start
+            if t_stop is None:
+                t_stop = self.t_stop
+            return self.time_slices(t_start, t_stop, reset_time=reset_time, deep_copy=False, **kwargs)[0]
+
         subseg = Segment(**kwargs)
 
         for attr in ["file_datetime", "rec_datetime", "index", "name", "description", "file_origin"]:
@@ -255,7 +294,8 @@ class Segment(Container):
             else:
                 ana_time_slice = self.analogsignals[ana_id].time_slice(t_start, t_stop)
             if reset_time:
-                ana_time_slice = ana_time_slice.time_shift(t_shift)
+                # the slices are new objects, no need to copy them again
+                ana_time_slice = _reset_sliced_time(ana_time_slice, t_shift)
             subseg.analogsignals.append(ana_time_slice)
 
         # cut irregularly sampled signals
@@ -265,7 +305,7 @@ class Segment(Container):
             else:
                 ana_time_slice = self.irregularlysampledsignals[irr_id].time_slice(t_start, t_stop)
             if reset_time:
-                ana_time_slice = ana_time_slice.time_shift(t_shift)
+                ana_time_slice = _reset_sliced_time(ana_time_slice, t_shift)
             subseg.irregularlysampledsignals.append(ana_time_slice)
 
         # cut spiketrains
@@ -275,7 +315,7 @@ class Segment(Container):
             else:
                 st_time_slice = self.spiketrains[st_id].time_slice(t_start, t_stop)
             if reset_time:
-                st_time_slice = st_time_slice.time_shift(t_shift)
+                st_time_slice = _reset_sliced_time(st_time_slice, t_shift)
             subseg.spiketrains.append(st_time_slice)
 
         # cut events
@@ -285,7 +325,7 @@ class Segment(Container):
             else:
                 ev_time_slice = self.events[ev_id].time_slice(t_start, t_stop)
             if reset_time:
-                ev_time_slice = ev_time_slice.time_shift(t_shift)
+                ev_time_slice = _reset_sliced_time(ev_time_slice, t_shift)
             # appending only non-empty events
             if len(ev_time_slice):
                 subseg.events.append(ev_time_slice)
@@ -297,7 +337,7 @@ class Segment(Container):
             else:
                 ep_time_slice = self.epochs[ep_id].time_slice(t_start, t_stop)
             if reset_time:
-                ep_time_slice = ep_time_slice.time_shift(t_shift)
+                ep_time_slice = _reset_sliced_time(ep_time_slice, t_shift)
             # appending only non-empty epochs
             if len(ep_time_slice):
                 subseg.epochs.append(ep_time_slice)
@@ -305,3 +345,70 @@ class Segment(Container):
         subseg.check_relationships()
 
         return subseg
+
+    def time_slices(self, t_starts, t_stops, reset_time=False, deep_copy=True, **kwargs):
+        """
+        Creates one time slice of the Segment per time window.
+
+        The result is the same as calling :meth:`time_slice` once per window,
+        but the indices of all windows are computed in a single pass per child
+        object, which makes cutting a Segment into many trials much faster.
+
+        Parameters
+        ----------
+        t_starts: Quantity array
+            Starting times of the sliced time windows.
+        t_stops: Quantity array
+            Stop times of the sliced time windows. Must have the same length
+            as `t_starts`.
+        reset_time: bool, optional, default: False
+            If True the time stamps of all sliced objects are set to fall
+            in the range from t_start to t_stop of their window.
+            If False, original time stamps are retained.
+        deep_copy: bool, optional, default: True
+            If True, the sliced objects are deep copies of the original
+            objects, as for :meth:`time_slice`. If False, the sliced objects
+            share their data with the objects of this Segment wherever
+            possible, so modifying them also modifies the original data.
+        **kwargs
+            Additional keyword arguments used for initialization of the sliced
+            Segment objects.
+
+        Returns
+        -------
+        subsegs: list of Segment
+            Temporal slices of the original Segment, one per time window.
+        """
+        t_starts = pq.Quantity(t_starts).reshape(-1)
+        t_stops = pq.Quantity(t_stops).reshape(-1)
+        if len(t_starts) != len(t_stops):
+            raise ValueError(f"t_starts and t_stops have different lengths ({len(t_starts)} != {len(t_stops)})")
+
+        subsegs = []
+        for _ in range(len(t_starts)):
+            subseg = Segment(**kwargs)
+            for attr in ["file_datetime", "rec_datetime", "index", "name", "description", "file_origin"]:
+                setattr(subseg, attr, getattr(self, attr))
+            subseg.annotations = deepcopy(self.annotations)
+            subsegs.append(subseg)
+
+        for container in ("analogsignals", "irregularlysampledsignals", "spiketrains", "events", "epochs"):
+            for obj in getattr(self, container):
+                if hasattr(obj, "_rawio"):
+                    sliced_objs = [obj.load(time_slice=(t_start, t_stop)) for t_start, t_stop in zip(t_starts, t_stops)]
+                else:
+                    sliced_objs = obj._time_slice_windows(t_starts, t_stops, deep_copy=deep_copy)
+
+                for subseg, sliced, t_start in zip(subsegs, sliced_objs, t_starts):
+                    # appending only non-empty events and epochs
+                    if container in ("events", "epochs") and not len(sliced):
+                        continue
+                    if reset_time:
+                        # without deep_copy, the times may be shared with the original object
+                        sliced = _reset_sliced_time(sliced, -t_start, in_place=deep_copy)
+                    getattr(subseg, container).append(sliced)
+
+        for subseg in subsegs:
+            subseg.check_relationships()
+
+        return subsegs
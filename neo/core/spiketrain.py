@@ -23,7 +23,7 @@ import warnings
 import numpy as np
 import quantities as pq
 from neo.core.baseneo import BaseNeo, MergeError, merge_annotations
-from neo.core.dataobject import DataObject, ArrayDict
+from neo.core.dataobject import DataObject, ArrayDict, _concatenate_array_annotations, _window_indices
 
 # need this to avoid circular import issue
 import neo
@@ -97,6 +97,24 @@ def _check_time_in_range(value, t_start, t_stop, view=False) -> None:
         raise ValueError(f"The last spike ({value}) is after t_stop ({t_stop})")
 
 
+def _normalize_time_bound(value, dim, dtype):
+    """
+    Return `value` (e.g. t_start or t_stop) as a quantity scalar with
+    dimensionality `dim` and dtype `dtype`
+    """
+    # if the dtype and units match, just copy the values here instead
+    # of doing the much more expensive creation of a new Quantity
+    # using items() is orders of magnitude faster
+    if (
+        hasattr(value, "dtype")
+        and value.dtype == dtype
+        and hasattr(value, "dimensionality")
+        and value.dimensionality.items() == dim.items()
+    ):
+        return value.copy()
+    return pq.Quantity(value, units=dim, dtype=dtype)
+
+
 def _check_waveform_dimensions(spiketrain) -> None:
     """
     Verify that waveform is compliant with the waveform definition as
@@ -392,28 +410,8 @@ class SpikeTrain(DataObject):
         if len(obj.shape) > 1:
             raise ValueError("Spiketrain times array has more than 1 dimension")
 
-        # if the dtype and units match, just copy the values here instead
-        # of doing the much more expensive creation of a new Quantity
-        # using items() is orders of magnitude faster
-        if (
-            hasattr(t_start, "dtype")
-            and t_start.dtype == obj.dtype
-            and hasattr(t_start, "dimensionality")
-            and t_start.dimensionality.items() == dim.items()
-        ):
-            obj.t_start = t_start.copy()
-        else:
-            obj.t_start = pq.Quantity(t_start, units=dim, dtype=obj.dtype)
-
-        if (
-            hasattr(t_stop, "dtype")
-            and t_stop.dtype == obj.dtype
-            and hasattr(t_stop, "dimensionality")
-            and t_stop.dimensionality.items() == dim.items()
-        ):
-            obj.t_stop = t_stop.copy()
-        else:
-            obj.t_stop = pq.Quantity(t_stop, units=dim, dtype=obj.dtype)
+        obj.t_start = _normalize_time_bound(t_start, dim, obj.dtype)
+        obj.t_stop = _normalize_time_bound(t_stop, dim, obj.dtype)
 
         # Store attributes
         obj.waveforms = waveforms
@@ -465,6 +463,52 @@ class SpikeTrain(DataObject):
             **annotations,
         )
 
+    @classmethod
+    def _from_trusted(
+        cls,
+        times,
+        t_start,
+        t_stop,
+        sampling_rate=1.0 * pq.Hz,
+        waveforms=None,
+        left_sweep=None,
+        name=None,
+        file_origin=None,
+        description=None,
+        array_annotations=None,
+        **annotations,
+    ):
+        """
+        Construct a :class:`SpikeTrain` from data that is already known to be valid.
+
+        This is used internally when the spike times are derived from an existing
+        :class:`SpikeTrain`. `times` must be a 1D quantity array with time units, and
+        `t_start` and `t_stop` quantity scalars in the same units and dtype that
+        include all spikes. None of this is checked and `times` is not copied.
+        """
+        obj = times.view(cls)
+        obj.t_start = t_start
+        obj.t_stop = t_stop
+        obj.waveforms = waveforms
+        obj.left_sweep = left_sweep
+        obj.sampling_rate = sampling_rate
+        obj.segment = None
+        obj.unit = None
+        DataObject.__init__(
+            obj,
+            name=name,
+            file_origin=file_origin,
+            description=description,
+            array_annotations=array_annotations,
+            **annotations,
+        )
+        return obj
+
+    def _new_for_deepcopy(self):
+        # The constructor does not copy the spike times, so they are copied here.
+        # They are valid already, so the checks of the constructor can be skipped.
+        return SpikeTrain._from_trusted(self.times.copy(), self.t_start, self.t_stop)
+
     def _repr_pretty_(self, pp, cycle):
         waveforms = ""
         if self.waveforms is not None:
@@ -592,7 +636,7 @@ class SpikeTrain(DataObject):
         sort_indices = np.argsort(self)
         if self.waveforms is not None and self.waveforms.any():
             self.waveforms = self.waveforms[sort_indices]
-        self.array_annotate(**deepcopy(self.array_annotations_at_index(sort_indices)))
+        self._array_annotate_from(self, sort_indices)
 
         # now sort the times
         # We have sorted twice, but `self = self[sort_indices]` introduces
@@ -700,7 +744,7 @@ class SpikeTrain(DataObject):
         if hasattr(obj, "waveforms") and obj.waveforms is not None:
             obj.waveforms = obj.waveforms.__getitem__(i)
         try:
-            obj.array_annotate(**deepcopy(self.array_annotations_at_index(i)))
+            obj._array_annotate_from(self, i)
         except AttributeError:  # If Quantity was returned, not SpikeTrain
             pass
         return obj
@@ -768,12 +812,17 @@ class SpikeTrain(DataObject):
         _check_waveform_dimensions(new_st)
         return new_st
 
-    def time_slice(self, t_start, t_stop):
+    def time_slice(self, t_start, t_stop, deep_copy=True):
         """
         Creates a new :class:`SpikeTrain` corresponding to the time slice of
         the original :class:`SpikeTrain` between (and including) times
         :attr:`t_start` and :attr:`t_stop`. Either parameter can also be None
         to use infinite endpoints for the time interval.
+
+        If the spike times are sorted, the spikes in the interval are located
+        with :func:`np.searchsorted`. In that case, if `deep_copy` is False, the
+        result is a view sharing the times, waveforms and array annotations of
+        this :class:`SpikeTrain`.
         """
         _t_start = t_start
         _t_stop = t_stop
@@ -787,18 +836,60 @@ class SpikeTrain(DataObject):
             # a zero-duration spike train set at self.t_stop or self.t_start
             raise ValueError("A time slice completely outside the " "boundaries of the spike train is not defined.")
 
-        indices = (self >= _t_start) & (self <= _t_stop)
+        start = _t_start.rescale(self.units).magnitude if isinstance(_t_start, pq.Quantity) else _t_start
+        stop = _t_stop.rescale(self.units).magnitude if isinstance(_t_stop, pq.Quantity) else _t_stop
+        times = self.magnitude
+        if times.size < 2 or np.all(times[1:] >= times[:-1]):
+            indices = slice(
+                int(np.searchsorted(times, start, side="left")), int(np.searchsorted(times, stop, side="right"))
+            )
+        else:
+            indices = (times >= start) & (times <= stop)
 
-        # Time slicing should create a deep copy of the object
-        new_st = deepcopy(self[indices])
+        # Time slicing should create a deep copy of the object, unless a view is requested
+        # Note: the waveforms are sliced along with the times
+        new_st = self[indices]
+        if deep_copy:
+            new_st = deepcopy(new_st)
 
         new_st.t_start = max(_t_start, self.t_start)
         new_st.t_stop = min(_t_stop, self.t_stop)
-        if self.waveforms is not None:
-            new_st.waveforms = self.waveforms[indices]
 
         return new_st
 
+    def _time_slice_windows(self, t_starts, t_stops, deep_copy=True):
+        """
+        Batched version of :meth:`time_slice`, returning one
+        :class:`SpikeTrain` per window [t_starts[k], t_stops[k]].
+
+        The spikes of all windows are located with a single
+        :func:`np.searchsorted` pass. If `deep_copy` is False and the spike
+        times are sorted, the slices are views on the data (and waveforms)
+        of this :class:`SpikeTrain`.
+        """
+        starts = t_starts.rescale(self.units).magnitude
+        stops = t_stops.rescale(self.units).magnitude
+        t_start = self.t_start.rescale(self.units).magnitude
+        t_stop = self.t_stop.rescale(self.units).magnitude
+
+        if np.any(starts > t_stop) or np.any(stops < t_start):
+            raise ValueError("A time slice completely outside the " "boundaries of the spike train is not defined.")
+
+        new_t_starts = np.maximum(starts, t_start)
+        new_t_stops = np.minimum(stops, t_stop)
+
+        new_sts = []
+        for indices, new_t_start, new_t_stop in zip(
+            _window_indices(self.magnitude, starts, stops), new_t_starts, new_t_stops
+        ):
+            new_st = self[indices]
+            if deep_copy:
+                new_st = deepcopy(new_st)
+            new_st.t_start = new_t_start * self.units
+            new_st.t_stop = new_t_stop * self.units
+            new_sts.append(new_st)
+        return new_sts
+
     def time_shift(self, t_shift):
         """
         Shifts a :class:`SpikeTrain` to start at a new time.
@@ -814,16 +905,14 @@ class SpikeTrain(DataObject):
             New instance of a :class:`SpikeTrain` object starting at t_shift later than the
             original :class:`SpikeTrain` (the original :class:`SpikeTrain` is not modified).
         """
-        # We need new to make a new SpikeTrain
-        times = self.times.copy() + t_shift
-        t_stop = self.t_stop + t_shift
-        t_start = self.t_start + t_shift
-        new_st = SpikeTrain(
-            times=times,
-            t_stop=t_stop,
-            units=self.unit,
+        # Shifting the times and both bounds by the same amount keeps all spikes
+        # within the bounds, so the new SpikeTrain does not need to be checked again
+        times = self.times + t_shift
+        new_st = SpikeTrain._from_trusted(
+            times,
+            t_start=_normalize_time_bound(self.t_start + t_shift, times.dimensionality, times.dtype),
+            t_stop=_normalize_time_bound(self.t_stop + t_shift, times.dimensionality, times.dtype),
             sampling_rate=self.sampling_rate,
-            t_start=t_start,
             waveforms=self.waveforms,
             left_sweep=self.left_sweep,
             name=self.name,
@@ -833,10 +922,6 @@ class SpikeTrain(DataObject):
             **self.annotations,
         )
 
-        # Here we can safely copy the array annotations since we know that
-        # the length of the SpikeTrain does not change.
-        new_st.array_annotate(**self.array_annotations)
-
         return new_st
 
     def merge(self, *others):
@@ -849,8 +934,10 @@ class SpikeTrain(DataObject):
         If the attributes of the :class:`SpikeTrain` objects are not
         compatible, an Exception is raised.
         """
+        from neo.io.proxyobjects import SpikeTrainProxy
+
         for other in others:
-            if isinstance(other, neo.io.proxyobjects.SpikeTrainProxy):
+            if isinstance(other, SpikeTrainProxy):
                 raise MergeError(
                     "Cannot merge, SpikeTrainProxy objects cannot be merged"
                     "into regular SpikeTrain objects, please load them first."
@@ -875,7 +962,12 @@ class SpikeTrain(DataObject):
         if any(wfs) and not all(wfs):
             raise MergeError("Cannot merge signal with waveform and signal " "without waveform.")
         stack = np.concatenate([np.asarray(st) for st in all_spiketrains])
-        sorting = np.argsort(stack)
+        # A stable sort is linear on the already sorted runs of the individual trains,
+        # and no reordering is needed at all when the trains do not overlap
+        if np.all(stack[1:] >= stack[:-1]):
+            sorting = slice(None)
+        else:
+            sorting = np.argsort(stack, kind="stable")
         sorted_stack = stack[sorting]
 
         kwargs = {}
@@ -968,22 +1060,14 @@ class SpikeTrain(DataObject):
 
         omitted_keys_self = []
 
-        keys = self.array_annotations.keys()
-        for key in keys:
-            try:
-                self_ann = deepcopy(self.array_annotations[key])
-                other_ann = np.concatenate([deepcopy(other.array_annotations[key]) for other in others])
-                if isinstance(self_ann, pq.Quantity):
-                    other_ann.rescale(self_ann.units)
-                    arr_ann = np.concatenate([self_ann, other_ann]) * self_ann.units
-                else:
-                    arr_ann = np.concatenate([self_ann, other_ann])
-                merged_array_annotations[key] = arr_ann[sorting]
-            # Annotation only available in 'self', must be skipped
-            # Ignore annotations present only in one of the SpikeTrains
-            except KeyError:
+        # Each column is concatenated and reordered once, both steps produce new arrays
+        for key in self.array_annotations:
+            if not all(key in other.array_annotations for other in others):
+                # Ignore annotations present only in some of the SpikeTrains
                 omitted_keys_self.append(key)
                 continue
+            columns = [self.array_annotations[key]] + [other.array_annotations[key] for other in others]
+            merged_array_annotations[key] = _concatenate_array_annotations(columns)[sorting]
 
         omitted_keys_other = [
             key
@@ -5,12 +5,14 @@ electrophysiological data files.
 Note that if the package dependency is not satisfied for one io, it does not
 raise an error but a warning.
 
-:attr:`neo.io.iolist` provides a list of successfully imported io classes.
+:attr:`neo.io.iolist` provides a list of all io classes. Io classes are imported
+lazily, on first access, so that importing :mod:`neo.io` stays cheap.
 
 Functions:
 
 .. autofunction:: neo.io.get_io
 .. autofunction:: neo.io.list_candidate_ios
+.. autofunction:: neo.io.detect_io
 
 
 Classes:
@@ -280,6 +282,7 @@ Classes:
 
 import pathlib
 from collections import Counter
+import importlib
 import importlib.util
 
 # check if neuroshare library exists
@@ -288,135 +291,159 @@ import importlib.util
 
 neuroshare_spec = importlib.util.find_spec("neuroshare")
 if neuroshare_spec is not None:
-    from neo.io.neuroshareapiio import NeuroshareapiIO as NeuroshareIO
+    _neuroshare_io = ("neuroshareapiio", "NeuroshareapiIO")
 else:
-    from neo.io.neurosharectypesio import NeurosharectypesIO as NeuroshareIO
-
-from neo.io.alphaomegaio import AlphaOmegaIO
-from neo.io.asciiimageio import AsciiImageIO
-from neo.io.asciisignalio import AsciiSignalIO
-from neo.io.asciispiketrainio import AsciiSpikeTrainIO
-from neo.io.axographio import AxographIO
-from neo.io.axonaio import AxonaIO
-from neo.io.axonio import AxonIO
-from neo.io.biocamio import BiocamIO
-from neo.io.blackrockio import BlackrockIO
-from neo.io.blkio import BlkIO
-from neo.io.bci2000io import BCI2000IO
-from neo.io.brainvisionio import BrainVisionIO
-from neo.io.brainwaredamio import BrainwareDamIO
-from neo.io.brainwaref32io import BrainwareF32IO
-from neo.io.brainwaresrcio import BrainwareSrcIO
-from neo.io.cedio import CedIO
-from neo.io.edfio import EDFIO
-from neo.io.elanio import ElanIO
-from neo.io.elphyio import ElphyIO
-from neo.io.exampleio import ExampleIO
-from neo.io.igorproio import IgorIO
-from neo.io.intanio import IntanIO
-from neo.io.klustakwikio import KlustaKwikIO
-from neo.io.kwikio import KwikIO
-from neo.io.mearecio import MEArecIO
-from neo.io.maxwellio import MaxwellIO
-from neo.io.medio import MedIO
-from neo.io.micromedio import MicromedIO
-from neo.io.neomatlabio import NeoMatlabIO
-from neo.io.nestio import NestIO
-from neo.io.neuralynxio import NeuralynxIO
-from neo.io.neuroexplorerio import NeuroExplorerIO
-from neo.io.neuronexusio import NeuroNexusIO
-from neo.io.neuroscopeio import NeuroScopeIO
-from neo.io.nixio import NixIO
-from neo.io.nixio_fr import NixIO as NixIOFr
-from neo.io.nwbio import NWBIO
-from neo.io.openephysio import OpenEphysIO
-from neo.io.openephysbinaryio import OpenEphysBinaryIO
-from neo.io.phyio import PhyIO
-from neo.io.pickleio import PickleIO
-from neo.io.plexonio import PlexonIO
-from neo.io.plexon2io import Plexon2IO
-from neo.io.rawbinarysignalio import RawBinarySignalIO
-from neo.io.rawmcsio import RawMCSIO
-from neo.io.spike2io import Spike2IO
-from neo.io.spikegadgetsio import SpikeGadgetsIO
-from neo.io.spikeglxio import SpikeGLXIO
-from neo.io.stimfitio import StimfitIO
-from neo.io.tdtio import TdtIO
-from neo.io.tiffio import TiffIO
-from neo.io.winedrio import WinEdrIO
-from neo.io.winwcpio import WinWcpIO
-
-iolist = [
-    AlphaOmegaIO,
-    AsciiImageIO,
-    AsciiSignalIO,
-    AsciiSpikeTrainIO,
-    AxographIO,
-    AxonaIO,
-    AxonIO,
-    BCI2000IO,
-    BiocamIO,
-    BlackrockIO,
-    BlkIO,
-    BrainVisionIO,
-    BrainwareDamIO,
-    BrainwareF32IO,
-    BrainwareSrcIO,
-    CedIO,
-    EDFIO,
-    ElanIO,
-    ElphyIO,
-    ExampleIO,
-    IgorIO,
-    IntanIO,
-    KlustaKwikIO,
-    KwikIO,
-    MEArecIO,
-    MaxwellIO,
-    MedIO,
-    MicromedIO,
-    NixIO,
-    NixIOFr,
-    NeoMatlabIO,
-    NestIO,
-    NeuralynxIO,
-    NeuroExplorerIO,
-    NeuroNexusIO,
-    NeuroScopeIO,
-    NeuroshareIO,
-    NWBIO,
-    OpenEphysIO,
-    OpenEphysBinaryIO,
-    PhyIO,
-    PickleIO,
-    PlexonIO,
-    Plexon2IO,
-    RawBinarySignalIO,
-    RawMCSIO,
-    Spike2IO,
-    SpikeGadgetsIO,
-    SpikeGLXIO,
-    StimfitIO,
-    TdtIO,
-    TiffIO,
-    WinEdrIO,
-    WinWcpIO,
-]
-
-# for each supported extension list the ios supporting it
-io_by_extension = {}
-for current_io in iolist:  # do not use `io` as variable name here as this overwrites the module io
-    for extension in current_io.extensions:
-        extension = extension.lower()
+    _neuroshare_io = ("neurosharectypesio", "NeurosharectypesIO")
+
+# Static description of all ios: name -> (module, class name, extensions, mode).
+# Ios are only imported (together with their dependencies) when first accessed,
+# see `__getattr__`, so that guessing the io of a file does not require importing
+# all of them. Entries must match the class attributes (checked in test_get_io.py).
+_io_registry = {
+    "AlphaOmegaIO": ("alphaomegaio", "AlphaOmegaIO", ["lsx", "mpx"], "file"),
+    "AsciiImageIO": ("asciiimageio", "AsciiImageIO", [], "file"),
+    "AsciiSignalIO": ("asciisignalio", "AsciiSignalIO", ["txt", "asc", "csv", "tsv"], "file"),
+    "AsciiSpikeTrainIO": ("asciispiketrainio", "AsciiSpikeTrainIO", ["txt"], "file"),
+    "AxographIO": ("axographio", "AxographIO", ["axgd", "axgx", ""], "file"),
+    "AxonaIO": (
+        "axonaio",
+        "AxonaIO",
+        [
+            "bin",
+            "set",
+            "1",
+            "2",
+            "3",
+            "4",
+            "5",
+            "6",
+            "7",
+            "8",
+            "9",
+            "10",
+            "11",
+            "12",
+            "13",
+            "14",
+            "15",
+            "16",
+            "17",
+            "18",
+            "19",
+            "20",
+            "21",
+            "22",
+            "23",
+            "24",
+            "25",
+            "26",
+            "27",
+            "28",
+            "29",
+            "30",
+            "31",
+            "32",
+        ],
+        "file",
+    ),
+    "AxonIO": ("axonio", "AxonIO", ["abf"], "file"),
+    "BCI2000IO": ("bci2000io", "BCI2000IO", ["dat"], "file"),
+    "BiocamIO": ("biocamio", "BiocamIO", ["h5", "brw"], "file"),
+    "BlackrockIO": (
+        "blackrockio",
+        "BlackrockIO",
+        ["ns1", "ns2", "ns3", "ns4", "ns5", "ns6", "nev", "sif", "ccf"],
+        "file",
+    ),
+    "BlkIO": ("blkio", "BlkIO", [], "file"),
+    "BrainVisionIO": ("brainvisionio", "BrainVisionIO", ["vhdr"], "file"),
+    "BrainwareDamIO": ("brainwaredamio", "BrainwareDamIO", ["dam"], "file"),
+    "BrainwareF32IO": ("brainwaref32io", "BrainwareF32IO", ["f32"], "file"),
+    "BrainwareSrcIO": ("brainwaresrcio", "BrainwareSrcIO", ["src"], "file"),
+    "CedIO": ("cedio", "CedIO", ["smr", "smrx"], "file"),
+    "EDFIO": ("edfio", "EDFIO", ["edf"], "file"),
+    "ElanIO": ("elanio", "ElanIO", ["eeg"], "file"),
+    "ElphyIO": ("elphyio", "ElphyIO", ["DAT"], "file"),
+    "ExampleIO": ("exampleio", "ExampleIO", ["fake"], "file"),
+    "IgorIO": ("igorproio", "IgorIO", ["ibw", "pxp"], "file"),
+    "IntanIO": ("intanio", "IntanIO", ["rhd", "rhs", "dat"], "file"),
+    "KlustaKwikIO": ("klustakwikio", "KlustaKwikIO", ["fet", "clu", "res", "spk"], "dir"),
+    "KwikIO": ("kwikio", "KwikIO", ["kwik"], "file"),
+    "MEArecIO": ("mearecio", "MEArecIO", ["h5"], "file"),
+    "MaxwellIO": ("maxwellio", "MaxwellIO", ["h5"], "file"),
+    "MedIO": ("medio", "MedIO", ["medd", "rdat", "ridx"], "dir"),
+    "MicromedIO": ("micromedio", "MicromedIO", ["trc", "TRC"], "file"),
+    "NixIO": ("nixio", "NixIO", ["h5", "nix"], "file"),
+    "NixIOFr": ("nixio_fr", "NixIO", ["nix", "h5"], "file"),
+    "NeoMatlabIO": ("neomatlabio", "NeoMatlabIO", ["mat"], "file"),
+    "NestIO": ("nestio", "NestIO", ["gdf", "dat"], "file"),
+    "NeuralynxIO": ("neuralynxio", "NeuralynxIO", ["nse", "ncs", "nev", "ntt", "nvt", "nrd"], "dir"),
+    "NeuroExplorerIO": ("neuroexplorerio", "NeuroExplorerIO", ["nex"], "file"),
+    "NeuroNexusIO": ("neuronexusio", "NeuroNexusIO", ["xdat", "json"], "file"),
+    "NeuroScopeIO": ("neuroscopeio", "NeuroScopeIO", ["xml", "dat", "lfp", "eeg"], "file"),
+    "NeuroshareIO": _neuroshare_io + (["mcd"], "file"),
+    "NWBIO": ("nwbio", "NWBIO", ["nwb"], "one-file"),
+    "OpenEphysIO": ("openephysio", "OpenEphysIO", ["continuous", "openephys", "spikes", "events", "xml"], "dir"),
+    "OpenEphysBinaryIO": ("openephysbinaryio", "OpenEphysBinaryIO", ["xml", "oebin", "txt", "dat", "npy"], "dir"),
+    "PhyIO": ("phyio", "PhyIO", ["npy", "mat", "tsv", "dat"], "dir"),
+    "PickleIO": ("pickleio", "PickleIO", ["pkl", "pickle"], "file"),
+    "PlexonIO": ("plexonio", "PlexonIO", ["plx"], "file"),
+    "Plexon2IO": ("plexon2io", "Plexon2IO", ["pl2"], "file"),
+    "RawBinarySignalIO": ("rawbinarysignalio", "RawBinarySignalIO", ["raw", "bin", "dat"], "file"),
+    "RawMCSIO": ("rawmcsio", "RawMCSIO", ["raw"], "file"),
+    "Spike2IO": ("spike2io", "Spike2IO", ["smr"], "file"),
+    "SpikeGadgetsIO": ("spikegadgetsio", "SpikeGadgetsIO", ["rec"], "file"),
+    "SpikeGLXIO": ("spikeglxio", "SpikeGLXIO", ["meta", "bin"], "dir"),
+    "StimfitIO": ("stimfitio", "StimfitIO", ["abf", "dat", "axgx", "axgd", "cfs"], "file"),
+    "TdtIO": ("tdtio", "TdtIO", ["tbk", "tdx", "tev", "tin", "tnt", "tsq", "sev", "txt"], "dir"),
+    "TiffIO": ("tiffio", "TiffIO", [], "dir"),
+    "WinEdrIO": ("winedrio", "WinEdrIO", ["EDR", "edr"], "file"),
+    "WinWcpIO": ("winwcpio", "WinWcpIO", ["wcp"], "file"),
+}
+
+# for each supported extension list the names of the ios supporting it
+_io_names_by_extension = {}
+for _io_name, (_, _, _extensions, _) in _io_registry.items():
+    for _extension in _extensions:
         # extension handling should not be case sensitive
-        io_by_extension.setdefault(extension, []).append(current_io)
+        _io_names_by_extension.setdefault(_extension.lower(), []).append(_io_name)
 
 
-def get_io(file_or_folder, *args, **kwargs):
+__all__ = list(_io_registry) + ["iolist", "io_by_extension", "get_io", "list_candidate_ios", "detect_io"]
+
+
+def _get_io_class(name):
+    module_name, class_name = _io_registry[name][:2]
+    io_class = getattr(importlib.import_module(f"neo.io.{module_name}"), class_name)
+    globals()[name] = io_class
+    return io_class
+
+
+def __getattr__(name):
+    if name in _io_registry:
+        return _get_io_class(name)
+    if name == "iolist":
+        return [_get_io_class(io_name) for io_name in _io_registry]
+    if name == "io_by_extension":
+        return {
+            extension: [_get_io_class(io_name) for io_name in io_names]
+            for extension, io_names in _io_names_by_extension.items()
+        }
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_io_registry) | {"iolist", "io_by_extension"})
+
+
+def get_io(file_or_folder, *args, use_detection_cache=False, **kwargs):
     """
     Return a Neo IO instance, guessing the type based on the filename suffix.
+
+    Folders are scanned again at each call, unless `use_detection_cache` is True,
+    see :func:`detect_io`. Other arguments are passed to the IO.
     """
-    ios = list_candidate_ios(file_or_folder)
+    ios = list_candidate_ios(file_or_folder, use_cache=use_detection_cache)
     for io in ios:
         try:
             return io(file_or_folder, *args, **kwargs)
@@ -426,7 +453,9 @@ def get_io(file_or_folder, *args, **kwargs):
     raise IOError(f"Could not identify IO for {file_or_folder}")
 
 
-def list_candidate_ios(file_or_folder, ignore_patterns=["*.ini", "README.txt", "README.md"]):
+def list_candidate_ios(
+    file_or_folder, ignore_patterns=["*.ini", "README.txt", "README.md"], max_depth=3, use_cache=True
+):
     """
     Identify neo IO that can potentially load data in the file or folder
 
@@ -435,69 +464,59 @@ def list_candidate_ios(file_or_folder, ignore_patterns=["*.ini", "README.txt", "
     file_or_folder (str, pathlib.Path)
         Path to the file or folder to load
     ignore_patterns (list)
-        List of patterns to ignore when scanning for known formats. See pathlib.PurePath.match().
-        Default: ['ini']
+        List of patterns to ignore when scanning for known formats. See fnmatch.fnmatch().
+        Default: ['*.ini', 'README.txt', 'README.md']
+    max_depth (int)
+        Number of directory levels scanned below a folder.
+        Default: 3
+    use_cache (bool)
+        Reuse the result of a previous detection on the same folder, see :func:`detect_io`.
+        Default: True
 
     Returns
     -------
     list
-        List of neo io classes that are associated with the file extensions detected
+        List of neo io classes that can potentially load the data, the most likely first
     """
-    file_or_folder = pathlib.Path(file_or_folder)
+    ranking = detect_io(file_or_folder, ignore_patterns=ignore_patterns, max_depth=max_depth, use_cache=use_cache)
+    return [io for io, confidence in ranking]
 
-    if file_or_folder.is_file():
-        suffix = file_or_folder.suffix[1:].lower()
-        if suffix not in io_by_extension:
-            raise ValueError(f"{suffix} is not a supported format of any IO.")
-        return io_by_extension[suffix]
-
-    elif file_or_folder.is_dir():
-        # scan files in folder to determine io type
-        filenames = [f for f in file_or_folder.glob("**/*") if f.is_file()]
-        # keep only relevant filenames
-        filenames = [f for f in filenames if f.suffix and not any([f.match(p) for p in ignore_patterns])]
-
-        # if no files are found in the folder, check subfolders
-        # this is necessary for nested-folder based formats like spikeglx
-        if not filenames:
-            filenames = [f for f in file_or_folder.glob("**/*") if f.is_file()]
-            # keep only relevant filenames
-            filenames = [f for f in filenames if f.suffix and not any([f.match(p) for p in ignore_patterns])]
-
-    # if only file prefix was provided, e.g /mydatafolder/session1-
-    # to select all files sharing the `session1-` prefix
-    elif file_or_folder.parent.exists():
-        filenames = list(file_or_folder.parent.glob(file_or_folder.name + "*"))
-        # if filenames empty and suffix is provided then non-existent file
-        # may be written in current dir. So run check for io
-        if len(filenames) == 0 and file_or_folder.suffix:
-            suffix = file_or_folder.suffix[1:].lower()
-            if suffix not in io_by_extension:
-                raise ValueError(f"{suffix} is not a supported format of any IO.")
-            return io_by_extension[suffix]
-
-    # If non-existent file in non-existent dir is given check if this
-    # structure could be created with an io writing the file
-    elif file_or_folder.suffix:
-        suffix = file_or_folder.suffix[1:].lower()
-        if suffix not in io_by_extension:
-            raise ValueError(f"{suffix} is not a supported format of any IO.")
-        return io_by_extension[suffix]
 
-    else:
-        raise ValueError(f"{file_or_folder} does not contain data files of a supported format")
+def detect_io(file_or_folder, ignore_patterns=["*.ini", "README.txt", "README.md"], max_depth=3, use_cache=True):
+    """
+    Rank the neo IO that can potentially load data in the file or folder, without instantiating them
 
-    # find the io that fits the best with the files contained in the folder
-    potential_ios = []
-    for filename in filenames:
-        for suffix in filename.suffixes:
-            suffix = suffix[1:].lower()
-            if suffix in io_by_extension:
-                potential_ios.extend(io_by_extension[suffix])
+    Candidates are scored by file extensions and by format signatures (magic bytes,
+    companion files like .meta/.bin pairs). The result for a folder is cached until
+    one of the scanned directories is modified, i.e. a file or directory is added,
+    removed or renamed in it.
 
-    if not potential_ios:
-        raise ValueError(f"Could not determine IO to load {file_or_folder}")
+    Parameters
+    ----------
+    file_or_folder (str, pathlib.Path)
+        Path to the file or folder to load
+    ignore_patterns (list)
+        List of patterns to ignore when scanning for known formats. See fnmatch.fnmatch().
+        Default: ['*.ini', 'README.txt', 'README.md']
+    max_depth (int)
+        Number of directory levels scanned below a folder.
+        Default: 3
+    use_cache (bool)
+        Reuse the result of a previous detection on the same folder.
+        Default: True
+
+    Returns
+    -------
+    list
+        List of (neo io class, confidence) tuples ordered by decreasing confidence.
+        The confidence is a score between 0 and 1.
+    """
+    from neo.io.formatdetection import detect_io_names
 
-    # return ios ordered by number of files supported
-    counter = Counter(potential_ios).most_common()
-    return [io for io, count in counter]
+    ranking = detect_io_names(file_or_folder, max_depth=max_depth, ignore_patterns=ignore_patterns, use_cache=use_cache)
+    if not ranking:
+        suffix = pathlib.Path(file_or_folder).suffix[1:].lower()
+        if suffix and not pathlib.Path(file_or_folder).is_dir():
+            raise ValueError(f"{suffix} is not a supported format of any IO.")
+        raise ValueError(f"Could not determine IO to load {file_or_folder}")
+    return [(_get_io_class(io_name), confidence) for io_name, confidence in ranking]
@@ -0,0 +1,251 @@
+"""
+Detection of the io able to read a file or a folder.
+
+Detection does not instantiate any io. A folder is scanned up to a bounded depth.
+Then each candidate io is scored with:
+
+  * the fraction of data files whose extension it supports
+  * format signatures: magic bytes at the start of the files, or typical
+    companion (sidecar) files such as a SpikeGLX .meta file next to its .bin
+
+Signatures are only checked on a few files per io. This keeps detection fast
+on large folders and on network storage. Results for folders are cached, and
+invalidated when the modification time of any scanned directory changes.
+"""
+
+import fnmatch
+import glob
+import os
+import pathlib
+import re
+from collections import Counter, defaultdict
+
+from neo.io import _io_registry, _io_names_by_extension
+
+_hdf5_magic = b"\x89HDF\r\n\x1a\n"
+
+# magic bytes at the start of files: io name -> (extensions, accepted prefixes)
+_magic_signatures = {
+    "AxographIO": (["axgd", "axgx"], [b"AxGr", b"axgx"]),
+    "AxonIO": (["abf"], [b"ABF ", b"ABF2"]),
+    "BlackrockIO": (
+        ["nev", "ns1", "ns2", "ns3", "ns4", "ns5", "ns6"],
+        [b"NEURALEV", b"BREVENTS", b"NEURALSG", b"NEURALCD", b"BRSMPGRP"],
+    ),
+    "EDFIO": (["edf"], [b"0       "]),
+    # magic numbers 0xC6912702 (rhd) and 0xD69127AC (rhs), little endian
+    "IntanIO": (["rhd", "rhs"], [b"\x02\x27\x91\xc6", b"\xac\x27\x91\xd6"]),
+    "NeuralynxIO": (["nse", "ncs", "nev", "ntt", "nvt", "nrd"], [b"########"]),
+    "NeuroExplorerIO": (["nex"], [b"NEX1"]),
+    "NixIO": (["nix"], [_hdf5_magic]),
+    "NixIOFr": (["nix"], [_hdf5_magic]),
+    "NWBIO": (["nwb"], [_hdf5_magic]),
+    "PlexonIO": (["plx"], [b"PLEX"]),
+}
+
+# companion files: io name -> list of (file name pattern, patterns of which at least one
+# must be found in the same directory). `{stem}` is replaced by the stem of the matching file.
+_sidecar_signatures = {
+    "AxonaIO": [("*.set", ["{stem}.bin", "{stem}.[0-9]*"])],
+    "BlackrockIO": [("*.nev", ["{stem}.ns[1-6]"]), ("*.ns[1-6]", ["{stem}.nev"])],
+    "NeuroScopeIO": [("*.xml", ["{stem}.dat", "{stem}.lfp", "{stem}.eeg"])],
+    "OpenEphysIO": [("settings.xml", ["*.continuous", "*.spikes", "*.events"]), ("*.openephys", ["*.continuous"])],
+    "OpenEphysBinaryIO": [("structure.oebin", [])],
+    "PhyIO": [("params.py", ["spike_times.npy"])],
+    "SpikeGLXIO": [("*.meta", ["{stem}.bin"])],
+    "TdtIO": [("*.tsq", ["{stem}.tev"])],
+}
+
+_magic_io_names_by_extension = defaultdict(list)
+for _io_name, (_extensions, _) in _magic_signatures.items():
+    for _extension in _extensions:
+        _magic_io_names_by_extension[_extension].append(_io_name)
+
+# number of files per io and signature that are checked (magic bytes read, or companions searched)
+_max_signature_checks = 3
+
+# (folder, max_depth, ignore_patterns) -> (modification times of the scanned directories, ranking)
+# the least recently used entries are dropped beyond _detection_cache_size
+_detection_cache = {}
+_detection_cache_size = 128
+
+
+def detect_io_names(file_or_folder, max_depth=3, ignore_patterns=("*.ini", "README.txt", "README.md"), use_cache=True):
+    """
+    Rank the ios that can potentially read a file or folder, without instantiating them.
+
+    Parameters
+    ----------
+    file_or_folder: str | pathlib.Path
+        Path to a file, a folder, a file name prefix or a not yet existing file.
+    max_depth: int, default: 3
+        Number of directory levels scanned below a folder.
+    ignore_patterns: tuple[str], default: ("*.ini", "README.txt", "README.md")
+        File name patterns (see fnmatch) to ignore when scanning for known formats.
+    use_cache: bool, default: True
+        Reuse the result of a previous detection on the same folder, if none of the
+        scanned directories has been modified since.
+
+    Returns
+    -------
+    list[tuple[str, float]]
+        Names of the candidate ios (keys of neo.io) with a confidence score in [0, 1],
+        ordered by decreasing confidence.
+    """
+    file_or_folder = pathlib.Path(file_or_folder)
+    ignore_patterns = tuple(ignore_patterns)
+
+    if file_or_folder.is_file():
+        return _rank_io_names({file_or_folder.parent: [file_or_folder.name]}, explicit_file=True)
+
+    if file_or_folder.is_dir():
+        key = (str(file_or_folder.resolve()), max_depth, ignore_patterns)
+        if use_cache and key in _detection_cache:
+            mtimes, ranking = _detection_cache.pop(key)
+            if _unchanged(mtimes):
+                _detection_cache[key] = (mtimes, ranking)
+                return list(ranking)
+        mtimes = {}
+        ranking = _rank_io_names(_scan_folder(file_or_folder, max_depth, ignore_patterns, mtimes))
+        if use_cache:
+            _detection_cache[key] = (mtimes, ranking)
+            while len(_detection_cache) > _detection_cache_size:
+                del _detection_cache[next(iter(_detection_cache))]
+        return list(ranking)
+
+    # if only file prefix was provided, e.g /mydatafolder/session1-
+    # to select all files sharing the `session1-` prefix
+    if file_or_folder.parent.exists():
+        names = [f.name for f in file_or_folder.parent.glob(glob.escape(file_or_folder.name) + "*") if f.is_file()]
+        if names:
+            return _rank_io_names({file_or_folder.parent: names})
+
+    # a non-existent file may be written: check for io based on the suffix only
+    if file_or_folder.suffix:
+        return _rank_io_names({file_or_folder.parent: [file_or_folder.name]}, check_signatures=False)
+    return []
+
+
+def _suffixes(name):
+    # same as pathlib.PurePath(name).suffixes, without lower casing, but much cheaper
+    if name.endswith("."):
+        return []
+    return name.lstrip(".").split(".")[1:]
+
+
+def _scan_folder(folder, max_depth, ignore_patterns, mtimes=None):
+    """
+    Return {directory: [file names]} for the files up to max_depth levels below folder.
+
+    If a dict is given as mtimes, the modification time of every scanned directory
+    is stored in it, taken before listing the directory.
+    """
+    if ignore_patterns:
+        ignore_regex = re.compile("|".join(fnmatch.translate(os.path.normcase(p)) for p in ignore_patterns))
+    else:
+        ignore_regex = None
+
+    files_by_directory = {}
+    directories = [(folder, 0)]
+    while directories:
+        directory, depth = directories.pop()
+        names = []
+        try:
+            if mtimes is not None:
+                mtimes[directory] = os.stat(directory).st_mtime_ns
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if depth < max_depth:
+                            directories.append((pathlib.Path(entry.path), depth + 1))
+                    elif entry.is_file():
+                        if ignore_regex is not None and ignore_regex.match(os.path.normcase(entry.name)):
+                            continue
+                        names.append(entry.name)
+        except PermissionError:
+            continue
+        if names:
+            files_by_directory[directory] = names
+    return files_by_directory
+
+
+def _unchanged(mtimes):
+    """Check that none of the directories has been modified (or removed) since its mtime was taken"""
+    try:
+        return all(os.stat(directory).st_mtime_ns == mtime for directory, mtime in mtimes.items())
+    except OSError:
+        return False
+
+
+def _has_magic(path, prefixes):
+    try:
+        with open(path, "rb") as f:
+            head = f.read(max(len(prefix) for prefix in prefixes))
+    except OSError:
+        return False
+    return any(head.startswith(prefix) for prefix in prefixes)
+
+
+def _sidecar_score(io_name, files_by_directory):
+    for directory, names in files_by_directory.items():
+        for pattern, companions in _sidecar_signatures[io_name]:
+            for name in fnmatch.filter(names, pattern)[:_max_signature_checks]:
+                if not companions:
+                    return 1.0
+                stem = glob.escape(name.rsplit(".", 1)[0])
+                for companion in companions:
+                    companion = companion.format(stem=stem)
+                    if any(other != name for other in fnmatch.filter(names, companion)):
+                        return 1.0
+    return 0.0
+
+
+def _rank_io_names(files_by_directory, explicit_file=False, check_signatures=True):
+    """
+    Score the candidate ios for a set of files.
+
+    The confidence is half the fraction of data files with a supported extension
+    (halved again if the magic bytes of these files do not match) plus half the
+    signature score (sidecar files present, or fraction of checked files with matching magic bytes).
+    """
+    extension_counts = Counter()
+    magic_candidates = defaultdict(list)
+    n_files = 0
+    for directory, names in files_by_directory.items():
+        for name in names:
+            suffixes = [suffix.lower() for suffix in _suffixes(name)]
+            io_names = {io_name for suffix in suffixes for io_name in _io_names_by_extension.get(suffix, [])}
+            if io_names:
+                n_files += 1
+                extension_counts.update(io_names)
+            if not check_signatures:
+                continue
+            if explicit_file and not io_names:
+                # unknown extension: the magic bytes are the only hint
+                magic_io_names = _magic_signatures
+            elif suffixes:
+                magic_io_names = _magic_io_names_by_extension.get(suffixes[-1], [])
+            else:
+                magic_io_names = []
+            for io_name in magic_io_names:
+                if len(magic_candidates[io_name]) < _max_signature_checks:
+                    magic_candidates[io_name].append(directory / name)
+
+    ranking = []
+    for order, io_name in enumerate(_io_registry):
+        extension_score = extension_counts[io_name] / n_files if n_files else 0.0
+        signature_score = 0.0
+        if io_name in _magic_signatures and magic_candidates[io_name]:
+            prefixes = _magic_signatures[io_name][1]
+            n_matching = sum(_has_magic(path, prefixes) for path in magic_candidates[io_name])
+            signature_score = n_matching / len(magic_candidates[io_name])
+            if n_matching == 0:
+                extension_score /= 2
+        if check_signatures and io_name in _sidecar_signatures:
+            signature_score = max(signature_score, _sidecar_score(io_name, files_by_directory))
+        confidence = 0.5 * extension_score + 0.5 * signature_score
+        if confidence > 0:
+            ranking.append((-confidence, -extension_counts[io_name], order, io_name))
+
+    ranking.sort()
+    return [(io_name, -confidence) for confidence, _, _, io_name in ranking]
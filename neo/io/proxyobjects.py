@@ -16,7 +16,8 @@ import quantities as pq
 
 
 from neo.core.baseneo import BaseNeo
-from neo.core import AnalogSignal, Epoch, Event, SpikeTrain
+from neo.core import AnalogSignal, Epoch, Event, ImageSequence, SpikeTrain
+from neo.core.analogsignal import _get_sampling_rate
 from neo.core.dataobject import ArrayDict
 
 logger = logging.getLogger("Neo")
@@ -26,7 +27,7 @@ class BaseProxy(BaseNeo):
     def __init__(self, array_annotations=None, **annotations):
         # this for py27 str vs py3 str in neo attributes ompatibility
         annotations = check_annotations(annotations)
-        if "file_origin" not in annotations:
+        if "file_origin" not in annotations and getattr(self, "_rawio", None) is not None:
             # the str is to make compatible with neo_py27 where attribute
             # used to be str so raw bytes
             annotations["file_origin"] = str(self._rawio.source_name())
@@ -601,7 +602,127 @@ class EpochProxy(_EventOrEpoch):
     proxy_for = Epoch
 
 
-proxyobjectlist = [AnalogSignalProxy, SpikeTrainProxy, EventProxy, EpochProxy]
+class ImageSequenceProxy(BaseProxy):
+    """
+    This object mimic ImageSequence except that it does not
+    have the frames array itself. All attributes and annotations are here.
+
+    Contrary to the other proxy objects it does not rely on neo.rawio:
+    frames are read from `frames`, any array-like object with `shape`, `dtype`
+    and numpy indexing over (frame, row, column), for instance a np.memmap
+    or an object decoding image files on demand.
+
+    The ImageSequenceProxy is able to load:
+      * only a slice of time
+      * only a part of each frame (region of interest slices)
+      * have an internal raw magnitude identic to the file (uint16 for instance)
+
+    Usage:
+    >>> proxy_imgseq = ImageSequenceProxy(frames, units="V", sampling_rate=1 * pq.Hz,
+                                          spatial_scale=1 * pq.um)
+    >>> imgseq = proxy_imgseq.load()
+    >>> slice_of_imgseq = proxy_imgseq.load(time_slice=(1.*pq.s, 2.*pq.s))
+    >>> roi_of_imgseq = proxy_imgseq.load(spatial_slice=(slice(10, 20), slice(0, 50)))
+
+    """
+
+    _parent_objects = ("Segment",)
+    _necessary_attrs = (
+        ("sampling_rate", pq.Quantity, 0),
+        ("spatial_scale", pq.Quantity, 0),
+        ("t_start", pq.Quantity, 0),
+    )
+    _recommended_attrs = BaseNeo._recommended_attrs
+    proxy_for = ImageSequence
+
+    def __init__(
+        self,
+        frames,
+        units=pq.dimensionless,
+        sampling_rate=None,
+        spatial_scale=None,
+        t_start=0 * pq.s,
+        frame_duration=None,
+        **annotations,
+    ):
+        self._frames = frames
+        self.shape = tuple(frames.shape)
+        self.dtype = np.dtype(frames.dtype)
+        if units is None:
+            units = pq.dimensionless
+        self.units = pq.Quantity(1, units)
+        self.sampling_rate = _get_sampling_rate(sampling_rate, frame_duration)
+        self.sampling_period = 1.0 / self.sampling_rate
+        self.spatial_scale = spatial_scale
+        self.t_start = ensure_second(t_start)
+
+        BaseProxy.__init__(self, **annotations)
+
+    @property
+    def frame_duration(self):
+        """Duration of each image frame"""
+        return self.sampling_period
+
+    @property
+    def duration(self):
+        """Sequence duration"""
+        return self.shape[0] / self.sampling_rate
+
+    @property
+    def t_stop(self):
+        """Time when sequence ends"""
+        return self.t_start + self.duration
+
+    # frames are samples of the sequence
+    _time_slice_indices = AnalogSignalProxy._time_slice_indices
+
+    def load(self, time_slice=None, strict_slicing=True, spatial_slice=None, magnitude_mode="rescaled"):
+        """
+        *Args*:
+            :time_slice: None or tuple of the time slice expressed with quantities.
+                            None is the entire sequence.
+            :spatial_slice: None or tuple of the (row, column) slices of each frame to load.
+                            None is the entire frame.
+            :magnitude_mode: 'rescaled' or 'raw'.
+                    * **rescaled** give float32 frames (float64 if the file is float64)
+                    * **raw** keep the dtype of the file
+            :strict_slicing: True by default.
+                Control if an error is raise or not when one of  time_slice member
+                (t_start or t_stop) is outside the real time range of the sequence.
+        """
+        i_start, i_stop, seq_t_start = self._time_slice_indices(time_slice, strict_slicing=strict_slicing)
+
+        if spatial_slice is None:
+            spatial_slice = (slice(None), slice(None))
+        frames = np.asarray(self._frames[(slice(i_start, i_stop),) + tuple(spatial_slice)])
+
+        if magnitude_mode == "raw":
+            dtype = self.dtype
+        elif magnitude_mode == "rescaled":
+            if self.dtype == "float64":
+                dtype = "float64"
+            else:
+                dtype = "float32"
+        else:
+            raise ValueError(f"Invalid magnitude_mode {magnitude_mode}. Accepted values are " f'"rescaled" and "raw"')
+
+        imgseq = ImageSequence(
+            frames,
+            units=self.units.units,
+            dtype=dtype,
+            t_start=seq_t_start,
+            sampling_rate=self.sampling_rate,
+            spatial_scale=self.spatial_scale,
+            name=self.name,
+            file_origin=self.file_origin,
+            description=self.description,
+            **self.annotations,
+        )
+
+        return imgseq
+
+
+proxyobjectlist = [AnalogSignalProxy, SpikeTrainProxy, EventProxy, EpochProxy, ImageSequenceProxy]
 
 
 unit_convert = {
@@ -2,6 +2,7 @@
 Neo IO module for optical imaging data stored as a folder of TIFF images.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import glob
 import re
 
@@ -9,6 +10,7 @@ import numpy as np
 
 from neo.core import ImageSequence, Segment, Block
 from .baseio import BaseIO
+from .proxyobjects import ImageSequenceProxy
 
 
 class TiffIO(BaseIO):
@@ -29,9 +31,18 @@ class TiffIO(BaseIO):
         Whether to use the python default origin for images which is upper left corner ('top-left')
         as orgin or to use a bottom left corner as orgin ('bottom-left')
         Note that plotting functions like matplotlib.pyplot.imshow expect upper left corner.
+    max_workers: int | None, default: None
+        The number of threads used to decode compressed or colour images,
+        None uses the default of concurrent.futures.ThreadPoolExecutor
     **kwargs: dict
         The standard neo annotation kwargs
 
+    Notes
+    -----
+    With `lazy=True` the segment contains an ImageSequenceProxy: images are only read
+    when loading it, uncompressed grayscale images are memory mapped and
+    the others are decoded on demand.
+
     Examples
     --------
     >>> from neo import io
@@ -75,7 +86,7 @@ class TiffIO(BaseIO):
     readable_objects = supported_objects
     writeable_objects = []
 
-    support_lazy = False
+    support_lazy = True
 
     read_params = {}
     write_params = {}
@@ -91,6 +102,7 @@ class TiffIO(BaseIO):
         sampling_rate=None,
         spatial_scale=None,
         origin="top-left",
+        max_workers=None,
         **kwargs,
     ):
         # this block is because people might be confused about the PIL -> pillow change
@@ -108,10 +120,9 @@ class TiffIO(BaseIO):
         self.sampling_rate = sampling_rate
         self.spatial_scale = spatial_scale
         self.origin = origin
+        self.max_workers = max_workers
 
     def read_block(self, lazy=False, **kwargs):
-        import PIL
-
         # to sort file
         def natural_sort(l):
             convert = lambda text: int(text) if text.isdigit() else text.lower()
@@ -130,29 +141,21 @@ class TiffIO(BaseIO):
         file_name_list = [file_name[len(self.filename) + 1 : :] for file_name in file_name_list]
         # sorting file
         file_name_list = natural_sort(file_name_list)
-        list_data_image = []
-        for file_name in file_name_list:
-            data = np.array(PIL.Image.open(self.filename + "/" + file_name)).astype(np.float32)
-            if self.origin == "bottom-left":
-                data = np.flip(data, axis=-2)
-            list_data_image.append(data)
-        list_data_image = np.array(list_data_image)
-        if len(list_data_image.shape) == 4:
-            list_data_image = []
-            for file_name in file_name_list:
-                image = PIL.Image.open(self.filename + "/" + file_name).convert("L")
-                data = np.array(image).astype(np.float32)
-                if self.origin == "bottom-left":
-                    data = np.flip(data, axis=-2)
-                list_data_image.append(data)
+        frames = TiffFrameStack(
+            [self.filename + "/" + file_name for file_name in file_name_list],
+            origin=self.origin,
+            max_workers=self.max_workers,
+        )
 
         print("read block")
-        image_sequence = ImageSequence(
-            np.stack(list_data_image),
+        image_sequence = ImageSequenceProxy(
+            frames,
             units=self.units,
             sampling_rate=self.sampling_rate,
             spatial_scale=self.spatial_scale,
         )
+        if not lazy:
+            image_sequence = image_sequence.load()
         print("creating segment")
         segment = Segment(file_origin=self.filename)
         segment.annotate(tiff_file_names=file_name_list)
@@ -162,3 +165,136 @@ class TiffIO(BaseIO):
         block.segments.append(segment)
         print("returning block")
         return block
+
+
+# PIL raw modes of uncompressed images which can be memory mapped
+_raw_mode_dtypes = {
+    "L": "u1",
+    "I;16": "<u2",
+    "I;16B": ">u2",
+    "I;16S": "<i2",
+    "I;16BS": ">i2",
+    "I;32": "<u4",
+    "I;32B": ">u4",
+    "I;32S": "<i4",
+    "I;32BS": ">i4",
+    "F;32F": "<f4",
+    "F;32BF": ">f4",
+    "F;64F": "<f8",
+    "F;64BF": ">f8",
+}
+
+
+class TiffFrameStack:
+    """
+    Frames of a list of TIFF images (one frame per file) read on demand.
+
+    Only the headers are read at creation. Uncompressed grayscale images stored in
+    contiguous strips are memory mapped, the others are decoded with PIL, in parallel
+    when several frames are requested. Colour images are converted to grayscale ("L").
+
+    Frames are indexed like a (frame, row, column) numpy array.
+    """
+
+    def __init__(self, file_paths, origin="top-left", max_workers=None):
+        import PIL.Image
+
+        self.file_paths = list(file_paths)
+        self.origin = origin
+        self.max_workers = max_workers
+
+        # for each file (memmap offset, memmap dtype) or None when it must be decoded
+        self._memmap_layouts = []
+        self._is_colour = []
+        frame_shapes = set()
+        dtypes = []
+        for file_path in self.file_paths:
+            with PIL.Image.open(file_path) as image:
+                layout = _raw_strips_layout(image)
+                is_colour = len(image.getbands()) > 1
+                if layout is not None:
+                    dtype = layout[1]
+                elif is_colour:
+                    dtype = np.dtype("uint8")
+                else:
+                    dtype = np.asarray(PIL.Image.new(image.mode, (1, 1))).dtype
+                frame_shapes.add((image.height, image.width))
+            self._memmap_layouts.append(layout)
+            self._is_colour.append(is_colour)
+            dtypes.append(dtype.newbyteorder("="))
+
+        if len(frame_shapes) > 1:
+            raise ValueError("All the tiff images must have the same size")
+        frame_shape = frame_shapes.pop() if frame_shapes else (0, 0)
+        self.shape = (len(self.file_paths),) + frame_shape
+        self.dtype = np.result_type(*dtypes) if dtypes else np.dtype("float32")
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = (key,)
+        frame_indexes = np.arange(self.shape[0])[key[0]]
+        pixel_key = key[1:]
+        if frame_indexes.ndim == 0:
+            return self._read_frame(int(frame_indexes), pixel_key)
+
+        frame_shape = np.empty(self.shape[1:], dtype=bool)[pixel_key].shape
+        frames = np.empty((frame_indexes.size,) + frame_shape, dtype=self.dtype)
+        if frame_indexes.size > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for i, frame in enumerate(executor.map(self._read_frame, frame_indexes, [pixel_key] * len(frames))):
+                    frames[i] = frame
+        else:
+            for i, frame_index in enumerate(frame_indexes):
+                frames[i] = self._read_frame(frame_index, pixel_key)
+        return frames
+
+    def _read_frame(self, frame_index, pixel_key=()):
+        import PIL.Image
+
+        file_path = self.file_paths[frame_index]
+        layout = self._memmap_layouts[frame_index]
+        if layout is not None:
+            offset, dtype = layout
+            frame = np.memmap(file_path, dtype=dtype, mode="r", offset=offset, shape=self.shape[1:])
+        else:
+            with PIL.Image.open(file_path) as image:
+                if self._is_colour[frame_index]:
+                    image = image.convert("L")
+                frame = np.array(image)
+        if self.origin == "bottom-left":
+            frame = np.flip(frame, axis=-2)
+        return np.array(frame[pixel_key], dtype=self.dtype)
+
+
+def _raw_strips_layout(image):
+    """
+    Return (offset, dtype) when the PIL image is stored uncompressed in contiguous
+    strips and can be memory mapped, otherwise None.
+    """
+    offset0 = None
+    row_start = 0
+    for tile in image.tile:
+        codec_name, extents, offset, args = tile[:4]
+        if isinstance(args, str):
+            args = (args, 0, 1)
+        raw_mode, stride, orientation = (tuple(args) + (0, 1))[:3]
+        if codec_name != "raw" or raw_mode not in _raw_mode_dtypes or orientation != 1:
+            return None
+        dtype = np.dtype(_raw_mode_dtypes[raw_mode])
+        row_size = image.width * dtype.itemsize
+        if stride not in (0, row_size):
+            return None
+        x0, y0, x1, y1 = extents
+        if x0 != 0 or x1 != image.width or y0 != row_start:
+            return None
+        if offset0 is None:
+            offset0 = offset
+        elif offset != offset0 + y0 * row_size:
+            return None
+        row_start = y1
+    if offset0 is None or row_start != image.height:
+        return None
+    return offset0, dtype
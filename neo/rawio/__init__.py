@@ -2,8 +2,8 @@
 :mod:`neo.rawio` provides classes for reading
 electrophysiological data files with a low-level API
 
-:attr:`neo.rawio.rawiolist` provides a list of successfully imported rawio
-classes.
+:attr:`neo.rawio.rawiolist` provides a list of all rawio classes. Rawio
+classes are imported lazily, on first access.
 
 Functions:
 
@@ -183,77 +183,108 @@ Classes:
 
 from pathlib import Path
 from collections import Counter
+import importlib
 
-from neo.rawio.alphaomegarawio import AlphaOmegaRawIO
-from neo.rawio.axographrawio import AxographRawIO
-from neo.rawio.axonarawio import AxonaRawIO
-from neo.rawio.axonrawio import AxonRawIO
-from neo.rawio.biocamrawio import BiocamRawIO
-from neo.rawio.blackrockrawio import BlackrockRawIO
-from neo.rawio.brainvisionrawio import BrainVisionRawIO
-from neo.rawio.cedrawio import CedRawIO
-from neo.rawio.edfrawio import EDFRawIO
-from neo.rawio.elanrawio import ElanRawIO
 from neo.rawio.examplerawio import ExampleRawIO
-from neo.rawio.intanrawio import IntanRawIO
-from neo.rawio.maxwellrawio import MaxwellRawIO
-from neo.rawio.mearecrawio import MEArecRawIO
-from neo.rawio.medrawio import MedRawIO
-from neo.rawio.micromedrawio import MicromedRawIO
-from neo.rawio.neuralynxrawio import NeuralynxRawIO
-from neo.rawio.neuroexplorerrawio import NeuroExplorerRawIO
-from neo.rawio.neuronexusrawio import NeuroNexusRawIO
-from neo.rawio.neuroscoperawio import NeuroScopeRawIO
-from neo.rawio.nixrawio import NIXRawIO
-from neo.rawio.openephysrawio import OpenEphysRawIO
-from neo.rawio.openephysbinaryrawio import OpenEphysBinaryRawIO
-from neo.rawio.phyrawio import PhyRawIO
-from neo.rawio.plexonrawio import PlexonRawIO
-from neo.rawio.plexon2rawio import Plexon2RawIO
-from neo.rawio.rawbinarysignalrawio import RawBinarySignalRawIO
-from neo.rawio.rawmcsrawio import RawMCSRawIO
-from neo.rawio.spike2rawio import Spike2RawIO
-from neo.rawio.spikegadgetsrawio import SpikeGadgetsRawIO
-from neo.rawio.spikeglxrawio import SpikeGLXRawIO
-from neo.rawio.tdtrawio import TdtRawIO
-from neo.rawio.winedrrawio import WinEdrRawIO
-from neo.rawio.winwcprawio import WinWcpRawIO
-
-rawiolist = [
-    AlphaOmegaRawIO,
-    AxographRawIO,
-    AxonaRawIO,
-    AxonRawIO,
-    BiocamRawIO,
-    BlackrockRawIO,
-    BrainVisionRawIO,
-    CedRawIO,
-    EDFRawIO,
-    ElanRawIO,
-    IntanRawIO,
-    MicromedRawIO,
-    MaxwellRawIO,
-    MEArecRawIO,
-    MedRawIO,
-    NeuralynxRawIO,
-    NeuroExplorerRawIO,
-    NeuroNexusRawIO,
-    NeuroScopeRawIO,
-    NIXRawIO,
-    OpenEphysRawIO,
-    OpenEphysBinaryRawIO,
-    PhyRawIO,
-    PlexonRawIO,
-    Plexon2RawIO,
-    RawBinarySignalRawIO,
-    RawMCSRawIO,
-    Spike2RawIO,
-    SpikeGadgetsRawIO,
-    SpikeGLXRawIO,
-    TdtRawIO,
-    WinEdrRawIO,
-    WinWcpRawIO,
-]
+
+# Static description of the rawios in `rawiolist`: name -> (module, extensions, rawmode).
+# Rawio classes are only imported when first accessed, see `__getattr__`.
+# Entries must match the class attributes (checked in test_get_rawio.py).
+_rawio_registry = {
+    "AlphaOmegaRawIO": ("alphaomegarawio", ["lsx", "mpx"], "one-dir"),
+    "AxographRawIO": ("axographrawio", ["axgd", "axgx", ""], "one-file"),
+    "AxonaRawIO": (
+        "axonarawio",
+        [
+            "bin",
+            "set",
+            "1",
+            "2",
+            "3",
+            "4",
+            "5",
+            "6",
+            "7",
+            "8",
+            "9",
+            "10",
+            "11",
+            "12",
+            "13",
+            "14",
+            "15",
+            "16",
+            "17",
+            "18",
+            "19",
+            "20",
+            "21",
+            "22",
+            "23",
+            "24",
+            "25",
+            "26",
+            "27",
+            "28",
+            "29",
+            "30",
+            "31",
+            "32",
+        ],
+        "multi-file",
+    ),
+    "AxonRawIO": ("axonrawio", ["abf"], "one-file"),
+    "BiocamRawIO": ("biocamrawio", ["h5", "brw"], "one-file"),
+    "BlackrockRawIO": ("blackrockrawio", ["ns1", "ns2", "ns3", "ns4", "ns5", "ns6", "nev", "sif", "ccf"], "multi-file"),
+    "BrainVisionRawIO": ("brainvisionrawio", ["vhdr"], "one-file"),
+    "CedRawIO": ("cedrawio", ["smr", "smrx"], "one-file"),
+    "EDFRawIO": ("edfrawio", ["edf"], "one-file"),
+    "ElanRawIO": ("elanrawio", ["eeg"], "one-file"),
+    "IntanRawIO": ("intanrawio", ["rhd", "rhs", "dat"], "one-file"),
+    "MicromedRawIO": ("micromedrawio", ["trc", "TRC"], "one-file"),
+    "MaxwellRawIO": ("maxwellrawio", ["h5"], "one-file"),
+    "MEArecRawIO": ("mearecrawio", ["h5"], "one-file"),
+    "MedRawIO": ("medrawio", ["medd", "rdat", "ridx"], "one-dir"),
+    "NeuralynxRawIO": ("neuralynxrawio", ["nse", "ncs", "nev", "ntt", "nvt", "nrd"], "one-dir"),
+    "NeuroExplorerRawIO": ("neuroexplorerrawio", ["nex"], "one-file"),
+    "NeuroNexusRawIO": ("neuronexusrawio", ["xdat", "json"], "one-file"),
+    "NeuroScopeRawIO": ("neuroscoperawio", ["xml", "dat", "lfp", "eeg"], "one-file"),
+    "NIXRawIO": ("nixrawio", ["nix", "h5"], "one-file"),
+    "OpenEphysRawIO": ("openephysrawio", ["continuous", "openephys", "spikes", "events", "xml"], "one-dir"),
+    "OpenEphysBinaryRawIO": ("openephysbinaryrawio", ["xml", "oebin", "txt", "dat", "npy"], "one-dir"),
+    "PhyRawIO": ("phyrawio", ["npy", "mat", "tsv", "dat"], "one-dir"),
+    "PlexonRawIO": ("plexonrawio", ["plx"], "one-file"),
+    "Plexon2RawIO": ("plexon2rawio", ["pl2"], "one-file"),
+    "RawBinarySignalRawIO": ("rawbinarysignalrawio", ["raw", "bin", "dat"], "one-file"),
+    "RawMCSRawIO": ("rawmcsrawio", ["raw"], "one-file"),
+    "Spike2RawIO": ("spike2rawio", ["smr"], "one-file"),
+    "SpikeGadgetsRawIO": ("spikegadgetsrawio", ["rec"], "one-file"),
+    "SpikeGLXRawIO": ("spikeglxrawio", ["meta", "bin"], "one-dir"),
+    "TdtRawIO": ("tdtrawio", ["tbk", "tdx", "tev", "tin", "tnt", "tsq", "sev", "txt"], "one-dir"),
+    "WinEdrRawIO": ("winedrrawio", ["EDR", "edr"], "one-file"),
+    "WinWcpRawIO": ("winwcprawio", ["wcp"], "one-file"),
+}
+
+
+__all__ = ["ExampleRawIO"] + list(_rawio_registry) + ["rawiolist", "get_rawio", "get_rawio_class"]
+
+
+def _get_rawio_class(name):
+    rawio_class = getattr(importlib.import_module(f"neo.rawio.{_rawio_registry[name][0]}"), name)
+    globals()[name] = rawio_class
+    return rawio_class
+
+
+def __getattr__(name):
+    if name in _rawio_registry:
+        return _get_rawio_class(name)
+    if name == "rawiolist":
+        return [_get_rawio_class(rawio_name) for rawio_name in _rawio_registry]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_rawio_registry) | {"rawiolist"})
 
 
 def get_rawio_class(filename_or_dirname):
@@ -306,9 +337,9 @@ def get_rawio(filename_or_dirname, exclusive_rawio: bool = True):
 
     possibles = []
     for ext in ext_list:
-        for rawio in rawiolist:
-            if any(ext.lower() == ext2.lower() for ext2 in rawio.extensions):
-                possibles.append(rawio)
+        for rawio_name, (_, extensions, _) in _rawio_registry.items():
+            if any(ext.lower() == ext2.lower() for ext2 in extensions):
+                possibles.append(_get_rawio_class(rawio_name))
 
     if len(possibles) == 1 and exclusive_rawio:
         return possibles[0]
@@ -22,11 +22,10 @@ AlphaOmega engineers.
 Author: Thomas Perret <thomas.perret@isc.cnrs.fr>
 """
 
-import io
 import mmap
 import struct
 
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 from pathlib import Path, PureWindowsPath
@@ -59,6 +58,14 @@ class AlphaOmegaRawIO(BaseRawIO):
         If None all mpx files will be read
     prune_channels: bool, default: True
         If True removes the empty channels
+    num_workers: int, default: 1
+        Number of processes used to scan the datablocks of the mpx files in
+        parallel when parsing the header
+    use_cache: bool, default: False
+        If True the datablocks found in each mpx file are saved in a cache file
+        (needs joblib) and reused instead of scanning the files again
+    cache_path: "same_as_resource" | "home", default: "same_as_resource"
+        Where the cache file is saved
 
     Notes
     -----
@@ -88,14 +95,24 @@ class AlphaOmegaRawIO(BaseRawIO):
         ("Internal Detection", "Internal Detection", "Internal Detection"),
     )
 
-    def __init__(self, dirname="", lsx_files=None, prune_channels=True):
-        super().__init__(dirname=dirname)
+    def __init__(
+        self,
+        dirname="",
+        lsx_files=None,
+        prune_channels=True,
+        num_workers=1,
+        use_cache=False,
+        cache_path="same_as_resource",
+    ):
+        # the cache is named after dirname so it must be set first
         self.dirname = Path(dirname)
+        self._opened_files = {}
+        super().__init__(dirname=dirname, use_cache=use_cache, cache_path=cache_path)
 
         self._lsx_files = lsx_files
         self._mpx_files = None
         self._prune_channels = prune_channels
-        self._opened_files = {}
+        self._num_workers = num_workers
         self._ignore_unknown_datablocks = True  # internal debug property
 
         if self.dirname.is_dir():
@@ -140,7 +157,7 @@ class AlphaOmegaRawIO(BaseRawIO):
     def _source_name(self):
         return str(self.dirname)
 
-    def _read_file_datablocks(self, filename, prune_channels=True):
+    def _read_file_datablocks(self, filename, prune_channels=True, scan=None):
         """Read datablocks from AlphaOmega MPX file version 4.
 
         :param filename: the MPX filename to read datablocks from
@@ -151,6 +168,9 @@ class AlphaOmegaRawIO(BaseRawIO):
             exception raised when data recorded in further files are merged into
             the first file pruned from these channels.
         :type prune_channels: bool
+        :param scan: the datablocks of the file as returned by
+            :func:`scan_mpx_datablocks`. If None, the file is scanned here.
+        :type scan: dict or None
         """
         continuous_analog_channels = {}
         segmented_analog_channels = {}
@@ -214,26 +234,21 @@ class AlphaOmegaRawIO(BaseRawIO):
                 "max_sample_rate": 0,
             }
 
-            pos = 0
-            while True:
-                pos += length
-                f.seek(pos)
-                header_bytes = f.read(HeaderType.size)
-
-                length, block_type = HeaderType.unpack(header_bytes)
-                if length == 65535:
-                    # The stop condition for reading MPX datablocks is base on
-                    # the # length of the block: if the block has length 65535
-                    # (or -1 in signed integer value) we know we have reached
-                    # the end of the file
-                    # We could also check that we are at the end of the file
-                    # after this block
-                    break
-
-                if block_type == b"h":
-                    self.logger.error("Type h block must exist only at the beginning of file")
-                    raise Exception("AlphaOmega MPX file format must not have type h block after first block")
-
+            if scan is None:
+                scan = scan_mpx_datablocks(filename)
+            block_types = scan["block_types"]
+            if np.any(block_types == b"h"):
+                self.logger.error("Type h block must exist only at the beginning of file")
+                raise Exception("AlphaOmega MPX file format must not have type h block after first block")
+
+            # definition datablocks are few: they are decoded one by one, in file order
+            is_definition = np.isin(block_types, [b"2", b"S", b"b"])
+            for pos, length, block_type in zip(
+                scan["block_positions"][is_definition].tolist(),
+                scan["block_lengths"][is_definition].tolist(),
+                block_types[is_definition].tolist(),
+            ):
+                f.seek(pos + HeaderType.size)
                 if block_type == b"2":
                     (
                         next_block,
@@ -289,7 +304,7 @@ class AlphaOmegaRawIO(BaseRawIO):
                                 "duration": duration,
                                 "gain": total_gain_100 / 100,
                                 "name": name,
-                                "positions": defaultdict(list),
+                                "positions": {},
                             }
                         elif mode == 1:
                             # segmented analog channel definition block
@@ -325,7 +340,7 @@ class AlphaOmegaRawIO(BaseRawIO):
                                 "automatic_level_base_rms": yes_rms,
                                 "gain": total_gain_100 / 100,
                                 "name": name,
-                                "positions": defaultdict(list),
+                                "positions": {},
                             }
                         else:
                             self.logger.error(f"Unknown type 2 analog block mode: {mode}")
@@ -393,111 +408,105 @@ class AlphaOmegaRawIO(BaseRawIO):
                         "name": name,
                         "samples": [],
                     }
-                elif block_type == b"5":
-                    # channel data block
-                    unit_number, channel_number = SDataChannel.unpack(f.read(SDataChannel.size))
-                    if channel_number not in channel_type:
-                        raise ValueError(f"`channel_number` must be in channel_type {channel_type}")
-                    unit_number = int.from_bytes(unit_number, "little")
-                    if "analog" in channel_type[channel_number]:
-                        data_length = (length - 10) / 2
-                        # why do we even have this check?
-                        if int(data_length) != data_length:
-                            raise ValueError(f"The data length must be equal to the int of the data length")
-                        data_length = int(data_length)
-                        data_start = f.tell()
-                        f.seek(2 * data_length, io.SEEK_CUR)
-                        if channel_type[channel_number].startswith("continuous"):
-                            if channel_number not in continuous_analog_channels:
-                                raise NeoReadWriteError(
-                                    f"The `channel_number` must be in the continuous_analog_channels {continuous_analog_channels}"
-                                )
-                            continuous_analog_channels[channel_number]["positions"][filename].append(
-                                (
-                                    SDataChannel_sample_id.unpack(f.read(SDataChannel_sample_id.size))[0],
-                                    data_start,
-                                    data_length,
-                                )
-                            )
-                        elif channel_type[channel_number].startswith("segmented"):
-                            if channel_number not in segmented_analog_channels:
-                                raise NeoReadWriteError(
-                                    f"The `channel_number` must be in the segmented_analog_channels {segmented_analog_channels}"
-                                )
-                            if unit_number > 0 and unit_number <= 4:
-                                segmented_analog_channels[channel_number]["positions"][filename].append(
-                                    (
-                                        SDataChannel_sample_id.unpack(f.read(SDataChannel_sample_id.size))[0],
-                                        data_start,
-                                        data_length,
-                                    )
-                                )
-                            elif unit_number == 0:
-                                segmented_analog_channels[channel_number]["positions"][filename].append(
-                                    (
-                                        SDataChannel_sample_id.unpack(f.read(SDataChannel_sample_id.size))[0],
-                                        data_start,
-                                        data_length,
-                                    )
-                                )
-                            else:
-                                self.logger.error(f"Unknown unit_number={unit_number} in channel data block")
-                                continue
-                    elif channel_type[channel_number] == "digital":
-                        if channel_number not in digital_channels:
+
+            # channel data datablocks are decoded all at once, grouped by channel
+            channel_data = scan["channel_data"]
+            unknown_channels = np.setdiff1d(channel_data["channel_number"], list(channel_type))
+            if unknown_channels.size:
+                raise ValueError(f"`channel_number` must be in channel_type {channel_type}")
+            order = np.argsort(channel_data["channel_number"], kind="stable")
+            channel_numbers, first_indexes = np.unique(channel_data["channel_number"][order], return_index=True)
+            for channel_number, indexes in zip(channel_numbers.tolist(), np.split(order, first_indexes[1:])):
+                blocks = channel_data[indexes]
+                if "analog" in channel_type[channel_number]:
+                    data_lengths = blocks["length"].astype(np.int64) - 10
+                    # why do we even have this check?
+                    if np.any(data_lengths % 2):
+                        raise ValueError(f"The data length must be equal to the int of the data length")
+                    if channel_type[channel_number].startswith("continuous"):
+                        if channel_number not in continuous_analog_channels:
                             raise NeoReadWriteError(
-                                f"The `channel_number` must be in the digital_channels {digital_channels}"
+                                f"The `channel_number` must be in the continuous_analog_channels {continuous_analog_channels}"
                             )
-                        sample_number, value = SDataChannelDigital.unpack(f.read(SDataChannelDigital.size))
-                        digital_channels[channel_number]["samples"].append(
-                            (
-                                sample_number,
-                                value,
+                        channel = continuous_analog_channels[channel_number]
+                    elif channel_type[channel_number].startswith("segmented"):
+                        if channel_number not in segmented_analog_channels:
+                            raise NeoReadWriteError(
+                                f"The `channel_number` must be in the segmented_analog_channels {segmented_analog_channels}"
                             )
+                        channel = segmented_analog_channels[channel_number]
+                        known_unit = blocks["unit_number"] <= 4
+                        for unit_number in np.unique(blocks["unit_number"][~known_unit]).tolist():
+                            self.logger.error(f"Unknown unit_number={unit_number} in channel data block")
+                        blocks = blocks[known_unit]
+                        data_lengths = data_lengths[known_unit]
+                    if blocks.size:
+                        positions = np.empty(blocks.size, dtype=DataBlockPosition)
+                        positions["sample_number"] = blocks["first_sample_number"]
+                        positions["offset"] = blocks["position"] + HeaderType.size + SDataChannel.size
+                        positions["length"] = data_lengths // 2
+                        channel["positions"][filename] = positions
+                elif channel_type[channel_number] == "digital":
+                    if channel_number not in digital_channels:
+                        raise NeoReadWriteError(
+                            f"The `channel_number` must be in the digital_channels {digital_channels}"
                         )
-                    elif channel_type[channel_number] == "port":
-                        if channel_number not in ports:
-                            raise NeoReadWriteError(f"The `channel_number` must be in ports {ports}")
-                        # specifications says that for ports it should be "<Lh"
-                        # but the data shows clearly "<HL"
-                        value, sample_number = SDataChannelPort.unpack(f.read(SDataChannelPort.size))
-                        ports[channel_number]["samples"].append(
+                    samples = blocks["payload"].view(SDataChannelDigitalDtype)
+                    digital_channels[channel_number]["samples"].extend(
+                        zip(samples["sample_number"].tolist(), samples["value"].tolist())
+                    )
+                elif channel_type[channel_number] == "port":
+                    if channel_number not in ports:
+                        raise NeoReadWriteError(f"The `channel_number` must be in ports {ports}")
+                    # specifications says that for ports it should be "<Lh"
+                    # but the data shows clearly "<HL"
+                    samples = blocks["payload"].view(SDataChannelPortDtype)
+                    ports[channel_number]["samples"].extend(
+                        zip(samples["sample_number"].tolist(), samples["value"].tolist())
+                    )
+                else:
+                    self.logger.error(f"Unknown channel_type={channel_type[channel_number]} for block type 5")
+
+            is_event = block_types == b"E"
+            for pos, length in zip(
+                scan["block_positions"][is_event].tolist(), scan["block_lengths"][is_event].tolist()
+            ):
+                f.seek(pos + HeaderType.size)
+                type_event, timestamp = SAOEvent.unpack(f.read(SAOEvent.size))
+                stream_data_length = length - 8
+                events.append(
+                    {
+                        "timestamp": timestamp,
+                        "stream_data": struct.unpack(f"<{stream_data_length}s", f.read(stream_data_length))[0],
+                    }
+                )
+
+            if not self._ignore_unknown_datablocks:
+                is_unknown = ~(is_definition | is_event | (block_types == b"5"))
+                for pos, length, block_type in zip(
+                    scan["block_positions"][is_unknown].tolist(),
+                    scan["block_lengths"][is_unknown].tolist(),
+                    block_types[is_unknown].tolist(),
+                ):
+                    f.seek(pos + HeaderType.size)
+                    try:
+                        bt = block_type.decode()
+                        self.logger.debug(f"Unknown block type: block length: {length}, block_type: {bt}")
+                    except UnicodeDecodeError:
+                        self.logger.debug(
                             (
-                                sample_number,
-                                value,
+                                f"Unknown block type: block length: {length}, "
+                                f"block_type: {int.from_bytes(block_type, 'little')} "
+                                "(int format)"
                             )
                         )
-                    else:
-                        self.logger.error(f"Unknown channel_type={channel_type[channel_number]} for block type 5")
-                elif block_type == b"E":
-                    type_event, timestamp = SAOEvent.unpack(f.read(SAOEvent.size))
-                    stream_data_length = length - 8
-                    events.append(
+                    unknown_datablocks.append(
                         {
-                            "timestamp": timestamp,
-                            "stream_data": struct.unpack(f"<{stream_data_length}s", f.read(stream_data_length))[0],
+                            "length": length,
+                            "block_type": block_type,
+                            "data": f.read(length),
                         }
                     )
-                else:
-                    if not self._ignore_unknown_datablocks:
-                        try:
-                            bt = block_type.decode()
-                            self.logger.debug(f"Unknown block type: block length: {length}, block_type: {bt}")
-                        except UnicodeDecodeError:
-                            self.logger.debug(
-                                (
-                                    f"Unknown block type: block length: {length}, "
-                                    f"block_type: {int.from_bytes(block_type, 'little')} "
-                                    "(int format)"
-                                )
-                            )
-                        unknown_datablocks.append(
-                            {
-                                "length": length,
-                                "block_type": block_type,
-                                "data": f.read(length),
-                            }
-                        )
         if prune_channels:
             to_remove = []
             for channel_id, channel in continuous_analog_channels.items():
@@ -598,10 +607,9 @@ class AlphaOmegaRawIO(BaseRawIO):
                         # channel but the segment to merge has stream for this channel
                         segment["streams"][stream][channel_id] = segment_to_merge["streams"][stream][channel_id]
                     else:
-                        for f in segment_to_merge["streams"][stream][channel_id]["positions"]:
-                            channel["positions"][f].extend(
-                                segment_to_merge["streams"][stream][channel_id]["positions"][f]
-                            )
+                        _merge_positions(
+                            channel["positions"], segment_to_merge["streams"][stream][channel_id]["positions"]
+                        )
             for channel_id in segment_to_merge["events"]:
                 try:
                     channel = segment["events"][channel_id]
@@ -619,8 +627,7 @@ class AlphaOmegaRawIO(BaseRawIO):
                     # channel but the segment to merge has spikes for this channel
                     segment["spikes"][channel_id] = segment_to_merge["spikes"][channel_id]
                 else:
-                    for f in segment_to_merge["spikes"][channel_id]["positions"]:
-                        channel["positions"][f].extend(segment_to_merge["spikes"][channel_id]["positions"][f])
+                    _merge_positions(channel["positions"], segment_to_merge["spikes"][channel_id]["positions"])
             segment["ao_events"].extend(segment_to_merge["ao_events"])
             for channel_id in segment_to_merge["stream_data"]:
                 # To be honest, I have no idea what is a
@@ -628,10 +635,39 @@ class AlphaOmegaRawIO(BaseRawIO):
                 segment["stream_data"][channel_id] = segment_to_merge["stream_data"][channel_id]
             self._segments.remove(segment_to_merge)
 
+    def _scan_mpx_files(self):
+        """Locate the datablocks of all mpx files with :func:`scan_mpx_datablocks`.
+
+        Files are scanned in parallel if `num_workers` > 1 and the results are
+        taken from (and saved into) the cache when it is used.
+
+        :return: the result of :func:`scan_mpx_datablocks` for each file
+        :rtype: dict
+        """
+        scans = {}
+        cache_keys = {}
+        for filename in self._mpx_files:
+            stat = filename.stat()
+            cache_keys[filename] = f"mpx_datablocks_{filename.name}_{stat.st_size}_{stat.st_mtime_ns}"
+            if self.use_cache and cache_keys[filename] in self._cache:
+                scans[filename] = self._cache[cache_keys[filename]]
+        to_scan = [filename for filename in self._mpx_files if filename not in scans]
+        if self._num_workers > 1 and len(to_scan) > 1:
+            with ProcessPoolExecutor(max_workers=self._num_workers) as executor:
+                scans.update(zip(to_scan, executor.map(scan_mpx_datablocks, to_scan)))
+        else:
+            scans.update((filename, scan_mpx_datablocks(filename)) for filename in to_scan)
+        if self.use_cache and to_scan:
+            self.add_in_cache(**{cache_keys[filename]: scans[filename] for filename in to_scan})
+        return scans
+
     def _parse_header(self):
         segments = []
+        scans = self._scan_mpx_files()
         for i, filename in enumerate(self._mpx_files):
-            metadata, cac, sac, dc, ct, sd, p, e, ub = self._read_file_datablocks(filename, self._prune_channels)
+            metadata, cac, sac, dc, ct, sd, p, e, ub = self._read_file_datablocks(
+                filename, self._prune_channels, scans[filename]
+            )
             metadata["filenames"] = [filename]
             streams = {}
             for stream_name, channel_name_start, stream_id in self.STREAM_CHANNELS:
@@ -652,6 +688,10 @@ class AlphaOmegaRawIO(BaseRawIO):
         # We merge segments after having loading all the files because they
         # could be loaded in any order
         self._merge_segments()
+        for segment in self._segments:
+            for stream in segment["streams"].values():
+                for channel in stream.values():
+                    channel["blocks"] = _build_block_index(channel["positions"])
 
         buffer_id = ""
         signal_streams = set(
@@ -777,10 +817,7 @@ class AlphaOmegaRawIO(BaseRawIO):
 
     def _get_signal_size(self, block_index, seg_index, stream_index):
         stream_id = self.header["signal_streams"][stream_index]["id"]
-        sizes = [
-            sum(sample[2] for sample_by_file in channel["positions"].values() for sample in sample_by_file)
-            for channel in self._segments[seg_index]["streams"][stream_id].values()
-        ]
+        sizes = [channel["blocks"]["size"] for channel in self._segments[seg_index]["streams"][stream_id].values()]
         if not all(s == sizes[0] for s in sizes):
             raise NeoReadWriteError("The sizes of signals must be the same to get signal size")
         return sizes[0]
@@ -798,58 +835,46 @@ class AlphaOmegaRawIO(BaseRawIO):
         mask = self.header["signal_channels"]["stream_id"] == stream_id
         channel_ids = self.header["signal_channels"][mask]["id"][channel_indexes].flatten()
 
-        # the data refers to timestamp (see docstrings) which does not start at
-        # 0 but at time_start (see type H docstring)
-        first_pos = []
+        # for each channel, select the data blocks overlapping the requested
+        # window with a binary search on the block index built in parse_header
+        selections = []
         for channel_id in channel_ids:
-            channel_id = int(channel_id)
-            first_pos.append(
-                min(
-                    p[0]
-                    for f in self._segments[seg_index]["streams"][stream_id][channel_id]["positions"].values()
-                    for p in f
-                )
-            )
-
-        # now we need to get all file data block indexes for the signal and
-        # timestamp we want
-        file_chunks = defaultdict(list)
-        for i, channel_id in enumerate(channel_ids):
-            channel_id = int(channel_id)
-            effective_start = i_start + first_pos[i]
-            effective_stop = i_stop + first_pos[i]
-            for filename, positions in self._segments[seg_index]["streams"][stream_id][channel_id]["positions"].items():
-                file_chunks[filename].extend(
-                    [(i, *p) for p in positions if p[0] + p[2] > effective_start and p[0] < effective_stop]
-                )
+            index = self._segments[seg_index]["streams"][stream_id][int(channel_id)]["blocks"]
+            # the data refers to timestamp (see docstrings) which does not start at
+            # 0 but at time_start (see type H docstring)
+            starts = index["blocks"]["sample_number"] - index["blocks"]["sample_number"][0]
+            lo = np.searchsorted(index["block_ends"] - index["blocks"]["sample_number"][0], i_start, side="right")
+            hi = np.searchsorted(starts, i_stop, side="left")
+            selected = np.arange(lo, hi)
+            # block_ends is the running maximum of the block ends so a few
+            # blocks in [lo, hi) could still end before i_start
+            selected = selected[starts[selected] + index["blocks"]["length"][selected] > i_start]
+            selections.append((index, starts, selected))
 
         # we almost surely loaded more than asked (because the blocks are not
         # contiguous) so we need to know where to cut the results
-        slices_channels = []
-        for channel_index, channel_id in enumerate(channel_ids):
-            channel_id = int(channel_id)
-            min_pos = (
-                min(p[0] for f in file_chunks.values() for i, *p in f if i == channel_index) - first_pos[channel_index]
-            )
-            max_pos = (
-                max(p[0] + p[2] for f in file_chunks.values() for i, *p in f if i == channel_index)
-                - first_pos[channel_index]
-            )
-            slices_channels.append((min_pos, max_pos))
-        min_size = min(s[0] for s in slices_channels)
-        max_size = max(s[1] for s in slices_channels)
+        min_size = min(int(starts[selected].min()) for index, starts, selected in selections)
+        max_size = max(
+            int((starts[selected] + index["blocks"]["length"][selected]).max())
+            for index, starts, selected in selections
+        )
         sigs = np.ndarray((max_size - min_size, len(channel_ids)), dtype=np.short)
 
-        for filename in file_chunks:
+        for channel_index, (index, starts, selected) in enumerate(selections):
+            blocks = index["blocks"][selected]
+            sig_offsets = starts[selected] - min_size
             # we sort by chunk position in the file because we want to optimize
             # IO access and possibly read in sequential access. This is mainly
             # true for hard drives but shouldn't hurt flash memory
-            file_chunks[filename].sort(key=lambda x: x[2])
-        for filename in file_chunks:
-            for channel_index, chunk_index, file_position, chunk_size in file_chunks[filename]:
-                sig_offset = chunk_index - first_pos[channel_index] - min_size
+            order = np.lexsort((blocks["offset"], blocks["file"]))
+            for file_index, file_position, chunk_size, sig_offset in zip(
+                blocks["file"][order].tolist(),
+                blocks["offset"][order].tolist(),
+                blocks["length"][order].tolist(),
+                sig_offsets[order].tolist(),
+            ):
                 sigs[sig_offset : sig_offset + chunk_size, channel_index] = np.frombuffer(
-                    self._opened_files[filename]["mmap"],
+                    self._opened_files[index["files"][file_index]]["mmap"],
                     dtype=np.short,
                     count=chunk_size,
                     offset=file_position,
@@ -871,9 +896,8 @@ class AlphaOmegaRawIO(BaseRawIO):
                 t_stop = self._segment_t_stop(block_index, seg_index)
             effective_start = t_start * spikes["sample_rate"]
             effective_stop = t_stop * spikes["sample_rate"]
-            timestamps = np.array(
-                [p[0] for f in spikes["positions"].values() for p in f if effective_start <= p[0] <= effective_stop]
-            )
+            timestamps = np.concatenate([f["sample_number"] for f in spikes["positions"].values()])
+            timestamps = timestamps[(effective_start <= timestamps) & (timestamps <= effective_stop)]
         else:
             timestamps = np.array([], dtype=np.uint32)
         return timestamps
@@ -889,10 +913,10 @@ class AlphaOmegaRawIO(BaseRawIO):
         #  nb_spikes = self._spike_count(block_index, seg_index, spike_channel_index)
         nb_spikes = self._get_spike_timestamps(block_index, seg_index, spike_channel_index, t_start, t_stop).size
         spikes = self._segments[seg_index]["spikes"][spike_id]
-        spike_length = {p[2] for f in spikes["positions"].values() for p in f}
+        spike_length = np.unique(np.concatenate([f["length"] for f in spikes["positions"].values()]))
         if len(spike_length) != 1:
             raise ValueError(f"The len of `spike_length` must be 1 not {len(spike_length)}")
-        spike_length = spike_length.pop()
+        spike_length = int(spike_length[0])
         waveforms = np.ndarray((nb_spikes, spike_length), dtype=np.short)
         if t_start is None:
             t_start = self._segment_t_start(block_index, seg_index)
@@ -901,16 +925,16 @@ class AlphaOmegaRawIO(BaseRawIO):
         effective_start = t_start * spikes["sample_rate"]
         effective_stop = t_stop * spikes["sample_rate"]
         i = 0
-        for filename in spikes["positions"]:
-            for timestamp, file_position, length in spikes["positions"][filename]:
-                if effective_start <= timestamp <= effective_stop:
-                    waveforms[i, :length] = np.frombuffer(
-                        self._opened_files[filename]["mmap"],
-                        dtype=np.short,
-                        count=length,
-                        offset=file_position,
-                    )
-                    i += 1
+        for filename, positions in spikes["positions"].items():
+            mask = (effective_start <= positions["sample_number"]) & (positions["sample_number"] <= effective_stop)
+            for file_position, length in zip(positions["offset"][mask].tolist(), positions["length"][mask].tolist()):
+                waveforms[i, :length] = np.frombuffer(
+                    self._opened_files[filename]["mmap"],
+                    dtype=np.short,
+                    count=length,
+                    offset=file_position,
+                )
+                i += 1
         waveforms.shape = nb_spikes, 1, spike_length
         return waveforms
 
@@ -957,6 +981,118 @@ class AlphaOmegaRawIO(BaseRawIO):
         pass
 
 
+def scan_mpx_datablocks(filename):
+    """Locate all the datablocks of an AlphaOmega MPX file and decode the
+    headers of its channel data datablocks.
+
+    Each datablock starts with its length, so the datablocks are located by
+    walking through the length fields only. The channel data datablocks (type 5),
+    which make up almost all of the file, are then decoded in batches by
+    gathering their bytes into a structured array.
+
+    :param filename: the MPX filename to scan
+    :type filename: Path-like object or str
+    :return: a dict of compact arrays (which can be pickled, e.g. to be cached):
+        - block_positions, block_lengths, block_types: position in the file,
+          length and type of all datablocks following the first one (type h)
+        - channel_data: the :attr:`ChannelDataBlockHeader` of each channel data
+          datablock, in file order
+    """
+    unpack_length = struct.Struct("<H").unpack_from
+    with open(filename, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            positions = []
+            append = positions.append
+            pos = unpack_length(mm, 0)[0]
+            length = unpack_length(mm, pos)[0]
+            # The stop condition for reading MPX datablocks is base on the
+            # length of the block: if the block has length 65535 (or -1 in
+            # signed integer value) we know we have reached the end of the file
+            while length != 65535:
+                append(pos)
+                pos += length
+                length = unpack_length(mm, pos)[0]
+
+            data = np.frombuffer(mm, dtype=np.uint8)
+            positions = np.array(positions, dtype=np.int64)
+            headers = _gather_structs(data, positions, HeaderTypeDtype)
+            is_channel_data = headers["block_type"] == b"5"
+            channel_positions = positions[is_channel_data]
+            channel_headers = _gather_structs(data, channel_positions, SDataChannelHeaderDtype)
+            # for analog channels the first sample number ends the datablock
+            first_sample_numbers = _gather_structs(
+                data, channel_positions + channel_headers["length"] - 4, SDataChannel_sample_id_dtype
+            )
+            del data
+
+    channel_data = np.zeros(channel_positions.size, dtype=ChannelDataBlockHeader)
+    channel_data["position"] = channel_positions
+    for name in ("length", "unit_number", "channel_number", "payload"):
+        channel_data[name] = channel_headers[name]
+    channel_data["first_sample_number"] = first_sample_numbers
+    return {
+        "block_positions": positions,
+        "block_lengths": headers["length"],
+        "block_types": headers["block_type"],
+        "channel_data": channel_data,
+    }
+
+
+def _merge_positions(positions, other_positions):
+    """Append the :attr:`DataBlockPosition` arrays of `other_positions` to
+    `positions`, both being dictionaries indexed by filename
+    """
+    for filename, other in other_positions.items():
+        if filename in positions:
+            positions[filename] = np.concatenate([positions[filename], other])
+        else:
+            positions[filename] = other
+
+
+def _build_block_index(positions):
+    """Build the index of the data blocks of an analog channel, sorted by
+    sample number so that the blocks overlapping a window can be found with a
+    binary search
+
+    :param positions: the :attr:`DataBlockPosition` arrays of the channel
+        indexed by filename
+    :return: a dictionary with:
+        - files: the filenames, referenced by their index in the blocks
+        - blocks: the :attr:`DataBlockIndex` array sorted by sample number
+        - block_ends: running maximum of the end sample number of the blocks,
+          which is sorted even if some blocks overlap
+        - size: the total number of samples of the channel
+    """
+    files = list(positions)
+    blocks = np.empty(sum(p.size for p in positions.values()), dtype=DataBlockIndex)
+    i = 0
+    for file_index, filename in enumerate(files):
+        p = positions[filename]
+        block = blocks[i : i + p.size]
+        block["file"] = file_index
+        for field in DataBlockPosition.names:
+            block[field] = p[field]
+        i += p.size
+    blocks = blocks[np.argsort(blocks["sample_number"], kind="stable")]
+    return {
+        "files": files,
+        "blocks": blocks,
+        "block_ends": np.maximum.accumulate(blocks["sample_number"] + blocks["length"]),
+        "size": int(blocks["length"].sum()),
+    }
+
+
+def _gather_structs(data, positions, dtype, batch_size=2**18):
+    """Decode the structures of `dtype` starting at each of `positions` in the bytes `data`"""
+    out = np.empty(len(positions), dtype=dtype)
+    offsets = np.arange(dtype.itemsize)
+    for i in range(0, len(positions), batch_size):
+        # clip to the end of data in case the last structures are truncated
+        indexes = np.minimum(positions[i : i + batch_size, np.newaxis] + offsets, data.size - 1)
+        out[i : i + batch_size] = data[indexes].view(dtype)[:, 0]
+    return out
+
+
 def decode_string(encoded_string):
     """According to AlphaOmega engineers, all strings are NULL terminated and
     ASCII encoded"""
@@ -1134,6 +1270,56 @@ Then for digital ports:
     release and could break this reader.
 """
 
+HeaderTypeDtype = np.dtype([("length", "<u2"), ("block_type", "S1")])
+"""Same as :attr:`HeaderType`, to decode many datablock headers at once"""
+
+SDataChannelHeaderDtype = np.dtype(
+    [
+        ("length", "<u2"),
+        ("block_type", "S1"),
+        ("unit_number", "u1"),
+        ("channel_number", "<i2"),
+        ("payload", "V6"),
+    ]
+)
+"""Type 5 datablock, to decode many datablocks at once: :attr:`HeaderType` and
+:attr:`SDataChannel` followed by the first 6 bytes of data, which hold the
+whole data of digital channels (:attr:`SDataChannelDigitalDtype`) and ports
+(:attr:`SDataChannelPortDtype`)
+"""
+SDataChannel_sample_id_dtype = np.dtype("<u4")
+SDataChannelDigitalDtype = np.dtype([("sample_number", "<u4"), ("value", "<i2")])
+SDataChannelPortDtype = np.dtype([("value", "<u2"), ("sample_number", "<u4")])
+
+ChannelDataBlockHeader = np.dtype(
+    [
+        ("position", "<i8"),
+        ("length", "<u2"),
+        ("unit_number", "u1"),
+        ("channel_number", "<i2"),
+        ("payload", "V6"),
+        ("first_sample_number", "<u4"),
+    ]
+)
+"""Decoded type 5 datablock as returned by :func:`scan_mpx_datablocks`:
+    - position (long): offset of the datablock from beginning of file
+    - length, unit_number, channel_number, payload: see :attr:`SDataChannelHeaderDtype`
+    - first_sample_number (ulong): see :attr:`SDataChannel_sample_id`, only
+      meaningful for analog channels
+"""
+
+DataBlockPosition = np.dtype([("sample_number", "<i8"), ("offset", "<i8"), ("length", "<i8")])
+"""Position of the data of an analog channel datablock in an mpx file:
+    - sample_number (long): see :attr:`SDataChannel_sample_id`
+    - offset (long): offset of the data from beginning of file
+    - length (long): number of samples in the datablock
+"""
+
+DataBlockIndex = np.dtype([("sample_number", "<i8"), ("file", "<i8"), ("offset", "<i8"), ("length", "<i8")])
+"""Same as :attr:`DataBlockPosition` with the index of the file in the list of
+files of the channel, see :func:`_build_block_index`
+"""
+
 SAOEvent = struct.Struct("<cL")
 """Type E: stream data datablock:
     - type_event (char): event type only b"S" for now
@@ -71,7 +71,7 @@ class AxonaRawIO(BaseRawIO):
 
     # In the .bin file, channels are arranged in a strange order.
     # This list takes a channel index as input and returns the actual
-    # offset for the channel in the memory map (self._raw_signals).
+    # offset for the channel in the samples of a packet (self._raw_signals).
     channel_memory_offset = [
         32,
         33,
@@ -211,12 +211,20 @@ class AxonaRawIO(BaseRawIO):
             bin_dict["num_total_packets"] = num_tot_packets
             bin_dict["num_total_samples"] = num_tot_packets * 3
 
-            # Create np.memmap to .bin file
+            # Create np.memmap to .bin file, one element per packet
+            packet_dtype = np.dtype(
+                [
+                    ("head", f"V{bin_dict['bytes_head']}"),
+                    ("samples", bin_dict["data_type"], (3, 64)),
+                    ("tail", f"V{bin_dict['bytes_tail']}"),
+                ]
+            )
             self._raw_signals = np.memmap(
                 self.bin_file,
-                dtype=self.file_parameters["bin"]["data_type"],
+                dtype=packet_dtype,
                 mode="r",
                 offset=self.file_parameters["bin"]["header_size"],
+                shape=(num_tot_packets,),
             )
 
             signal_streams = self._get_signal_streams_header()
@@ -354,17 +362,14 @@ class AxonaRawIO(BaseRawIO):
         Return raw (continuous) signals as 2d numpy array (time x chan).
         Note that block_index and seg_index are always 1 (regardless of input).
 
-        Raw data is in a single vector np.memmap with the following structure:
+        Raw data is a np.memmap of byte packets with the following structure:
 
         Each byte packet (432 bytes) has header (32 bytes), footer (16 bytes)
         and three samples of 2 bytes each for 64 channels (384 bytes), which
         are jumbled up in a strange order. Each channel is remapped to a
-        certain position (see get_channel_offset), and a channel's samples are
-        allocated as follows (example for channel 7):
-
-        sample 1: 32b (head) + 2*38b (remappedID) and 2*38b + 1b (2nd byte)
-        sample 2: 32b (head) + 128 (all chan. 1st entry) + 2*38b and ...
-        sample 3: 32b (head) + 128*2 (all channels 1st and 2nd entry) + ...
+        certain position (see channel_memory_offset), so the data of a packet
+        is a (3 samples x 64 positions) array and the samples of a channel are
+        found at its remapped position, e.g. position 38 for channel 7.
         """
 
         bin_dict = self.file_parameters["bin"]
@@ -380,31 +385,19 @@ class AxonaRawIO(BaseRawIO):
             channel_indexes = self._get_active_channels()
 
         num_samples = i_stop - i_start
-
-        # Create base index vector for _raw_signals for time period of interest
-        num_packets_oi = (num_samples + 2) // 3
-        offset = i_start // 3 * (bin_dict["bytes_packet"] // 2)
-        rem = i_start % 3
-
-        raw_samples = np.arange(num_packets_oi + 1, dtype=np.uint64)
-        sample1 = raw_samples * (bin_dict["bytes_packet"] // 2) + bin_dict["bytes_head"] // 2 + offset
-        sample2 = sample1 + 64
-        sample3 = sample2 + 64
-
-        sig_ids = np.empty((sample1.size + sample2.size + sample3.size,), dtype=sample1.dtype)
-        sig_ids[0::3] = sample1
-        sig_ids[1::3] = sample2
-        sig_ids[2::3] = sample3
-        sig_ids = sig_ids[rem : (rem + num_samples)]
-
-        # Read one channel at a time
-        raw_signals = np.ndarray(shape=(num_samples, len(channel_indexes)), dtype=bin_dict["data_type"])
-
-        for i, ch_idx in enumerate(channel_indexes):
-            chan_offset = self.channel_memory_offset[ch_idx]
-            raw_signals[:, i] = self._raw_signals[np.uint64(sig_ids) + chan_offset]
-
-        return raw_signals
+        chan_offsets = np.asarray(self.channel_memory_offset)[channel_indexes]
+
+        # Select the whole packets covering the time period of interest and
+        # extract all channels at once through the remapping table
+        first_packet = i_start // 3
+        stop_packet = -(-i_stop // 3)
+        samples = self._raw_signals["samples"][first_packet:stop_packet]
+        raw_signals = np.empty((samples.shape[0], 3, chan_offsets.size), dtype=bin_dict["data_type"])
+        np.take(samples, chan_offsets, axis=2, out=raw_signals, mode="clip")
+        raw_signals = raw_signals.reshape(-1, chan_offsets.size)
+        rem = i_start - first_packet * 3
+
+        return raw_signals[rem : rem + num_samples]
 
     def _spike_count(self, block_index, seg_index, unit_index):
         tetrode_id = unit_index
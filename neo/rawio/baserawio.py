@@ -74,11 +74,12 @@ import logging
 import numpy as np
 import os
 import sys
+import time
 from typing import Literal
 
 from neo import logging_handler
 
-from .utils import get_memmap_chunk_from_opened_file
+from .utils import get_memmap_chunk_from_opened_file, get_memmap_shape
 
 possible_raw_modes = [
     "one-file",
@@ -1083,6 +1084,144 @@ class BaseRawIO:
 
         return float_signal
 
+    def refresh(self):
+        """
+        Updates the signal sizes of a recording that is still being written.
+
+        Only the sizes (and the segment t_stop) are updated, the header is not parsed
+        again, so this is cheap enough to be called repeatedly while following a
+        live recording. Samples of an incomplete trailing frame are ignored until
+        they are fully written.
+
+        Returns
+        -------
+        grown: bool
+            True if any signal grew since the header was parsed or the last refresh
+
+        Notes
+        -----
+        Only some readers support this, others raise a NotImplementedError
+        """
+        return self._refresh()
+
+    def follow_analogsignal_chunks(
+        self,
+        block_index: int = 0,
+        seg_index: int = 0,
+        stream_index: int | None = None,
+        i_start: int = 0,
+        chunk_size: int | None = None,
+        poll_interval: float = 0.1,
+        timeout: float | None = None,
+        channel_indexes: list[int] | None = None,
+        channel_names: list[str] | None = None,
+        channel_ids: list[str] | None = None,
+    ):
+        """
+        Iterates over the raw samples of a stream as they are written to disk.
+
+        The reader is refreshed (see `refresh()`) every `poll_interval` seconds and each
+        new block of samples is yielded as soon as it is available, so a recording can
+        be followed while it is acquired.
+
+        Parameters
+        ----------
+        block_index: int, default: 0
+            The block with the desired analog signal
+        seg_index: int, default: 0
+            The segment containing the desired analog signal
+        stream_index: int | None, default: None
+            The index of the stream containing the channels to follow
+            This is required for data with multiple streams
+        i_start: int, default: 0
+            The index of the first sample to yield, use the current signal size to only get new samples
+        chunk_size: int | None, default: None
+            The maximum number of samples per chunk, all available samples are yielded at once if None
+        poll_interval: float, default: 0.1
+            The time in seconds to wait before refreshing again when no new samples are available
+        timeout: float | None, default: None
+            Stop iterating when no new samples were written for `timeout` seconds, never stop if None
+        channel_indexes: list[int] | np.array[int]|  slice | None, default: None
+            The list of indexes of channels to retrieve, see `get_analogsignal_chunk()`
+        channel_names: list[str] | None, default: None
+            The list of channel names to retrieve, see `get_analogsignal_chunk()`
+        channel_ids: list[str] | None, default: None
+            The list of channel_ids to retrieve, see `get_analogsignal_chunk()`
+
+        Yields
+        ------
+        i_start: int
+            The index of the first sample of the chunk
+        raw_chunk: np.array (n_samples, n_channels)
+            The array with the raw signal samples
+
+        Examples
+        --------
+        >>> rawio_reader.parse_header()
+        >>> for i_start, raw_chunk in rawio_reader.follow_analogsignal_chunks(stream_index=0, timeout=10.0):
+        ...     process(raw_chunk)
+        """
+        last_data_time = time.monotonic()
+        while True:
+            i_stop = self._next_followed_sample(block_index, seg_index, stream_index, i_start, chunk_size)
+            if i_stop > i_start:
+                raw_chunk = self.get_analogsignal_chunk(
+                    block_index, seg_index, i_start, i_stop, stream_index, channel_indexes, channel_names, channel_ids
+                )
+                yield i_start, raw_chunk
+                i_start = i_stop
+                last_data_time = time.monotonic()
+            elif timeout is not None and time.monotonic() - last_data_time >= timeout:
+                return
+            else:
+                time.sleep(poll_interval)
+
+    async def afollow_analogsignal_chunks(
+        self,
+        block_index: int = 0,
+        seg_index: int = 0,
+        stream_index: int | None = None,
+        i_start: int = 0,
+        chunk_size: int | None = None,
+        poll_interval: float = 0.1,
+        timeout: float | None = None,
+        channel_indexes: list[int] | None = None,
+        channel_names: list[str] | None = None,
+        channel_ids: list[str] | None = None,
+    ):
+        """
+        Asynchronous version of `follow_analogsignal_chunks()` to be used with `async for`.
+
+        The waits between refreshes do not block the event loop, reading the new samples
+        is done synchronously as it only maps the newly written part of the files.
+        """
+        import asyncio
+
+        last_data_time = time.monotonic()
+        while True:
+            i_stop = self._next_followed_sample(block_index, seg_index, stream_index, i_start, chunk_size)
+            if i_stop > i_start:
+                raw_chunk = self.get_analogsignal_chunk(
+                    block_index, seg_index, i_start, i_stop, stream_index, channel_indexes, channel_names, channel_ids
+                )
+                yield i_start, raw_chunk
+                i_start = i_stop
+                last_data_time = time.monotonic()
+            elif timeout is not None and time.monotonic() - last_data_time >= timeout:
+                return
+            else:
+                await asyncio.sleep(poll_interval)
+
+    def _next_followed_sample(self, block_index, seg_index, stream_index, i_start, chunk_size):
+        # refresh only when the samples already known are consumed
+        i_stop = self.get_signal_size(block_index, seg_index, stream_index)
+        if i_stop <= i_start:
+            self.refresh()
+            i_stop = self.get_signal_size(block_index, seg_index, stream_index)
+        if chunk_size is not None:
+            i_stop = min(i_stop, i_start + chunk_size)
+        return i_stop
+
     # spiketrain and unit zone
     def spike_count(self, block_index: int = 0, seg_index: int = 0, spike_channel_index: int = 0):
         """
@@ -1421,7 +1560,9 @@ class BaseRawIO:
         # the hash of the resource (dir of file) is done with filename+datetime
         # TODO make something more sophisticated when rawmode='one-dir' that use all
         #  filename and datetime
-        d = dict(ressource_name=resource_name, mtime=os.path.getmtime(resource_name))
+        # multi-file resources can be a base name shared by the files, without a file of its own
+        mtime = os.path.getmtime(resource_name) if os.path.exists(resource_name) else None
+        d = dict(ressource_name=resource_name, mtime=mtime)
         hash = joblib.hash(d, hash_name="md5")
 
         # name is constructed from the resource_name and the hash
@@ -1504,6 +1645,9 @@ class BaseRawIO:
         """
         raise (NotImplementedError)
 
+    def _refresh(self):
+        raise NotImplementedError(f"{self.__class__.__name__} does not support refresh()")
+
     ###
     # spiketrain and unit zone
     def _spike_count(self, block_index: int, seg_index: int, spike_channel_index: int):
@@ -1574,6 +1718,37 @@ class BaseRawWithBufferApiIO(BaseRawIO):
         super().__init__(*arg, **kwargs)
         self._has_buffer_description_api = True
 
+    def _refresh_buffer_descriptions(self):
+        """
+        Update the shape of the raw (time, channels) buffers from the current size of their files.
+
+        Readers following growing files can call this in `_refresh()` and then update
+        what they derive from the buffer shapes. The chunks are mapped from the opened
+        files on each read so nothing else needs to be remapped.
+
+        Returns
+        -------
+        grown: bool
+            True if any buffer grew
+        """
+        grown = False
+        for seg_buffers in self._buffer_descriptions.values():
+            for buffers in seg_buffers.values():
+                for buffer_desc in buffers.values():
+                    if buffer_desc["type"] != "raw" or buffer_desc.get("time_axis", 0) != 0:
+                        raise NotImplementedError("Only raw buffers with time_axis=0 can be refreshed")
+                    shape = get_memmap_shape(
+                        buffer_desc["file_path"],
+                        buffer_desc["dtype"],
+                        num_channels=buffer_desc["shape"][1],
+                        offset=buffer_desc["file_offset"],
+                        truncate=True,
+                    )
+                    if shape[0] > buffer_desc["shape"][0]:
+                        buffer_desc["shape"] = shape
+                        grown = True
+        return grown
+
     def _get_signal_size(self, block_index, seg_index, stream_index):
         buffer_id = self.header["signal_streams"][stream_index]["buffer_id"]
         buffer_desc = self.get_analogsignal_buffer_description(block_index, seg_index, buffer_id)
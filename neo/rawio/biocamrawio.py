@@ -8,6 +8,9 @@ Authors: Alessio Buccino, Robert Wolff
 """
 
 import json
+import struct
+import warnings
+
 import numpy as np
 
 from .baserawio import (
@@ -19,9 +22,6 @@ from .baserawio import (
     _event_channel_dtype,
 )
 
-import numpy as np
-import json
-import warnings
 from neo.core import NeoReadWriteError
 
 
@@ -384,31 +384,64 @@ def decode_event_based_raw_data(rf, data, well_ID, start_frame, num_frames):
     events_end_pos = events_toc[toc_end_idx]
     # decode all data for the given well ID and time interval
     binary_data = rf[well_ID]["EventsBasedSparseRaw"][events_start_pos:events_end_pos]
-    binary_data_length = len(binary_data)
+
+    # first pass: the stream is made of channel blocks (uint32 channel index, uint32 block length)
+    # each holding ranges (uint64 first frame, uint64 frame after the last one) followed by
+    # one uint16 sample per frame, so only the headers need to be walked through
+    ch_indexes, range_starts, range_stops, range_positions = parse_event_based_raw_headers(binary_data)
+
+    # second pass: scatter the samples of all ranges into data, clipped to the requested frames
+    # all headers have an even number of bytes, so the samples are aligned on uint16 words
+    samples = np.frombuffer(binary_data, dtype="<u2", count=len(binary_data) // 2)
+    first = np.maximum(range_starts, start_frame)
+    last = np.minimum(range_stops, start_frame + num_frames)
+    keep = last > first
+    ch_indexes, range_starts, range_positions = ch_indexes[keep], range_starts[keep], range_positions[keep]
+    first, last = first[keep], last[keep]
+    lengths = last - first
+    # bound the size of the index arrays by scattering a limited number of samples at once
+    batch_bounds = np.searchsorted(np.cumsum(lengths), np.arange(0, lengths.sum(), 2**22), side="right")
+    batch_bounds = np.unique(np.concatenate([[0], batch_bounds, [lengths.size]]))
+    for b0, b1 in zip(batch_bounds[:-1], batch_bounds[1:]):
+        batch_lengths = lengths[b0:b1]
+        # position of each sample within its range
+        within = np.arange(batch_lengths.sum()) - np.repeat(np.cumsum(batch_lengths) - batch_lengths, batch_lengths)
+        frames = np.repeat(first[b0:b1], batch_lengths) + within
+        words = np.repeat(range_positions[b0:b1] // 2 + (first[b0:b1] - range_starts[b0:b1]), batch_lengths) + within
+        data[np.repeat(ch_indexes[b0:b1], batch_lengths), frames - start_frame] = samples[words]
+
+    return data
+
+
+def parse_event_based_raw_headers(binary_data):
+    """Locate the ranges of samples in a chunk of event based sparse raw data
+
+    Returns the channel index, first frame, frame after the last one and byte position
+    of the samples of every range, as arrays.
+    """
+    buffer = np.asarray(binary_data, dtype=np.uint8).tobytes()
+    binary_data_length = len(buffer)
+    ch_indexes, range_starts, range_stops, range_positions = [], [], [], []
     pos = 0
     while pos < binary_data_length:
-        ch_idx = int.from_bytes(binary_data[pos : pos + 4], byteorder="little")
-        pos += 4
-        ch_data_length = int.from_bytes(binary_data[pos : pos + 4], byteorder="little")
-        pos += 4
-        ch_data_pos = pos
-        while pos < ch_data_pos + ch_data_length:
-            from_inclusive = int.from_bytes(binary_data[pos : pos + 8], byteorder="little")
-            pos += 8
-            to_exclusive = int.from_bytes(binary_data[pos : pos + 8], byteorder="little")
-            pos += 8
-            range_data_pos = pos
-            for j in range(from_inclusive, to_exclusive):
-                if j >= start_frame + num_frames:
-                    break
-                if j >= start_frame:
-                    data[ch_idx][j - start_frame] = int.from_bytes(
-                        binary_data[range_data_pos : range_data_pos + 2], byteorder="little"
-                    )
-                range_data_pos += 2
+        ch_idx, ch_data_length = struct.unpack_from("<II", buffer, pos)
+        pos += 8
+        ch_data_end = pos + ch_data_length
+        while pos < ch_data_end:
+            from_inclusive, to_exclusive = struct.unpack_from("<QQ", buffer, pos)
+            pos += 16
+            ch_indexes.append(ch_idx)
+            range_starts.append(from_inclusive)
+            range_stops.append(to_exclusive)
+            range_positions.append(pos)
             pos += (to_exclusive - from_inclusive) * 2
 
-    return data
+    return (
+        np.array(ch_indexes, dtype="int64"),
+        np.array(range_starts, dtype="int64"),
+        np.array(range_stops, dtype="int64"),
+        np.array(range_positions, dtype="int64"),
+    )
 
 
 def generate_synthetic_noise(rf, data, well_ID, start_frame, num_frames):
@@ -439,26 +472,18 @@ def generate_synthetic_noise(rf, data, well_ID, start_frame, num_frames):
     noise_mean = rf[well_ID]["NoiseMean"][noise_start_pos:noise_end_pos]
     noise_std = rf[well_ID]["NoiseStdDev"][noise_start_pos:noise_end_pos]
 
-    noise_length = noise_end_pos - noise_start_pos
-    noise_info = {}
-    mean_collection = []
-    std_collection = []
-    for i in range(1, noise_length):
-        noise_info[noise_ch_idx[i]] = [noise_mean[i], noise_std[i]]
-        mean_collection.append(noise_mean[i])
-        std_collection.append(noise_std[i])
-    # calculate the median mean and standard deviation of all channels to be used for
-    # invalid channels
-    median_mean = np.median(mean_collection)
-    median_std = np.median(std_collection)
-    # fill with Gaussian noise
-    for ch_idx in range(len(data)):
-        if ch_idx in noise_info:
-            data[ch_idx] = np.array(
-                np.random.normal(noise_info[ch_idx][0], noise_info[ch_idx][1], num_frames), dtype=np.uint16
-            )
-        else:
-            data[ch_idx] = np.array(np.random.normal(median_mean, median_std, num_frames), dtype=np.uint16)
+    # the first entry is skipped
+    noise_ch_idx = noise_ch_idx[1:]
+    noise_mean = noise_mean[1:]
+    noise_std = noise_std[1:]
+    # the median mean and standard deviation of all channels are used for invalid channels
+    means = np.full(len(data), np.median(noise_mean))
+    stds = np.full(len(data), np.median(noise_std))
+    valid = noise_ch_idx < len(data)
+    means[noise_ch_idx[valid]] = noise_mean[valid]
+    stds[noise_ch_idx[valid]] = noise_std[valid]
+    # fill with Gaussian noise, all channels at once
+    data = np.random.normal(means[:, np.newaxis], stds[:, np.newaxis], data.shape).astype(np.uint16)
 
     # Assuming a 12-bit unsigned to signed conversion downstream, the baseline should read at 2048 raw
     # However, synthetic noise is generated with a baseline of 0, which requires an offset of + 2048
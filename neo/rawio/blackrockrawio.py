@@ -122,6 +122,11 @@ class BlackrockRawIO(BaseRawIO):
 
         - PTP format (v3.0-ptp): Gaps in per-sample timestamps
         - Standard format (v2.2/2.3/3.0): Gaps between data blocks
+    use_cache: bool, default: False
+        If True the gaps found in the per-sample timestamps of PTP nsX files are saved
+        in a cache file so that the timestamps do not need to be scanned again
+    cache_path: "same_as_resource" | "home", default: "same_as_resource"
+        Where the cache file is saved
 
     Notes
     -----
@@ -164,6 +169,8 @@ class BlackrockRawIO(BaseRawIO):
         load_nev=True,
         verbose=False,
         gap_tolerance_ms=None,
+        use_cache=False,
+        cache_path="same_as_resource",
     ):
         BaseRawIO.__init__(self)
 
@@ -192,6 +199,11 @@ class BlackrockRawIO(BaseRawIO):
         self._filenames["sif"] = self.filename
         self._filenames["ccf"] = self.filename
 
+        # the cache is named after the base filename so it can only be set up now
+        self.use_cache = use_cache
+        if use_cache:
+            self.setup_cache(cache_path)
+
         # check which files are available
         self._avail_files = dict.fromkeys(self.extensions, False)
         self._avail_nsx = []
@@ -722,6 +734,11 @@ class BlackrockRawIO(BaseRawIO):
         if isinstance(raw_timestamps, np.ndarray) and raw_timestamps.size == size:
             # PTP: real hardware timestamps
             ts_res = float(self._nsx_basic_header[nsx_nb]["timestamp_resolution"])
+            timestamp_step = self._nsx_data_header[nsx_nb][seg_index].get("timestamp_step")
+            if timestamp_step is not None:
+                # regular clock: computed from the gap table without reading the timestamps
+                indexes = np.arange(*slice(i_start, i_stop).indices(size), dtype="int64")
+                return (int(raw_timestamps[0]) + indexes * timestamp_step).astype("float64") / ts_res
             return raw_timestamps[i_start:i_stop].astype("float64") / ts_res
         else:
             # Non-PTP: reconstruct from t_start + index / sampling_rate
@@ -1223,8 +1240,9 @@ class BlackrockRawIO(BaseRawIO):
         npackets = int((filesize - header_size) / np.dtype(ptp_dt).itemsize)
         file_memmap = np.memmap(filename, dtype=ptp_dt, shape=npackets, offset=header_size, mode="r")
 
-        # Verify this is truly PTP (all packets should have 1 sample)
-        if not np.all(file_memmap["num_data_points"] == 1):
+        # Scan the timestamps for gaps, this also verifies this is truly PTP (all packets should have 1 sample)
+        timestamp_gaps = self._scan_ptp_timestamps(nsx_nb, filename, file_memmap)
+        if not timestamp_gaps["single_sample_packets"]:
             # Not actually PTP! Fall back to standard format
             return self._parse_nsx_data_v22_v30("3.0", nsx_nb)
 
@@ -1236,10 +1254,31 @@ class BlackrockRawIO(BaseRawIO):
             0: {
                 "data": data,
                 "timestamps": timestamps,
+                "timestamp_gaps": timestamp_gaps,
             }
         }
 
-    def _format_gap_report(self, gap_indices, timestamps_in_seconds, time_differences, nsx_nb):
+    def _scan_ptp_timestamps(self, nsx_nb, filename, file_memmap):
+        """
+        Get the gap table of the per-sample timestamps of a PTP nsX file with
+        scan_ptp_timestamps(), taken from (and saved into) the cache when it is used.
+
+        Gaps are detected with a strict threshold of 2x the sampling period, the
+        user tolerance is applied later in _segment_nsx_data().
+        """
+        stat = os.stat(filename)
+        cache_key = f"ptp_timestamp_gaps_ns{nsx_nb}_{stat.st_size}_{stat.st_mtime_ns}"
+        if self.use_cache and cache_key in self._cache:
+            return self._cache[cache_key]
+
+        timestamps_sampling_rate = float(self._nsx_basic_header[nsx_nb]["timestamp_resolution"])
+        gap_threshold = 2.0 * timestamps_sampling_rate / self._nsx_sampling_frequency[nsx_nb]
+        timestamp_gaps = scan_ptp_timestamps(file_memmap, gap_threshold)
+        if self.use_cache:
+            self.add_in_cache(**{cache_key: timestamp_gaps})
+        return timestamp_gaps
+
+    def _format_gap_report(self, gap_indices, gap_positions_seconds, gap_durations_seconds, nsx_nb):
         """
         Format a detailed gap report showing where timestamp discontinuities occur.
 
@@ -1247,10 +1286,10 @@ class BlackrockRawIO(BaseRawIO):
         ----------
         gap_indices : np.ndarray
             Indices where gaps were detected
-        timestamps_in_seconds : np.ndarray
-            All timestamps converted to seconds
-        time_differences : np.ndarray
-            Time differences between consecutive timestamps
+        gap_positions_seconds : np.ndarray
+            Time of the sample before each gap, relative to the first sample
+        gap_durations_seconds : np.ndarray
+            Time differences between the timestamps across each gap
         nsx_nb : int
             NSX file number for the report
 
@@ -1260,9 +1299,7 @@ class BlackrockRawIO(BaseRawIO):
             Formatted gap report with table
         """
         # Calculate gap details
-        gap_durations_seconds = time_differences[gap_indices]
         gap_durations_ms = gap_durations_seconds * 1000
-        gap_positions_seconds = timestamps_in_seconds[gap_indices] - timestamps_in_seconds[0]
 
         # Build gap detail table
         gap_detail_lines = [
@@ -1333,23 +1370,22 @@ class BlackrockRawIO(BaseRawIO):
             data = block_info["data"]
             timestamps = block_info["timestamps"]
 
-            # PTP format: array of timestamps - need to detect gaps
+            # PTP format: array of timestamps - gaps were detected (with a strict 2x sampling
+            # period threshold) by scanning the integer timestamps when parsing the file
             if isinstance(timestamps, np.ndarray):
-                # Analyze timestamp gaps
-                sampling_rate = self._nsx_sampling_frequency[nsx_nb]
-
-                # Detection threshold: use strict 2x sampling period to find ALL gaps
-                detection_threshold = 2.0 / sampling_rate
-
-                timestamps_sampling_rate = self._nsx_basic_header[nsx_nb]["timestamp_resolution"]
-                timestamps_in_seconds = timestamps / timestamps_sampling_rate
-
-                time_differences = np.diff(timestamps_in_seconds)
-                gap_indices = np.argwhere(time_differences > detection_threshold).flatten()
+                timestamp_gaps = block_info["timestamp_gaps"]
+                timestamps_sampling_rate = float(self._nsx_basic_header[nsx_nb]["timestamp_resolution"])
+                gap_indices = timestamp_gaps["gap_indices"]
+                gap_durations_seconds = timestamp_gaps["gap_durations"] / timestamps_sampling_rate
 
                 # If gaps found, check user's tolerance
                 if len(gap_indices) > 0:
-                    gap_report = self._format_gap_report(gap_indices, timestamps_in_seconds, time_differences, nsx_nb)
+                    gap_positions_seconds = (
+                        timestamp_gaps["gap_timestamps"] - np.int64(timestamps[0])
+                    ) / timestamps_sampling_rate
+                    gap_report = self._format_gap_report(
+                        gap_indices, gap_positions_seconds, gap_durations_seconds, nsx_nb
+                    )
 
                     # Error by default - user must opt-in to segmentation
                     if self.gap_tolerance_ms is None:
@@ -1362,11 +1398,17 @@ class BlackrockRawIO(BaseRawIO):
 
                     # User provided tolerance - filter gaps and segment
                     gap_tolerance_s = self.gap_tolerance_ms / 1000.0
-                    significant_gap_mask = time_differences[gap_indices] > gap_tolerance_s
-                    significant_gap_indices = gap_indices[significant_gap_mask]
+                    significant_gap_mask = gap_durations_seconds > gap_tolerance_s
+                else:
+                    significant_gap_mask = np.zeros(0, dtype=bool)
 
-                    # Use significant gaps for segmentation (no warning - user opted in)
-                    gap_indices = significant_gap_indices
+                # Use significant gaps for segmentation (no warning - user opted in)
+                # The runs of samples between detected gaps are numbered like the gaps
+                # so segment k covers the runs first_runs[k] to last_runs[k]
+                significant_gaps = np.flatnonzero(significant_gap_mask)
+                gap_indices = gap_indices[significant_gaps]
+                first_runs = np.hstack((0, significant_gaps + 1))
+                last_runs = np.hstack((significant_gaps, len(significant_gap_mask)))
 
                 # Create segments based on gaps
                 segment_starts = np.hstack((0, gap_indices + 1))
@@ -1375,9 +1417,19 @@ class BlackrockRawIO(BaseRawIO):
                 for seg_idx, start in enumerate(segment_starts):
                     end = segment_boundaries[seg_idx + 1]
 
+                    # a segment made of a single run with a constant step has a regular
+                    # clock so its timestamps can be computed instead of read
+                    first_run, last_run = first_runs[seg_idx], last_runs[seg_idx]
+                    min_step = timestamp_gaps["min_steps"][first_run]
+                    if first_run == last_run and min_step == timestamp_gaps["max_steps"][first_run]:
+                        timestamp_step = int(min_step)
+                    else:
+                        timestamp_step = None
+
                     segments[seg_idx] = {
                         "data": data[start:end],
                         "timestamp": timestamps[start:end],  # Use singular for backward compatibility
+                        "timestamp_step": timestamp_step,
                         "nb_data_points": end - start,
                         "header": None,  # PTP has no headers
                         "offset_to_data_block": None,
@@ -2659,3 +2711,76 @@ NSX_DATA_HEADER_TYPES = {
         ("samples", "int16", (channel_count,)),
     ],
 }
+
+
+def scan_ptp_timestamps(packets, gap_threshold, chunk_size=2**22):
+    """
+    Scan the per-sample timestamps of a PTP nsX file chunk by chunk to build its gap table.
+
+    Timestamps are compared as integers (in timestamp_resolution units) so neither a
+    float copy nor a difference array of the whole recording is ever allocated.
+
+    Parameters
+    ----------
+    packets : np.ndarray
+        The packets of the file (see NSX_DATA_HEADER_TYPES["3.0-ptp"]), usually a memmap
+    gap_threshold : float
+        A difference between consecutive timestamps larger than this is a gap
+    chunk_size : int, default: 2**22
+        Number of packets read at once
+
+    Returns
+    -------
+    dict
+        - single_sample_packets: whether all packets hold a single sample (true PTP files)
+        - gap_indices: index of the last sample before each gap
+        - gap_timestamps: timestamp of the last sample before each gap
+        - gap_durations: timestamp difference across each gap
+        - min_steps, max_steps: smallest and largest timestamp difference within each run
+          of samples between gaps (there is one more run than gaps), 0 for single sample runs
+    """
+    single_sample_packets = True
+    gap_indices, gap_timestamps, gap_durations = [], [], []
+    min_steps, max_steps = [], []
+    run_min = run_max = None
+    previous_timestamp = None
+    for start in range(0, packets.shape[0], chunk_size):
+        chunk = packets[start : start + chunk_size]
+        single_sample_packets = single_sample_packets and bool(np.all(chunk["num_data_points"] == 1))
+
+        timestamps = chunk["timestamps"].astype("int64")
+        if previous_timestamp is None:
+            first_index = start
+        else:
+            # overlap by one timestamp to get the difference across chunks
+            timestamps = np.concatenate(([previous_timestamp], timestamps))
+            first_index = start - 1
+        previous_timestamp = timestamps[-1]
+
+        steps = np.diff(timestamps)
+        gaps = np.flatnonzero(steps > gap_threshold)
+        run_bounds = np.concatenate(([-1], gaps, [steps.size]))
+        for i in range(run_bounds.size - 1):
+            run = steps[run_bounds[i] + 1 : run_bounds[i + 1]]
+            if run.size:
+                run_min = run.min() if run_min is None else min(run_min, run.min())
+                run_max = run.max() if run_max is None else max(run_max, run.max())
+            if i < gaps.size:
+                # the run ends at a gap
+                min_steps.append(0 if run_min is None else run_min)
+                max_steps.append(0 if run_max is None else run_max)
+                run_min = run_max = None
+        gap_indices.append(gaps + first_index)
+        gap_timestamps.append(timestamps[gaps])
+        gap_durations.append(steps[gaps])
+    min_steps.append(0 if run_min is None else run_min)
+    max_steps.append(0 if run_max is None else run_max)
+
+    return {
+        "single_sample_packets": single_sample_packets,
+        "gap_indices": np.concatenate(gap_indices or [np.zeros(0, dtype="int64")]).astype("int64"),
+        "gap_timestamps": np.concatenate(gap_timestamps or [np.zeros(0, dtype="int64")]),
+        "gap_durations": np.concatenate(gap_durations or [np.zeros(0, dtype="int64")]),
+        "min_steps": np.array(min_steps, dtype="int64"),
+        "max_steps": np.array(max_steps, dtype="int64"),
+    }
@@ -10,6 +10,8 @@ EDF Format Specifications: https://www.edfplus.info/
 Author: Julia Sprenger
 """
 
+import os
+
 import numpy as np
 
 try:
@@ -69,6 +71,7 @@ class EDFRawIO(BaseRawIO):
 
         self.signal_headers = []
         self.edf_header = {}
+        self._raw_records = None
 
     def _source_name(self):
         return self.filename
@@ -188,6 +191,57 @@ class EDFRawIO(BaseRawIO):
 
         self.close()
 
+        # the signals are read directly from the data records, pyedflib is only used for the headers
+        self._parse_data_record_layout()
+
+    def _parse_data_record_layout(self):
+        """
+        Build the structured dtype of an EDF data record from the raw file header.
+
+        Each data record holds, one signal after the other, a fixed number of int16 samples
+        per signal, so the data records can be memory mapped as an array of this dtype.
+        Annotation signals of EDF+ files are part of the data records but are not exposed
+        as channels by pyedflib, `self._channel_fields` maps each channel to its field.
+        """
+        with open(self.filename, "rb") as f:
+            fixed_header = f.read(256)
+            num_signals = int(fixed_header[252:256])
+            signal_header = f.read(num_signals * 256)
+
+        is_edf_plus = fixed_header[192:236].decode("ascii").startswith("EDF+")
+        header_bytes = int(fixed_header[184:192])
+
+        def signal_field(offset, size):
+            start = num_signals * offset
+            return [signal_header[start + i * size : start + (i + 1) * size] for i in range(num_signals)]
+
+        labels = [label.decode("latin-1").strip() for label in signal_field(0, 16)]
+        samples_per_record = [int(n) for n in signal_field(216, 8)]
+
+        self._record_dtype = np.dtype([(f"signal_{i}", "<i2", (n,)) for i, n in enumerate(samples_per_record)])
+        self._channel_fields = [
+            f"signal_{i}" for i, label in enumerate(labels) if not (is_edf_plus and label == "EDF Annotations")
+        ]
+        if len(self._channel_fields) != len(self.signal_headers):
+            raise ValueError(
+                f"Found {len(self._channel_fields)} signals in the data records, pyedflib reports {len(self.signal_headers)}"
+            )
+        self._header_bytes = header_bytes
+        # the number of data records can be -1 in the header while recording so we rely on the file size
+        self._num_records = (os.path.getsize(self.filename) - header_bytes) // self._record_dtype.itemsize
+        self._channel_samples_per_record = [self._record_dtype[field].shape[0] for field in self._channel_fields]
+
+    def _get_raw_records(self):
+        if self._raw_records is None:
+            self._raw_records = np.memmap(
+                self.filename,
+                dtype=self._record_dtype,
+                mode="r",
+                offset=self._header_bytes,
+                shape=(self._num_records,),
+            )
+        return self._raw_records
+
     def _get_stream_channels(self, stream_index):
         return self.header["signal_channels"][self.stream_idx_to_chidx[stream_index]]
 
@@ -224,24 +278,24 @@ class EDFRawIO(BaseRawIO):
             i_stop = self.get_signal_size(block_index=block_index, seg_index=seg_index, stream_index=stream_index)
         n = i_stop - i_start
 
-        # raw_signals = self.edf_reader. am[channel_indexes, i_start:i_stop]
         selected_channel_idxs = stream_channel_idxs[channel_indexes]
 
-        # load data into numpy array buffer
-        data = []
-        self._open_reader()
-        for i, channel_idx in enumerate(selected_channel_idxs):
-            # use int32 for compatibility with pyedflib
-            buffer = np.empty(n, dtype=np.int32)
-            self.edf_reader.read_digital_signal(channel_idx, i_start, n, buffer)
-            data.append(buffer)
-        self._close_reader()
-        # downgrade to int16 as this is what is used in the edf file format
-        # use fortran (column major) order to be more efficient after transposing
-        data = np.asarray(data, dtype=np.int16, order="F")
+        # all channels of a stream have the same number of samples per data record
+        samples_per_record = self._channel_samples_per_record[stream_channel_idxs[0]]
+        record_start = i_start // samples_per_record
+        record_stop = -(-i_stop // samples_per_record)
+        raw_records = self._get_raw_records()[record_start:record_stop]
 
+        # copy each channel once from the data records, the records are
+        # contiguous in the buffer so the result is sliced without copy
+        data = np.empty((raw_records.shape[0], samples_per_record, len(selected_channel_idxs)), dtype=np.int16)
+        for i, channel_idx in enumerate(selected_channel_idxs):
+            data[:, :, i] = raw_records[self._channel_fields[channel_idx]]
         # use dimensions (time, channel)
-        data = data.T
+        data = data.reshape(raw_records.shape[0] * samples_per_record, len(selected_channel_idxs))
+
+        offset = i_start - record_start * samples_per_record
+        data = data[offset : offset + n]
 
         return data
 
@@ -309,6 +363,7 @@ class EDFRawIO(BaseRawIO):
         Closes the file handler
         """
         self._close_reader()
+        self._raw_records = None
 
     def _close_reader(self):
         if hasattr(self, "edf_reader"):
@@ -189,22 +189,14 @@ class IntanRawIO(BaseRawIO):
         # based on https://github.com/NeuralEnsemble/python-neo/issues/1556 bug in versions 0.13.1, .2, .3
         elif self.file_format == "one-file-per-signal":
             self._raw_data = {}
+            self._stream_file_layouts = {}
             for stream_name, stream_dtype in memmap_data_dtype.items():
                 # Digital streams pack all channels into one 16-bit word per sample (see #1853).
                 stream_is_digital = stream_name in digital_stream_names
                 num_channels = 1 if stream_is_digital else channel_number_dict[stream_name]
                 file_path = raw_file_paths_dict[stream_name]
-                size_in_bytes = file_path.stat().st_size
-                dtype_size = np.dtype(stream_dtype).itemsize
-                n_samples = size_in_bytes // (dtype_size * num_channels)
-                signal_stream_memmap = np.memmap(
-                    file_path,
-                    dtype=stream_dtype,
-                    mode="r",
-                    shape=(n_samples, num_channels),
-                    order="C",
-                )
-                self._raw_data[stream_name] = signal_stream_memmap
+                self._stream_file_layouts[stream_name] = (file_path, stream_dtype, num_channels)
+                self._raw_data[stream_name] = self._memmap_stream_file(stream_name)
 
         # for one-file-per-channel we have one memory map / channel stored as a list / neo stream
         elif self.file_format == "one-file-per-channel":
@@ -274,6 +266,18 @@ class IntanRawIO(BaseRawIO):
                 mask = signal_channels["stream_id"] == stream_id
                 signal_channels["buffer_id"][mask] = buffer_id
 
+        # In the header-attached format the channels of a stream are consecutive fields of each
+        # data block, so a stream can be read through a single strided view of the memmap
+        self._stream_block_views = {}
+        if self.file_format == "header-attached":
+            for stream_id, stream_name in zip(signal_streams["id"], signal_streams["name"]):
+                if stream_name in digital_stream_names:
+                    continue
+                channel_ids = signal_channels["id"][signal_channels["stream_id"] == stream_id]
+                stream_view = make_stream_block_view(self._raw_data, channel_ids)
+                if stream_view is not None:
+                    self._stream_block_views[stream_id] = stream_view
+
         # depending the format we can have buffer_id or not
         signal_buffers = np.zeros(len(buffer_ids), dtype=_signal_buffer_dtype)
         signal_buffers["id"] = buffer_ids
@@ -367,6 +371,39 @@ class IntanRawIO(BaseRawIO):
             for key in channel_keys_to_annotate:
                 array_annotations[key] = properties_dict[key]
 
+    def _memmap_stream_file(self, stream_name):
+        file_path, stream_dtype, num_channels = self._stream_file_layouts[stream_name]
+        n_samples = self._stream_file_num_samples(stream_name)
+        signal_stream_memmap = np.memmap(
+            file_path,
+            dtype=stream_dtype,
+            mode="r",
+            shape=(n_samples, num_channels),
+            order="C",
+        )
+        return signal_stream_memmap
+
+    def _stream_file_num_samples(self, stream_name):
+        # an incomplete trailing sample of a file being written is ignored
+        file_path, stream_dtype, num_channels = self._stream_file_layouts[stream_name]
+        size_in_bytes = file_path.stat().st_size
+        dtype_size = np.dtype(stream_dtype).itemsize
+        return size_in_bytes // (dtype_size * num_channels)
+
+    def _refresh(self):
+        if self.file_format != "one-file-per-signal":
+            raise NotImplementedError(
+                f"refresh() is only supported for the one-file-per-signal format, not {self.file_format}"
+            )
+        grown = False
+        for stream_name in self._stream_file_layouts:
+            if self._stream_file_num_samples(stream_name) > self._raw_data[stream_name].shape[0]:
+                self._raw_data[stream_name] = self._memmap_stream_file(stream_name)
+                grown = True
+        if grown:
+            self._max_sigs_length = max([raw_data.size for raw_data in self._raw_data.values()])
+        return grown
+
     def _segment_t_start(self, block_index, seg_index):
         return 0.0
 
@@ -463,7 +500,29 @@ class IntanRawIO(BaseRawIO):
             sl0 = i_start % block_size
             sl1 = sl0 + (i_stop - i_start)
 
-        if not stream_is_digital:
+        if not stream_is_digital and stream_id in self._stream_block_views:
+            # The whole stream is exposed as a single (blocks x channels x samples_per_block) view
+            # so the requested blocks and channels are gathered in one transpose-and-copy
+            stream_view = self._stream_block_views[stream_id]
+            block_size = stream_view.shape[2]
+            block_start = i_start // block_size
+            block_stop = -(-i_stop // block_size)
+            sl0 = i_start - block_start * block_size
+            channel_positions = np.arange(stream_view.shape[1])[channel_indexes]
+            blocks = np.empty((block_stop - block_start, block_size, channel_positions.size), dtype=dtype)
+            np.take(
+                stream_view[block_start:block_stop].transpose(0, 2, 1),
+                channel_positions,
+                axis=2,
+                out=blocks,
+                mode="clip",
+            )
+            sigs_chunk = blocks.reshape(-1, channel_positions.size)[sl0 : sl0 + (i_stop - i_start)]
+
+            if stream_is_stim:
+                sigs_chunk = self._decode_current_from_stim_data(sigs_chunk, 0, sigs_chunk.shape[0])
+
+        elif not stream_is_digital:
             # For all streams raw_data is a structured memmap with a field for each channel_id
             sigs_chunk = np.zeros((i_stop - i_start, len(channel_ids)), dtype=dtype)
             for chunk_index, channel_id in enumerate(channel_ids):
@@ -479,8 +538,13 @@ class IntanRawIO(BaseRawIO):
 
         else:
             # For digital data the channels come interleaved in a single field so we need to demultiplex
-            digital_raw_data = self._raw_data[field_name].flatten()
-            sigs_chunk = self._demultiplex_digital_data(digital_raw_data, channel_ids, i_start, i_stop)
+            # only the blocks covering the requested window
+            digital_raw_data = self._raw_data[field_name]
+            if multiple_samples_per_block:
+                digital_raw_data = digital_raw_data[block_start:block_stop].reshape(-1)
+                sigs_chunk = self._demultiplex_digital_data(digital_raw_data, channel_ids, sl0, sl1)
+            else:
+                sigs_chunk = self._demultiplex_digital_data(digital_raw_data, channel_ids, i_start, i_stop)
         return sigs_chunk
 
     def _get_analogsignal_chunk_one_file_per_channel(self, i_start, i_stop, stream_index, channel_indexes):
@@ -573,13 +637,11 @@ class IntanRawIO(BaseRawIO):
         dtype = np.uint16  # We fix this to match the memmap dtype
         # Slice to the requested window once up front so the bitwise unpacking below only runs over
         # the requested samples rather than the whole recording for every channel.
-        raw_digital_data = raw_digital_data[i_start:i_stop]
-        output = np.zeros((i_stop - i_start, len(channel_ids)), dtype=dtype)
+        raw_digital_data = np.asarray(raw_digital_data[i_start:i_stop], dtype=dtype).reshape(-1)
+        native_orders = np.array([self.native_channel_order[channel_id] for channel_id in channel_ids], dtype=dtype)
 
-        for channel_index, channel_id in enumerate(channel_ids):
-            native_order = self.native_channel_order[channel_id]
-            mask = 1 << native_order
-            output[:, channel_index] = (np.bitwise_and(raw_digital_data, mask) > 0).flatten()
+        # all the requested bits are unpacked at once by broadcasting samples against bit positions
+        output = np.bitwise_and(np.right_shift(raw_digital_data[:, np.newaxis], native_orders), 1)
 
         return output
 
@@ -746,6 +808,50 @@ class IntanRawIO(BaseRawIO):
 # Header reading helper functions
 
 
+def make_stream_block_view(raw_data, field_names):
+    """
+    Expose fields of the structured memmap of a header-attached file as a single strided array.
+
+    In the header-attached format the data is stored as consecutive data blocks, each holding
+    `samples_per_block` samples of every channel one after the other. When the fields of a stream
+    share their dtype and are evenly spaced within a block, the stream is a regular
+    (blocks x channels x samples_per_block) grid of the file and can be viewed without any copy.
+
+    Parameters
+    ----------
+    raw_data : np.memmap
+        The structured memmap of the data blocks
+    field_names : list of str
+        The fields of the stream, in channel order
+
+    Returns
+    -------
+    stream_view : ndarray or None
+        A read-only view of shape (blocks, channels, samples_per_block), or None if the fields
+        cannot be described by a single stride
+    """
+    fields = [raw_data.dtype.fields[name] for name in field_names]
+    field_dtype = fields[0][0]
+    if any(field[0] != field_dtype for field in fields):
+        return None
+    offsets = np.array([field[1] for field in fields])
+    channel_stride = int(offsets[1] - offsets[0]) if offsets.size > 1 else field_dtype.itemsize
+    if np.any(np.diff(offsets) != channel_stride):
+        return None
+
+    first_field = raw_data[field_names[0]]
+    if first_field.ndim == 1:
+        # one sample per block (e.g. supply voltage)
+        first_field = first_field[:, np.newaxis]
+    num_blocks, samples_per_block = first_field.shape
+    return np.lib.stride_tricks.as_strided(
+        first_field,
+        shape=(num_blocks, len(field_names), samples_per_block),
+        strides=(first_field.strides[0], channel_stride, first_field.strides[1]),
+        writeable=False,
+    )
+
+
 def read_qstring(f):
     """
     Reads the optional notes included in the Intan RHX software
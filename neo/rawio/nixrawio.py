@@ -173,7 +173,8 @@ class NIXRawIO(BaseRawIO):
             d = {"segments": []}
             self.unit_list["blocks"].append(d)
             for seg_index, seg in enumerate(seg_groups):
-                d = {"spiketrains": [], "spiketrains_id": [], "spiketrains_unit": []}
+                # spike_counts: number of spikes of each spiketrain, used in _spike_count()
+                d = {"spiketrains": [], "spiketrains_id": [], "spiketrains_unit": [], "spike_counts": []}
                 self.unit_list["blocks"][block_index]["segments"].append(d)
                 st_idx = 0
                 for st in seg.multi_tags:
@@ -184,6 +185,7 @@ class NIXRawIO(BaseRawIO):
                     if st.type == "neo.spiketrain":
                         segment["spiketrains"].append(st.positions)
                         segment["spiketrains_id"].append(st.id)
+                        segment["spike_counts"].append(len(st.positions))
                         wftypestr = "neo.waveforms"
                         if st.features and st.features[0].data.type == wftypestr:
                             waveforms = st.features[0].data
@@ -301,6 +303,9 @@ class NIXRawIO(BaseRawIO):
         keep = self.header["signal_channels"]["stream_id"] == stream_id
         (global_channel_indexes,) = np.nonzero(keep)
         if channel_indexes is not None:
+            if isinstance(channel_indexes, np.ndarray):
+                # an empty list of channel indexes is converted to a float array
+                channel_indexes = channel_indexes.astype("int64")
             global_channel_indexes = global_channel_indexes[channel_indexes]
 
         if i_start is None:
@@ -308,25 +313,24 @@ class NIXRawIO(BaseRawIO):
         if i_stop is None:
             i_stop = self.get_signal_size(block_index, seg_index, stream_index)
 
-        raw_signals_list = []
+        # each channel is a DataArray, read them directly into the columns of one preallocated array
         da_list = self.da_list["blocks"][block_index]["segments"][seg_index]
-        for idx in global_channel_indexes:
-            da = da_list["data"][idx]
-            raw_signals_list.append(da[i_start:i_stop])
-
-        raw_signals = np.array(raw_signals_list)
-        raw_signals = np.transpose(raw_signals)
+        raw_signals = None
+        for c, idx in enumerate(global_channel_indexes):
+            data = da_list["data"][idx][i_start:i_stop]
+            if raw_signals is None:
+                raw_signals = np.empty((data.shape[0], global_channel_indexes.size), dtype=data.dtype)
+            raw_signals[:, c] = data
+
+        if raw_signals is None:
+            dtype = self.header["signal_channels"]["dtype"][keep][0]
+            raw_signals = np.zeros((max(i_stop - i_start, 0), 0), dtype=dtype)
         return raw_signals
 
     def _spike_count(self, block_index, seg_index, unit_index):
-        count = 0
-        head_id = self.header["spike_channels"][unit_index][1]
-        for mt in self.file.blocks[block_index].groups[seg_index].multi_tags:
-            for src in mt.sources:
-                if mt.type == "neo.spiketrain" and [src.type == "neo.unit"]:
-                    if head_id == src.id:
-                        return len(mt.positions)
-        return count
+        # units are the spiketrains of each segment by position, like in _get_spike_timestamps()
+        segment = self.unit_list["blocks"][block_index]["segments"][seg_index]
+        return segment["spike_counts"][unit_index]
 
     def _get_spike_timestamps(self, block_index, seg_index, unit_index, t_start, t_stop):
         block = self.unit_list["blocks"][block_index]
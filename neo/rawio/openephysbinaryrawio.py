@@ -605,6 +605,19 @@ class OpenEphysBinaryRawIO(BaseRawWithBufferApiIO):
                                     arr_ann = arr_ann[selected_indices]
                                 ev_ann["__array_annotations__"][k] = arr_ann
 
+    def _refresh(self):
+        grown = self._refresh_buffer_descriptions()
+        if grown:
+            for block_index, seg_streams in self._sig_streams.items():
+                for seg_index, streams in seg_streams.items():
+                    for stream_index, info in streams.items():
+                        buffer_id = str(stream_index)
+                        sig_size = self._buffer_descriptions[block_index][seg_index][buffer_id]["shape"][0]
+                        t_stop = info["t_start"] + sig_size / float(info["sample_rate"])
+                        if t_stop > self._t_stop_segments[block_index][seg_index]:
+                            self._t_stop_segments[block_index][seg_index] = t_stop
+        return grown
+
     def _segment_t_start(self, block_index, seg_index):
         return self._t_start_segments[block_index][seg_index]
 
@@ -69,18 +69,19 @@ class PhyRawIO(BaseRawIO):
     def _parse_header(self):
         phy_folder = Path(self.dirname)
 
-        self._spike_times = np.load(phy_folder / "spike_times.npy")
-        self._spike_templates = np.load(phy_folder / "spike_templates.npy")
+        # all arrays are memmaps, only the per-cluster index below is in memory
+        self._spike_times = np.load(phy_folder / "spike_times.npy", mmap_mode="r")
+        self._spike_templates = np.load(phy_folder / "spike_templates.npy", mmap_mode="r")
 
         if (phy_folder / "spike_clusters.npy").is_file():
-            self._spike_clusters = np.load(phy_folder / "spike_clusters.npy")
+            self._spike_clusters = np.load(phy_folder / "spike_clusters.npy", mmap_mode="r")
         else:
             self._spike_clusters = self._spike_templates
 
         self._amplitudes = None
         if self.load_amplitudes:
             if (phy_folder / "amplitudes.npy").is_file():
-                self._amplitudes = np.squeeze(np.load(phy_folder / "amplitudes.npy"))
+                self._amplitudes = np.squeeze(np.load(phy_folder / "amplitudes.npy", mmap_mode="r"))
             else:
                 warnings.warn('Amplitudes requested but "amplitudes.npy"' "not found in the data folder.")
 
@@ -88,7 +89,7 @@ class PhyRawIO(BaseRawIO):
         self._pc_feature_ind = None
         if self.load_pcs:
             if (phy_folder / "pc_features.npy").is_file() and (phy_folder / "pc_feature_ind.npy").is_file():
-                self._pc_features = np.squeeze(np.load(phy_folder / "pc_features.npy"))
+                self._pc_features = np.squeeze(np.load(phy_folder / "pc_features.npy", mmap_mode="r"))
                 self._pc_feature_ind = np.squeeze(np.load(phy_folder / "pc_feature_ind.npy"))
             else:
                 warnings.warn(
@@ -109,11 +110,18 @@ class PhyRawIO(BaseRawIO):
 
         self._sampling_frequency = metadata["sample_rate"]
 
-        clust_ids = np.unique(self._spike_clusters)
+        # group spikes by cluster once: spikes of cluster i are
+        # self._cluster_spike_times[self._cluster_offsets[i]:self._cluster_offsets[i + 1]] sorted by time
+        spike_times = np.asarray(self._spike_times).ravel()
+        spike_clusters = np.asarray(self._spike_clusters).ravel()
+        cluster_order = np.lexsort((spike_times, spike_clusters))
+        clust_ids, cluster_starts = np.unique(spike_clusters[cluster_order], return_index=True)
+        self._cluster_offsets = np.append(cluster_starts, cluster_order.size)
+        self._cluster_spike_times = spike_times[cluster_order]
         self.unit_labels = list(clust_ids)
 
         self._t_start = 0.0
-        self._t_stop = max(self._spike_times).item() / self._sampling_frequency
+        self._t_stop = np.max(self._spike_times).item() / self._sampling_frequency
 
         signal_streams = np.array([], dtype=_signal_stream_dtype)
         signal_buffers = np.array([], dtype=_signal_buffer_dtype)
@@ -177,18 +185,18 @@ class PhyRawIO(BaseRawIO):
                             spiketrain_an[annotation_name] = annotation_dict[property_name]
                             break
 
-            cluster_mask = (self._spike_clusters == clust_id).flatten()
+            cluster_spikes = cluster_order[self._cluster_offsets[index] : self._cluster_offsets[index + 1]]
 
-            current_templates = self._spike_templates[cluster_mask].flatten()
+            current_templates = np.asarray(self._spike_templates).ravel()[cluster_spikes]
             unique_templates = np.unique(current_templates)
             spiketrain_an["templates"] = unique_templates
             spiketrain_an["__array_annotations__"]["templates"] = current_templates
 
             if self._amplitudes is not None:
-                spiketrain_an["__array_annotations__"]["amplitudes"] = self._amplitudes[cluster_mask]
+                spiketrain_an["__array_annotations__"]["amplitudes"] = np.asarray(self._amplitudes[cluster_spikes])
 
             if self._pc_features is not None:
-                current_pc_features = self._pc_features[cluster_mask]
+                current_pc_features = np.asarray(self._pc_features[cluster_spikes])
                 _, num_pcs, num_pc_channels = current_pc_features.shape
                 for pc_idx in range(num_pcs):
                     for channel_idx in range(num_pc_channels):
@@ -220,10 +228,8 @@ class PhyRawIO(BaseRawIO):
     def _spike_count(self, block_index, seg_index, spike_channel_index):
         if block_index != 0:
             raise ValueError("`block_index` must be 0")
-        spikes = self._spike_clusters
-        unit_label = self.unit_labels[spike_channel_index]
-        mask = spikes == unit_label
-        nb_spikes = np.sum(mask)
+        start, stop = self._cluster_offsets[spike_channel_index : spike_channel_index + 2]
+        nb_spikes = int(stop - start)
         return nb_spikes
 
     def _get_spike_timestamps(self, block_index, seg_index, spike_channel_index, t_start, t_stop):
@@ -232,16 +238,15 @@ class PhyRawIO(BaseRawIO):
         if seg_index != 0:
             raise ValueError("`seg_index` must be 0")
 
-        unit_label = self.unit_labels[spike_channel_index]
-        mask = self._spike_clusters == unit_label
-        spike_timestamps = self._spike_times[mask]
+        start, stop = self._cluster_offsets[spike_channel_index : spike_channel_index + 2]
+        spike_timestamps = self._cluster_spike_times[start:stop]
 
         if t_start is not None:
             start_frame = int(t_start * self._sampling_frequency)
-            spike_timestamps = spike_timestamps[spike_timestamps >= start_frame]
+            spike_timestamps = spike_timestamps[np.searchsorted(spike_timestamps, start_frame, side="left") :]
         if t_stop is not None:
             end_frame = int(t_stop * self._sampling_frequency)
-            spike_timestamps = spike_timestamps[spike_timestamps < end_frame]
+            spike_timestamps = spike_timestamps[: np.searchsorted(spike_timestamps, end_frame, side="left")]
 
         return spike_timestamps
 
@@ -151,6 +151,10 @@ class RawBinarySignalRawIO(BaseRawWithBufferApiIO):
         # insert some annotation at some place
         self._generate_minimal_annotations()
 
+    def _refresh(self):
+        # t_stop is computed from the signal size so only the buffer shape needs an update
+        return self._refresh_buffer_descriptions()
+
     def _segment_t_start(self, block_index, seg_index):
         return 0.0
 
@@ -154,6 +154,9 @@ class Spike2RawIO(BaseRawIO):
             self._all_data_blocks[chan_id] = data_blocks
             self._by_seg_data_blocks[chan_id] = []
 
+        # per channel timestamp index for event/spike channels, built on first use
+        self._timestamp_indexes = {}
+
         # For all signal channel detect gaps between data block (pause in rec) so new Segment.
         # then check that all channel have the same gaps.
         # this part is tricky because we need to check that all channel have same pause.
@@ -276,18 +279,8 @@ class Spike2RawIO(BaseRawIO):
                     wf_left_sweep = chan_info["n_extra"] // 8
                 wf_sampling_rate = sampling_rate
                 if self.ced_units:
-                    # this is a huge pain because need
-                    # to jump over all blocks
-                    data_blocks = self._all_data_blocks[chan_id]
-                    dt = get_channel_dtype(chan_info)
-                    unit_ids = set()
-                    for bl in range(data_blocks.size):
-                        ind0 = data_blocks[bl]["pos"]
-                        ind1 = data_blocks[bl]["size"] * dt.itemsize + ind0
-                        raw_data = self._memmap[ind0:ind1].view(dt)
-                        marker = raw_data["marker"] & 255
-                        unit_ids.update(np.unique(marker))
-                    unit_ids = sorted(list(unit_ids))
+                    # unit ids are the marker codes present in the channel
+                    unit_ids = self._get_timestamp_index(chan_id)["markers"].tolist()
                 else:
                     # All spike from one channel are group in one SpikeTrain
                     unit_ids = ["all"]
@@ -460,32 +453,85 @@ class Spike2RawIO(BaseRawIO):
                 ind += data.size
         return raw_signals
 
+    def _get_timestamp_index(self, chan_id):
+        """
+        Build (once per channel) a flat index of all the records of an event/spike channel.
+
+        Tick and record byte position are gathered across all data blocks and sorted by tick.
+        For channels with markers, a second copy is sorted by (marker, tick) so that each
+        marker code (unit) is a contiguous group delimited by ``group_offsets``.
+        """
+        if chan_id in self._timestamp_indexes:
+            return self._timestamp_indexes[chan_id]
+
+        data_blocks = self._all_data_blocks[chan_id]
+        dt = get_channel_dtype(self._channel_infos[chan_id])
+
+        sizes = data_blocks["size"].astype("int64")
+        block_starts = np.cumsum(sizes) - sizes
+        rows = np.arange(np.sum(sizes), dtype="int64") - np.repeat(block_starts, sizes)
+        positions = np.repeat(data_blocks["pos"].astype("int64"), sizes) + rows * dt.itemsize
+        # the records of a data block are contiguous: view each block as a structured array
+        block_records = [
+            np.ndarray(shape=(size,), dtype=dt, buffer=self._memmap, offset=pos)
+            for pos, size in zip(data_blocks["pos"].tolist(), sizes.tolist())
+        ]
+        ticks = np.concatenate([records["tick"] for records in block_records] + [np.zeros(0, dtype="i4")])
+
+        order = np.argsort(ticks, kind="stable")
+        index = {
+            "dtype": dt,
+            "ticks": ticks[order],
+            "positions": positions[order],
+        }
+
+        if "marker" in dt.names:
+            markers = np.concatenate([records["marker"] for records in block_records] + [np.zeros(0, dtype="i4")])
+            markers &= 255
+            order = np.lexsort((ticks, markers))
+            unique_markers, group_starts = np.unique(markers[order], return_index=True)
+            index["markers"] = unique_markers
+            index["group_offsets"] = np.append(group_starts, markers.size)
+            index["grouped_ticks"] = ticks[order]
+            index["grouped_positions"] = positions[order]
+        else:
+            index["markers"] = np.zeros(0, dtype="i4")
+
+        self._timestamp_indexes[chan_id] = index
+        return index
+
+    def _gather_record_field(self, positions, dt, field):
+        # read one field of the records starting at the given byte positions, through a structured
+        # view with a stride of one byte, i.e. with one (overlapping) record starting at each byte of the file
+        num_records = max(self._memmap.size - dt.itemsize + 1, 0)
+        records = np.ndarray(shape=(num_records,), dtype=dt, buffer=self._memmap, strides=(1,))
+        return records[field][positions]
+
+    def _get_timestamp_slice(self, chan_id, lim0, lim1, marker_filter=None):
+        # ticks and record positions in [lim0, lim1], optionally for one marker only
+        index = self._get_timestamp_index(chan_id)
+        if marker_filter is None:
+            ticks = index["ticks"]
+            positions = index["positions"]
+        else:
+            markers = index["markers"]
+            group = np.searchsorted(markers, marker_filter)
+            if group == markers.size or markers[group] != marker_filter:
+                return index["ticks"][:0], index["positions"][:0]
+            start, stop = index["group_offsets"][group : group + 2]
+            ticks = index["grouped_ticks"][start:stop]
+            positions = index["grouped_positions"][start:stop]
+
+        i0 = np.searchsorted(ticks, lim0, side="left")
+        i1 = np.searchsorted(ticks, lim1, side="right")
+        return ticks[i0:i1], positions[i0:i1]
+
     def _count_in_time_slice(self, seg_index, chan_id, lim0, lim1, marker_filter=None):
         # count event or spike in time slice
-        data_blocks = self._all_data_blocks[chan_id]
-        chan_info = self._channel_infos[chan_id]
-        dt = get_channel_dtype(chan_info)
-        nb = 0
-        for bl in range(data_blocks.size):
-            ind0 = data_blocks[bl]["pos"]
-            ind1 = data_blocks[bl]["size"] * dt.itemsize + ind0
-            raw_data = self._memmap[ind0:ind1].view(dt)
-            ts = raw_data["tick"]
-            keep = (ts >= lim0) & (ts <= lim1)
-            if marker_filter is not None:
-                keep2 = (raw_data["marker"] & 255) == marker_filter
-                keep = keep & keep2
-            nb += np.sum(keep)
-            if ts[-1] > lim1:
-                break
-        return nb
+        ticks, _ = self._get_timestamp_slice(chan_id, lim0, lim1, marker_filter=marker_filter)
+        return ticks.size
 
     def _get_internal_timestamp_(self, seg_index, chan_id, t_start, t_stop, other_field=None, marker_filter=None):
-        chan_info = self._channel_infos[chan_id]
-        # data_blocks = self._by_seg_data_blocks[chan_id][seg_index]
-        data_blocks = self._all_data_blocks[chan_id]
-        dt = get_channel_dtype(chan_info)
-
         if t_start is None:
             # lim0 = 0
             lim0 = self._seg_t_starts[seg_index]
@@ -498,36 +544,13 @@ class Spike2RawIO(BaseRawIO):
         else:
             lim1 = int(t_stop / self._time_factor)
 
-        timestamps = []
-        othervalues = []
-        for bl in range(data_blocks.size):
-            ind0 = data_blocks[bl]["pos"]
-            ind1 = data_blocks[bl]["size"] * dt.itemsize + ind0
-            raw_data = self._memmap[ind0:ind1].view(dt)
-            ts = raw_data["tick"]
-            keep = (ts >= lim0) & (ts <= lim1)
-            if marker_filter is not None:
-                keep2 = (raw_data["marker"] & 255) == marker_filter
-                keep = keep & keep2
-
-            timestamps.append(ts[keep])
-            if other_field is not None:
-                othervalues.append(raw_data[other_field][keep])
-            if ts[-1] > lim1:
-                break
-
-        if len(timestamps) > 0:
-            timestamps = np.concatenate(timestamps)
-        else:
-            timestamps = np.zeros(0, dtype="int16")
+        timestamps, positions = self._get_timestamp_slice(chan_id, lim0, lim1, marker_filter=marker_filter)
 
         if other_field is None:
             return timestamps
         else:
-            if len(timestamps) > 0:
-                othervalues = np.concatenate(othervalues)
-            else:
-                othervalues = np.zeros(0, dtype=dt.fields[other_field][0])
+            dt = self._get_timestamp_index(chan_id)["dtype"]
+            othervalues = self._gather_record_field(positions, dt, other_field)
             return timestamps, othervalues
 
     def _spike_count(self, block_index, seg_index, unit_index):
@@ -279,7 +279,8 @@ class SpikeGadgetsRawIO(BaseRawIO):
         signal_channels = []
 
         # walk in xml device and keep only "analog" one
-        self._mask_channels_bytes = {}
+        # for each stream, the byte offset of every channel int16 sample inside a packet
+        self._channel_byte_offsets = {}
         for device in hconf:
             stream_id = device.attrib["name"]
             for channel in device:
@@ -295,7 +296,7 @@ class SpikeGadgetsRawIO(BaseRawIO):
                         stream_name = stream_id
                         buffer_id = ""
                         signal_streams.append((stream_name, stream_id, buffer_id))
-                        self._mask_channels_bytes[stream_id] = []
+                        self._channel_byte_offsets[stream_id] = []
 
                     name = channel.attrib["id"]
                     chan_id = channel.attrib["id"]
@@ -310,15 +311,12 @@ class SpikeGadgetsRawIO(BaseRawIO):
                     )
 
                     num_bytes = stream_bytes[stream_id] + int(channel.attrib["startByte"])
-                    chan_mask = np.zeros(packet_size, dtype="bool")
-                    chan_mask[num_bytes] = True
-                    chan_mask[num_bytes + 1] = True
-                    self._mask_channels_bytes[stream_id].append(chan_mask)
+                    self._channel_byte_offsets[stream_id].append(num_bytes)
 
         if num_ephy_channels > 0:
             stream_id = "trodes"
             signal_streams.append((stream_id, stream_id, ""))
-            self._mask_channels_bytes[stream_id] = []
+            self._channel_byte_offsets[stream_id] = []
 
             self.is_scaleable = all("spikeScalingToUv" in trode.attrib for trode in sconf)
             if not self.is_scaleable:
@@ -378,17 +376,15 @@ class SpikeGadgetsRawIO(BaseRawIO):
                 signal_channels.append((name, chan_id, self._sampling_rate, "int16", units, gain, 0.0, stream_id, ""))
 
                 num_bytes = packet_size - 2 * num_ephy_channels + 2 * binary_index
-                chan_mask = np.zeros(packet_size, dtype="bool")
-                chan_mask[num_bytes] = True
-                chan_mask[num_bytes + 1] = True
-                self._mask_channels_bytes[stream_id].append(chan_mask)
-
-        # make mask as array (used in _get_analogsignal_chunk(...))
-        self._mask_streams = {}
-        for stream_id, l in self._mask_channels_bytes.items():
-            mask = np.array(l)
-            self._mask_channels_bytes[stream_id] = mask
-            self._mask_streams[stream_id] = np.any(mask, axis=0)
+                self._channel_byte_offsets[stream_id].append(num_bytes)
+
+        # make offsets as array and build, when channels are evenly spaced in the packet,
+        # a (num_packet, num_chan) int16 view of the stream (used in _get_analogsignal_chunk(...))
+        self._stream_views = {}
+        for stream_id, offsets in self._channel_byte_offsets.items():
+            offsets = np.array(offsets, dtype="int64")
+            self._channel_byte_offsets[stream_id] = offsets
+            self._stream_views[stream_id] = make_packet_stream_view(self._raw_memmap, offsets)
 
         signal_streams = np.array(signal_streams, dtype=_signal_stream_dtype)
         signal_channels = np.array(signal_channels, dtype=_signal_channel_dtype)
@@ -454,38 +450,50 @@ class SpikeGadgetsRawIO(BaseRawIO):
     def _get_analogsignal_chunk(self, block_index, seg_index, i_start, i_stop, stream_index, channel_indexes):
         stream_id = self.header["signal_streams"][stream_index]["id"]
 
-        raw_unit8 = self._raw_memmap[i_start:i_stop]
-
-        num_chan = len(self._mask_channels_bytes[stream_id])
-        re_order = None
         if channel_indexes is None:
-            # no loop : entire stream mask
-            stream_mask = self._mask_streams[stream_id]
-        else:
-            # accumulate mask
+            channel_indexes = slice(None)
+
+        stream_view = self._stream_views[stream_id]
+        if stream_view is not None:
+            # one strided gather of the int16 columns, this copies the data from the memmap into memory
             if isinstance(channel_indexes, slice):
-                chan_inds = np.arange(num_chan)[channel_indexes]
+                raw_unit16 = np.array(stream_view[i_start:i_stop, channel_indexes])
             else:
-                chan_inds = channel_indexes
-
-                if np.any(np.diff(channel_indexes) < 0):
-                    # handle channel are not ordered
-                    sorted_channel_indexes = np.sort(channel_indexes)
-                    re_order = np.array([list(sorted_channel_indexes).index(ch) for ch in channel_indexes])
-
-            stream_mask = np.zeros(raw_unit8.shape[1], dtype="bool")
-            for chan_ind in chan_inds:
-                chan_mask = self._mask_channels_bytes[stream_id][chan_ind]
-                stream_mask |= chan_mask
+                raw_unit16 = np.take(stream_view[i_start:i_stop], channel_indexes, axis=1)
+        else:
+            # channels are not evenly spaced in the packet: gather the byte pairs then retype by view
+            offsets = self._channel_byte_offsets[stream_id][channel_indexes]
+            byte_indexes = (offsets[:, None] + np.arange(2)).flatten()
+            raw_unit8 = np.ascontiguousarray(self._raw_memmap[i_start:i_stop][:, byte_indexes])
+            raw_unit16 = raw_unit8.view("int16")
 
-        # this copies the data from the memmap into memory
-        raw_unit8_mask = raw_unit8[:, stream_mask]
-        shape = raw_unit8_mask.shape
-        shape = (shape[0], shape[1] // 2)
-        # reshape the and retype by view
-        raw_unit16 = raw_unit8_mask.flatten().view("int16").reshape(shape)
+        return raw_unit16
 
-        if re_order is not None:
-            raw_unit16 = raw_unit16[:, re_order]
 
-        return raw_unit16
+def make_packet_stream_view(raw_memmap, channel_byte_offsets):
+    """
+    Make a (num_packet, num_chan) int16 view on a (num_packet, packet_size) uint8 array
+    where channel i is the int16 at byte ``channel_byte_offsets[i]`` of each packet.
+
+    The view is only possible when offsets are evenly spaced, otherwise None is returned.
+    Samples do not need to be aligned, numpy handles unaligned views.
+    """
+    num_packet, packet_size = raw_memmap.shape
+    num_chan = channel_byte_offsets.size
+    if num_packet == 0 or num_chan == 0:
+        return None
+    if num_chan > 1:
+        steps = np.diff(channel_byte_offsets)
+        if np.any(steps != steps[0]) or steps[0] <= 0:
+            return None
+        chan_stride = int(steps[0])
+    else:
+        chan_stride = 2
+    stream_view = np.ndarray(
+        shape=(num_packet, num_chan),
+        dtype="int16",
+        buffer=raw_memmap,
+        offset=int(channel_byte_offsets[0]),
+        strides=(packet_size, chan_stride),
+    )
+    return stream_view
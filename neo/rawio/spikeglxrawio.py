@@ -232,20 +232,7 @@ class SpikeGLXRawIO(BaseRawWithBufferApiIO):
                         chan_name = local_chan
                         chan_id = f"{stream_name}#{chan_name}"
                         event_channels.append((chan_name, chan_id, "event"))
-                    # Create memmap for digital word but defer unpacking until needed
-                    # The digital word is stored as the last channel, after all the individual analog channels
-                    # For example: if there are 8 analog channels (indices 0-7), the digital word is at index 8
-                    num_samples = info["sample_length"]
-                    num_channels = info["num_chan"]
-                    data = np.memmap(
-                        info["bin_file"],
-                        dtype="int16",
-                        mode="r",
-                        shape=(num_samples, num_channels),
-                        order="C",
-                    )
-                    digital_word_channel_index = len(info["analog_channels"])
-                    self._events_memmap_digital_word = data[:, digital_word_channel_index]
+                    self._events_memmap_digital_word = self._memmap_digital_word(info)
         event_channels = np.array(event_channels, dtype=_event_channel_dtype)
 
         # No spikes
@@ -311,6 +298,33 @@ class SpikeGLXRawIO(BaseRawWithBufferApiIO):
                         for ndim in range(loc.shape[1]):
                             sig_ann["__array_annotations__"][f"channel_location_{ndim}"] = loc[:, ndim]
 
+    def _memmap_digital_word(self, info):
+        # Create memmap for digital word but defer unpacking until needed
+        # The digital word is stored as the last channel, after all the individual analog channels
+        # For example: if there are 8 analog channels (indices 0-7), the digital word is at index 8
+        num_samples = info["sample_length"]
+        num_channels = info["num_chan"]
+        data = np.memmap(
+            info["bin_file"],
+            dtype="int16",
+            mode="r",
+            shape=(num_samples, num_channels),
+            order="C",
+        )
+        digital_word_channel_index = len(info["analog_channels"])
+        return data[:, digital_word_channel_index]
+
+    def _refresh(self):
+        grown = self._refresh_buffer_descriptions()
+        if grown:
+            for (seg_index, stream_name), info in self.signals_info_dict.items():
+                info["sample_length"] = self._buffer_descriptions[0][seg_index][stream_name]["shape"][0]
+                info["t_stop"] = info["sample_length"] / info["sampling_rate"]
+                self._t_stops[seg_index] = max(self._t_stops[seg_index], info["t_stop"])
+            if hasattr(self, "_events_memmap_digital_word"):
+                self._events_memmap_digital_word = self._memmap_digital_word(self.signals_info_dict[0, "nidq"])
+        return grown
+
     def _segment_t_start(self, block_index, seg_index):
         return 0.0
 
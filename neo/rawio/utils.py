@@ -2,13 +2,21 @@ import mmap
 import numpy as np
 
 
-def get_memmap_shape(filename, dtype, num_channels=None, offset=0):
+def get_memmap_shape(filename, dtype, num_channels=None, offset=0, truncate=False):
+    """
+    Utility function to get the shape of a memmap of a whole file without mapping it.
+
+    With truncate=True, the incomplete trailing frame of a file being written is
+    ignored instead of raising an error.
+    """
     dtype = np.dtype(dtype)
     with open(filename, mode="rb") as f:
         f.seek(0, 2)
         flen = f.tell()
         bytes = flen - offset
-        if bytes % dtype.itemsize != 0:
+        if truncate:
+            bytes -= bytes % (dtype.itemsize * (num_channels or 1))
+        elif bytes % dtype.itemsize != 0:
             raise ValueError("Size of available data is not a multiple of the data-type size.")
         size = bytes // dtype.itemsize
         if num_channels is None:
@@ -4,6 +4,7 @@ Tests of the neo.core.analogsignal.AnalogSignal class and related functions
 
 import os
 import pickle
+import tempfile
 import copy
 import warnings
 import unittest
@@ -1715,6 +1716,35 @@ class TestAnalogSignalCombination(unittest.TestCase):
             self.assertEqual(getattr(signal1, attr[0], None), getattr(concatenated, attr[0], None))
         assert_arrays_equal(np.array([0, 1, 2, 30, 35, -1, -1, 40, 5, 6]).reshape((-1, 1)), concatenated.magnitude)
 
+    def test_concatenate_many_unordered(self):
+        data = np.arange(40).reshape((20, 2))
+        signals = [
+            AnalogSignal(data[i : i + 4] * pq.mV, sampling_rate=1 * pq.kHz, t_start=i * pq.ms) for i in range(0, 20, 4)
+        ]
+        # a signal in other units of time, overlapping the previous one
+        signals.append(AnalogSignal(-data[2:5] * pq.mV, sampling_rate=1 * pq.kHz, t_start=0.002 * pq.s))
+
+        result = signals[3].concatenate(*signals[:3], *signals[4:])
+        self.assertEqual(result.t_start, 0 * pq.ms)
+        assert_array_equal(data, result.magnitude)
+
+        result = signals[3].concatenate(*signals[:3], *signals[4:], overwrite=True)
+        target = data.copy()
+        target[2:5] *= -1
+        assert_array_equal(target, result.magnitude)
+
+    def test_concatenate_memmap(self):
+        signal1 = AnalogSignal([0, 1, 2, 3] * pq.V, sampling_rate=1 * pq.Hz)
+        signal2 = AnalogSignal([4, 5, 6] * pq.V, sampling_rate=1 * pq.Hz, t_start=signal1.t_stop + 1 * pq.s)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "concatenated.dat")
+            result = signal1.concatenate(signal2, padding=-1 * pq.V, filename=filename)
+            assert_array_equal(np.array([0, 1, 2, 3, -1, 4, 5, 6]).reshape((-1, 1)), result.magnitude)
+            data = np.memmap(filename, mode="r", dtype=result.dtype, shape=result.shape)
+            assert_array_equal(data, result.magnitude)
+            del data, result
+
 
 class TestAnalogSignalFunctions(unittest.TestCase):
 
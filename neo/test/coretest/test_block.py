@@ -421,6 +421,33 @@ class TestBlock(unittest.TestCase):
             for sptr in segment.spiketrains:
                 self.assertEqual(id(sptr.segment), id(segment))
 
+    def test__shared_copy(self):
+        blk1 = self.blocks[0]
+        blk1_copy = blk1.shared_copy()
+
+        assert_same_sub_schema(blk1_copy, blk1)
+        for segment, segment_copy in zip(blk1.segments, blk1_copy.segments):
+            self.assertEqual(id(segment_copy.block), id(blk1_copy))
+            for obj, obj_copy in zip(segment.data_children, segment_copy.data_children):
+                # data objects are new read-only objects sharing their data with the original ones
+                self.assertIsNot(obj_copy, obj)
+                self.assertEqual(id(obj_copy.segment), id(segment_copy))
+                self.assertTrue(np.shares_memory(obj_copy, obj))
+                self.assertFalse(obj_copy.flags.writeable)
+                self.assertRaises(ValueError, obj_copy.__setitem__, 0, obj[0])
+                # annotations are copied
+                self.assertIsNot(obj_copy.annotations, obj.annotations)
+                # a deep copy of a shared copy is independent
+                deep_copy = deepcopy(obj_copy)
+                self.assertFalse(np.shares_memory(deep_copy, obj))
+                self.assertTrue(deep_copy.flags.writeable)
+
+        # objects of groups are the same as those of segments
+        objects_copy = {id(obj) for segment in blk1_copy.segments for obj in segment.data_children}
+        for group in blk1_copy.groups:
+            for obj in group.analogsignals + group.spiketrains:
+                self.assertIn(id(obj), objects_copy)
+
     def test_segment_list(self):
         blk = Block()
         assert len(blk.segments) == 0
@@ -0,0 +1,70 @@
+"""
+Tests of the neo.core.categoricallabels module
+"""
+
+import unittest
+from copy import deepcopy
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from neo.core.categoricallabels import CategoricalLabels, concatenate_labels, join_labels
+
+
+class TestCategoricalLabels(unittest.TestCase):
+    def setUp(self):
+        self.strings = np.array(["stop", "start", "stop", "reward"])
+        self.labels = CategoricalLabels.from_labels(self.strings)
+
+    def test_from_labels(self):
+        assert_array_equal(self.labels.categories, ["reward", "start", "stop"])
+        assert_array_equal(self.labels.codes, [2, 1, 2, 0])
+        self.assertEqual(self.labels.codes.dtype, np.uint8)
+        assert_array_equal(self.labels.to_array(), self.strings)
+        assert_array_equal(np.asarray(self.labels), self.strings)
+        self.assertEqual(len(self.labels), 4)
+        self.assertEqual(self.labels.size, 4)
+
+        empty = CategoricalLabels.from_labels([])
+        self.assertEqual(empty.size, 0)
+        self.assertEqual(empty.to_array().dtype.kind, "U")
+
+    def test_invalid_codes(self):
+        self.assertRaises(TypeError, CategoricalLabels, [0.5, 1.0], ["a", "b"])
+
+    def test_getitem(self):
+        sliced = self.labels[1:3]
+        self.assertIsInstance(sliced, CategoricalLabels)
+        self.assertIs(sliced.categories, self.labels.categories)
+        assert_array_equal(sliced.to_array(), self.strings[1:3])
+        self.assertEqual(self.labels[3], "reward")
+        assert_array_equal(self.labels[np.array([True, False, False, True])].to_array(), ["stop", "reward"])
+
+    def test_deepcopy_shares_categories(self):
+        copied = deepcopy(self.labels)
+        self.assertIs(copied.categories, self.labels.categories)
+        self.assertIsNot(copied.codes, self.labels.codes)
+        self.assertFalse(self.labels.categories.flags.writeable)
+
+    def test_concatenate_labels(self):
+        other = CategoricalLabels.from_labels(["cue", "stop"])
+        result = concatenate_labels(self.labels, other)
+        assert_array_equal(result.to_array(), np.append(self.strings, ["cue", "stop"]))
+        assert_array_equal(result.categories, ["cue", "reward", "start", "stop"])
+
+        result = concatenate_labels(self.labels, np.array(["cue"]))
+        self.assertIsInstance(result, CategoricalLabels)
+        assert_array_equal(result.to_array(), np.append(self.strings, "cue"))
+
+        result = concatenate_labels(np.array(["a"]), np.array(["b"]))
+        assert_array_equal(result, ["a", "b"])
+
+    def test_join_labels(self):
+        result = join_labels(self.labels[:-1], self.labels[1:])
+        self.assertIsInstance(result, CategoricalLabels)
+        assert_array_equal(result.to_array(), ["stop-start", "start-stop", "stop-reward"])
+        assert_array_equal(join_labels(self.strings[:-1], self.strings[1:]), result.to_array())
+
+
+if __name__ == "__main__":
+    unittest.main()
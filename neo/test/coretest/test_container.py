@@ -18,7 +18,7 @@ except ImportError as err:
 else:
     HAVE_IPYTHON = True
 
-from neo.core.container import Container, unique_objs
+from neo.core.container import Container, filterdata, unique_objs
 
 
 class Test_unique_objs(unittest.TestCase):
@@ -216,6 +216,120 @@ class TestContainerNeo(unittest.TestCase):
         self.assertEqual(1, len(self.seg.filter(name="st_num_1")))
 
 
+class TestContainerAnnotationIndex(unittest.TestCase):
+    """
+    TestCase to make sure filtering with an annotation index gives the same results as without
+    """
+
+    def setUp(self):
+        self.block = neo.core.Block()
+        for i in range(3):
+            seg = neo.core.Segment(name=f"seg{i}", quality="good")
+            for j in range(20):
+                st = neo.core.SpikeTrain([1, 2] * pq.ms, t_stop=10, name=f"st{j}")
+                st.annotate(channel_id=j % 7, quality=["good", "mua", "noise"][j % 3], depth=10.0 * j)
+                if j % 5 == 0:
+                    st.annotate(region="CA1", tags=[1, 2])
+                seg.spiketrains.append(st)
+            seg.events.append(neo.core.Event([1] * pq.ms, channel_id=1))
+            self.block.segments.append(seg)
+        self.queries = [
+            {"channel_id": filters.IsIn([1, 2, 3])},
+            {"channel_id": 4},
+            {"quality": "good", "depth": filters.GreaterThan(150.0)},
+            {"depth": filters.InRange(20, 80, True, False)},
+            {"region": filters.IsNot("CA3")},
+            {"tags": filters.Equals([1, 2])},
+            {"name": "st3"},
+            [{"quality": filters.IsIn(("good", "mua"))}, {"channel_id": filters.LessThanOrEquals(3)}],
+            [{"channel_id": filters.GreaterThanOrEquals(2)}, {}],
+        ]
+
+    def assert_same_filter_results(self, **kwargs):
+        for query in self.queries:
+            self.block.remove_annotation_index()
+            targ = self.block.filter(query, **kwargs)
+            self.block.create_annotation_index()
+            res = self.block.filter(query, **kwargs)
+            self.assertEqual([id(obj) for obj in res], [id(obj) for obj in targ])
+            self.assertEqual(type(res), type(targ))
+
+    def test_filter_with_index(self):
+        self.assert_same_filter_results()
+        self.assert_same_filter_results(objects=neo.core.SpikeTrain)
+        self.assert_same_filter_results(objects="Event")
+        self.assert_same_filter_results(data=False, container=True)
+        self.assert_same_filter_results(data=True, container=True)
+
+    def test_index_invalidation(self):
+        self.block.create_annotation_index()
+        self.assertEqual(6, len(self.block.filter(channel_id=6, objects=neo.core.SpikeTrain)))
+
+        st = self.block.segments[0].spiketrains[0]
+        st.annotate(channel_id=6)
+        self.assertEqual(7, len(self.block.filter(channel_id=6, objects=neo.core.SpikeTrain)))
+
+        new_st = neo.core.SpikeTrain([1, 2] * pq.ms, t_stop=10, channel_id=6)
+        self.block.segments[1].spiketrains.append(new_st)
+        res = self.block.filter(channel_id=6, objects=neo.core.SpikeTrain)
+        self.assertEqual(8, len(res))
+        self.assertTrue(any(obj is new_st for obj in res))
+
+    def test_index_invalidation_direct_edit(self):
+        self.block.create_annotation_index()
+        seg = self.block.segments[0]
+        st1, st2 = seg.spiketrains[:2]
+        st1.annotations["q"] = 1
+        self.assertEqual([id(obj) for obj in self.block.filter(q=1)], [id(st1)])
+
+        st2.annotations["q"] = 1
+        self.assertEqual([id(obj) for obj in self.block.filter(q=1)], [id(st1), id(st2)])
+        st1.annotations["q"] = 2
+        self.assertEqual([id(obj) for obj in self.block.filter(q=1)], [id(st2)])
+        del st2.annotations["q"]
+        self.assertEqual(self.block.filter(q=1), [])
+        st1.annotations.clear()
+        st1.annotations.update(q=1)
+        self.assertEqual([id(obj) for obj in self.block.filter(q=1)], [id(st1)])
+        seg.annotations = {"q": 1}
+        self.assertEqual(len(self.block.filter(q=1, container=True)), 2)
+        # instance attributes are matched too
+        st2.q = 1
+        self.assertEqual(len(self.block.filter(q=1)), 2)
+        self.assertEqual(len(self.block.filter(q=1)), len(filterdata(self.block.data_children_recur, q=1)))
+
+    def test_index_not_invalidated_by_other_objects(self):
+        self.block.create_annotation_index()
+        self.block.filter(channel_id=6)
+        index = self.block._annotation_index
+
+        other_block = neo.core.Block()
+        other_block.segments.append(neo.core.Segment())
+        other_block.create_annotation_index()
+        other_block.segments[0].annotate(channel_id=6)
+        self.assertEqual(6, len(self.block.filter(channel_id=6)))
+        self.assertIs(self.block._annotation_index, index)
+        self.assertEqual(1, len(other_block.filter(channel_id=6, container=True)))
+
+    def test_evaluate_array(self):
+        values = np.array([1, 5, 6, 10])
+        conditions = [
+            filters.Equals(5),
+            filters.IsNot(5),
+            filters.LessThan(6),
+            filters.LessThanOrEquals(6),
+            filters.GreaterThan(5),
+            filters.GreaterThanOrEquals(5),
+            filters.IsIn([1, 6]),
+            filters.IsIn(6),
+            filters.InRange(5, 10, True, False),
+            filters.Equals("5"),
+        ]
+        for condition in conditions:
+            targ = [condition.evaluate(value) for value in values]
+            np.testing.assert_array_equal(condition.evaluate_array(values), targ)
+
+
 class Test_Container_merge(unittest.TestCase):
     """
     TestCase to make sure merge method works
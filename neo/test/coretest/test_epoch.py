@@ -21,6 +21,7 @@ except ImportError as err:
 else:
     HAVE_IPYTHON = True
 
+from neo.core.categoricallabels import CategoricalLabels
 from neo.core.epoch import Epoch
 from neo.core import Segment
 from neo.test.tools import (
@@ -78,6 +79,14 @@ class TestEpoch(unittest.TestCase):
         assert_arrays_equal(epc.array_annotations["index"], np.arange(10, 13))
         self.assertIsInstance(epc.array_annotations, ArrayDict)
 
+    def test_Epoch_categorical_labels(self):
+        labels = np.array(["A", "B", "A"])
+        epc = Epoch([1.0, 2.0, 3.0] * pq.s, durations=[0.5] * 3 * pq.s, labels=CategoricalLabels.from_labels(labels))
+        assert_array_equal(epc.labels, labels)
+        self.assertFalse(epc.labels.flags.writeable)
+        self.assertIsInstance(epc[1:]._labels, CategoricalLabels)
+        assert_array_equal(epc[1:].labels, labels[1:])
+
     def test_Epoch_invalid_times_dimension(self):
         data2d = np.array([1, 2, 3, 4]).reshape((4, -1))
         durations = np.array([1, 1, 1, 1])
@@ -22,6 +22,7 @@ else:
 from neo.core.dataobject import ArrayDict
 from neo.core.event import Event
 from neo.core.epoch import Epoch
+from neo.core.categoricallabels import CategoricalLabels
 from neo.core import Segment
 from neo.test.tools import (
     assert_neo_object_is_compliant,
@@ -679,6 +680,44 @@ class TestEvent(unittest.TestCase):
         # todo: fix Epoch, as the following does not raise a ValueError  # self.assertRaises(
         # ValueError, event.to_epoch, durations=2.0)  # missing units
 
+    def test_categorical_labels(self):
+        labels = np.array(["A", "B", "A", "C"])
+        event = Event(times=np.array([5.0, 12.0, 23.0, 45.0]), units="ms", labels=CategoricalLabels.from_labels(labels))
+        assert_neo_object_is_compliant(event)
+        assert_array_equal(event.labels, labels)
+        assert_array_equal(event.categorical_labels.codes, [0, 1, 0, 2])
+
+        # the codes are carried through slicing, merging, copying and conversion to epochs
+        results = {
+            "getitem": (event[1:], labels[1:]),
+            "time_slice": (event.time_slice(10 * pq.ms, 30 * pq.ms), labels[1:3]),
+            "time_shift": (event.time_shift(1 * pq.ms), labels),
+            "rescale": (event.rescale(pq.s), labels),
+            "deepcopy": (deepcopy(event), labels),
+            "pickle": (pickle.loads(pickle.dumps(event)), labels),
+            "merge": (event.merge(Event([1.0] * pq.ms, labels=["D"])), np.append(labels, "D")),
+            "to_epoch": (event.to_epoch(), np.array(["A-B", "B-A", "A-C"])),
+            "to_epoch pairwise": (event.to_epoch(pairwise=True), np.array(["A-B", "A-C"])),
+            "epoch time_slice": (event.to_epoch().time_slice(10 * pq.ms, 30 * pq.ms), np.array(["B-A", "A-C"])),
+        }
+        for name, (result, expected_labels) in results.items():
+            self.assertIsInstance(result._labels, CategoricalLabels, name)
+            assert_array_equal(result.labels, expected_labels, name)
+        self.assertEqual(event[2], 23.0 * pq.ms)
+        self.assertEqual(event.categorical_labels[2], "A")
+
+        # string labels can be stored as codes, and back
+        event = Event(times=np.array([5.0, 12.0]), units="ms", labels=["A", "B"])
+        event.labels = event.categorical_labels
+        self.assertIsInstance(event._labels, CategoricalLabels)
+        # the labels built from the codes cannot be changed in place
+        with self.assertRaises(ValueError):
+            event.labels[0] = "C"
+        event.labels = event.labels
+        event.labels[0] = "C"
+        assert_array_equal(event.labels, ["C", "B"])
+        self.assertEqual(event._labels.dtype, np.dtype("<U1"))
+
     def test_rescale(self):
         times = [2, 3, 4, 5]
         labels = ["A", "B", "C", "D"]
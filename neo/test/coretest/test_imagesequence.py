@@ -104,6 +104,24 @@ class TestMethodImageSequence(unittest.TestCase):
         with self.assertRaises(ValueError):
             ImageSequence(self.data, units="V", sampling_rate=500 * pq.Hz, spatial_scale=1 * pq.um).signal_from_region()
 
+    def test_signal_from_regions(self):
+        data = np.arange(6 * 5 * 5, dtype="int16").reshape(6, 5, 5)
+        seq = ImageSequence(data, units="V", sampling_rate=500 * pq.Hz, spatial_scale=1 * pq.um)
+        rect_roi = RectangularRegionOfInterest(seq, 2, 2, 2, 2)
+        circ_roi = CircularRegionOfInterest(seq, 2, 2, 1)
+        signal = seq.signal_from_regions(rect_roi, circ_roi, chunk_size=4)
+        self.assertIsInstance(signal, AnalogSignal)
+        self.assertEqual(signal.shape, (6, 2))
+        self.assertEqual(signal.units, pq.V)
+        self.assertEqual(signal.sampling_period, seq.frame_duration)
+        for c, roi in enumerate((rect_roi, circ_roi)):
+            pixels = np.array(roi.pixels_in_region())
+            expected = data[:, pixels[:, 0], pixels[:, 1]].mean(axis=1)
+            np.testing.assert_array_almost_equal(signal.magnitude[:, c], expected)
+        signals = seq.signal_from_region(rect_roi, circ_roi)
+        for c in range(2):
+            np.testing.assert_array_equal(signals[c].magnitude[:, 0], signal.magnitude[:, c])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,12 @@
+import numpy as np
 import quantities as pq
-from neo.core.regionofinterest import RectangularRegionOfInterest, CircularRegionOfInterest, PolygonRegionOfInterest
+from neo.core.regionofinterest import (
+    RegionOfInterest,
+    RectangularRegionOfInterest,
+    CircularRegionOfInterest,
+    PolygonRegionOfInterest,
+    points_in_polygon,
+)
 from neo.core.imagesequence import ImageSequence
 import unittest
 
@@ -32,6 +39,51 @@ class Test_PolygonRegionOfInterest(unittest.TestCase):
             [(1, 1), (2, 1), (3, 1), (4, 1), (2, 2), (3, 2), (4, 2), (3, 3), (4, 3), (3, 4), (4, 4)],
         )
 
+    def test_points_in_polygon(self):
+        square = [(0, 0), (4, 0), (4, 4), (0, 4)]
+        inside = points_in_polygon(square, np.array([1.0, 5.0, 2.0, -1.0]), np.array([1.0, 1.0, 3.5, 2.0]))
+        np.testing.assert_array_equal(inside, [True, False, True, False])
+
+
+class Test_RegionOfInterestMask(unittest.TestCase):
+
+    def test_mask(self):
+        seq = ImageSequence(np.zeros((2, 8, 10)), spatial_scale=1, frame_duration=20 * pq.ms)
+        for roi in (
+            CircularRegionOfInterest(seq, 6, 6, 1.01),
+            RectangularRegionOfInterest(seq, 5, 5, 2, 2),
+            PolygonRegionOfInterest(seq, (3, 3), (2, 5), (5, 5), (5, 1), (1, 1)),
+        ):
+            mask = roi.mask()
+            self.assertEqual(mask.shape, (8, 10))
+            expected = np.zeros((8, 10), dtype=bool)
+            for pixel in roi.pixels_in_region():
+                expected[pixel[0], pixel[1]] = True
+            np.testing.assert_array_equal(mask, expected)
+
+        # pixels outside the frame are ignored
+        mask = CircularRegionOfInterest(seq, 0, 0, 2).mask(shape=(3, 3))
+        self.assertEqual(mask.sum(), 4)
+
+    def test_region_with_pixels_in_region_only(self):
+        class DiagonalRegionOfInterest(RegionOfInterest):
+            def pixels_in_region(self):
+                return [[i, i] for i in range(3)]
+
+        seq = ImageSequence(np.arange(40.0).reshape((2, 4, 5)), spatial_scale=1, frame_duration=20 * pq.ms)
+        roi = DiagonalRegionOfInterest(seq)
+        np.testing.assert_array_equal(roi.pixel_coordinates(), [[0, 0], [1, 1], [2, 2]])
+        np.testing.assert_array_equal(np.flatnonzero(roi.mask()), [0, 6, 12])
+        np.testing.assert_array_equal(seq.signal_from_regions(roi).magnitude[:, 0], [6.0, 26.0])
+
+        class EmptyRegionOfInterest(RegionOfInterest):
+            def pixels_in_region(self):
+                return []
+
+        roi = EmptyRegionOfInterest(seq)
+        self.assertEqual(roi.pixel_coordinates().shape, (0, 2))
+        self.assertFalse(roi.mask().any())
+
 
 if __name__ == "__main__":
     unittest.main()
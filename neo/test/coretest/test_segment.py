@@ -569,6 +569,66 @@ class TestSegment(unittest.TestCase):
             self.assertTrue(isinstance(sliced.events[0], Event))
             assert_same_attributes(sliced.events[0], sliced_event)
 
+    def test__time_slices(self):
+        t_starts = [0.5, 10.0, 30.2] * pq.s
+        t_stops = [5.6, 20.0, 40.0] * pq.s
+
+        epoch = Epoch([0.6, 9.5, 16.8, 34.1] * pq.s, durations=[4.5, 4.8, 5.0, 5.0] * pq.s)
+        epoch.array_annotate(trial_id=[1, 2, 3, 4])
+        event = Event(times=[25.2, 0.5, 10.0] * pq.s, labels=["c", "a", "b"])
+        event.array_annotate(trial_id=[3, 1, 2])
+        anasig = AnalogSignal(np.arange(50.0) * pq.mV, t_start=0.1 * pq.s, sampling_rate=1.0 * pq.Hz)
+        irrsig = IrregularlySampledSignal(signal=np.arange(50.0) * pq.mV, times=anasig.times)
+        st = SpikeTrain(
+            [36.5, 0.5, 7.5, 14.5, 21.5, 28.5] * pq.s,
+            t_start=0.1 * pq.s,
+            t_stop=50.0 * pq.s,
+            waveforms=np.arange(12.0).reshape(6, 1, 2) * pq.mV,
+            array_annotations={"spikenum": np.arange(1, 7)},
+        )
+
+        seg = Segment()
+        seg.epochs = [epoch]
+        seg.events = [event]
+        seg.analogsignals = [anasig]
+        seg.irregularlysampledsignals = [irrsig]
+        seg.spiketrains = [st]
+
+        originals = deepcopy(seg.data_children)
+        for reset_time in (False, True):
+            for deep_copy in (True, False):
+                sliced = seg.time_slices(t_starts, t_stops, reset_time=reset_time, deep_copy=deep_copy)
+                self.assertEqual(len(sliced), len(t_starts))
+                for subseg, t_start, t_stop in zip(sliced, t_starts, t_stops):
+                    assert_neo_object_is_compliant(subseg)
+                    target = seg.time_slice(t_start, t_stop, reset_time=reset_time)
+                    for container in ("analogsignals", "irregularlysampledsignals", "spiketrains", "events", "epochs"):
+                        self.assertEqual(len(getattr(subseg, container)), len(getattr(target, container)))
+                        for obj, target_obj in zip(getattr(subseg, container), getattr(target, container)):
+                            assert_same_attributes(obj, target_obj)
+
+        # without deep copy, slices of sorted data share memory with the original objects
+        sliced = seg.time_slices(t_starts, t_stops, deep_copy=False)
+        self.assertTrue(np.shares_memory(sliced[0].analogsignals[0], anasig))
+        self.assertTrue(np.shares_memory(sliced[0].epochs[0], epoch))
+
+        # same with a single time_slice
+        for reset_time in (False, True):
+            subseg = seg.time_slice(t_starts[1], t_stops[1], reset_time=reset_time, deep_copy=False)
+            target = seg.time_slice(t_starts[1], t_stops[1], reset_time=reset_time)
+            self.assertTrue(np.shares_memory(subseg.analogsignals[0], anasig))
+            for obj, target_obj in zip(subseg.data_children, target.data_children):
+                assert_same_attributes(obj, target_obj)
+        sliced = seg.time_slices(t_starts, t_stops)
+        self.assertFalse(np.shares_memory(sliced[0].analogsignals[0], anasig))
+
+        # resetting the time of the slices does not modify the original objects
+        for obj, original in zip(seg.data_children, originals):
+            assert_same_attributes(obj, original)
+
+        self.assertRaises(ValueError, seg.time_slices, t_starts, t_stops[:2])
+        self.assertRaises(ValueError, seg.time_slices, [60.0] * pq.s, [70.0] * pq.s)
+
     def test_time_slice_None(self):
         time_slices = [(None, 5.0 * pq.s), (5.0 * pq.s, None), (None, None)]
 
@@ -562,6 +562,17 @@ class TestSlice(unittest.TestCase):
         self.assertIsInstance(result.array_annotations["label"], np.ndarray)
         self.assertIsInstance(result.array_annotations, ArrayDict)
 
+    def test_slice_array_annotations_are_views(self):
+        result = self.train1[1:3]
+        self.assertTrue(np.shares_memory(result.array_annotations["index"], self.train1.array_annotations["index"]))
+        # setting a whole annotation is still checked
+        self.assertRaises(ValueError, result.array_annotate, index=[1, 2, 3])
+
+        # fancy indexing copies the annotations
+        result = self.train1[[0, 2]]
+        assert_arrays_equal(result.array_annotations["index"], np.array([1, 3]))
+        self.assertFalse(np.shares_memory(result.array_annotations["index"], self.train1.array_annotations["index"]))
+
     def test_slice_to_end(self):
         # slice spike train, keep sliced spike times
         result = self.train1[1:]
@@ -800,6 +811,23 @@ class TestTimeSlice(unittest.TestCase):
 
         self.assertFalse(all(self.train1 == result))
 
+    def test_time_slice_view(self):
+        result = self.train1.time_slice(0.12 * pq.ms, 3.5 * pq.ms, deep_copy=False)
+        assert_arrays_equal(result, [0.5, 1.2, 3.3] * pq.ms)
+        self.assertEqual(result.t_start, 0.12 * pq.ms)
+        self.assertEqual(result.t_stop, 3.5 * pq.ms)
+        assert_arrays_equal(result.array_annotations["index"], np.array([2, 3, 4]))
+        self.assertTrue(np.shares_memory(result, self.train1))
+        self.assertTrue(np.shares_memory(result.waveforms, self.train1.waveforms))
+
+    def test_time_slice_unsorted(self):
+        train = SpikeTrain(
+            [3.3, 0.1, 1.2, 7, 0.5] * pq.ms, t_stop=10.0 * pq.ms, array_annotations={"index": np.arange(5)}
+        )
+        result = train.time_slice(0.12 * pq.ms, 3.5 * pq.ms)
+        assert_arrays_equal(result, [3.3, 1.2, 0.5] * pq.ms)
+        assert_arrays_equal(result.array_annotations["index"], np.array([0, 2, 4]))
+
     def test_time_slice_matching_ends(self):
         # time_slice spike train, keep sliced spike times
         t_start = 0.1 * pq.ms
@@ -980,6 +1008,13 @@ class TestTimeSlice(unittest.TestCase):
         self.assertEqual(result.segment, None)
         self.assertEqual(result.unit, None)
 
+    def test__deepcopy_data(self):
+        result = deepcopy(self.train1)
+        assert_arrays_equal(result, self.train1)
+        self.assertEqual(result.t_stop, self.train1.t_stop)
+        self.assertFalse(np.shares_memory(result, self.train1))
+        self.assertFalse(np.shares_memory(result.waveforms, self.train1.waveforms))
+
 
 class TestTimeShift(unittest.TestCase):
     def setUp(self):
@@ -1118,6 +1153,33 @@ class TestMerge(unittest.TestCase):
         )
         self.assertIsInstance(result.array_annotations, ArrayDict)
 
+    def test_merge_quantity_array_annotations(self):
+        self.train1.waveforms = None
+        self.train2.waveforms = None
+        self.train1.array_annotations = ArrayDict(6)
+        self.train2.array_annotations = ArrayDict(6)
+        self.train1.array_annotate(amplitude=np.arange(6) * pq.mV)
+        self.train2.array_annotate(amplitude=np.arange(6) * pq.V)
+
+        result = self.train1.merge(self.train2)
+
+        self.assertEqual(result.array_annotations["amplitude"].units, pq.mV)
+        assert_arrays_equal(
+            result.array_annotations["amplitude"].magnitude,
+            np.array([0, 0, 1, 1000, 2, 2000, 3, 3000, 4, 4000, 5, 5000]),
+        )
+
+    def test_merge_non_overlapping(self):
+        train1 = SpikeTrain(self.data1quant, t_stop=20.0 * pq.ms, array_annotations={"index": np.arange(1, 7)})
+        train2 = SpikeTrain(
+            self.data2quant + 10 * pq.ms, t_stop=20.0 * pq.ms, array_annotations={"index": np.arange(101, 107)}
+        )
+
+        result = train1.merge(train2)
+
+        assert_arrays_equal(result.times.magnitude, np.concatenate([self.data1, self.data2 + 10]))
+        assert_arrays_equal(result.array_annotations["index"], np.concatenate([np.arange(1, 7), np.arange(101, 107)]))
+
     # can't rescale time so need to load milliseconds rather than micro (numpy 2.0)
     def test_merge_multiple(self):
         self.train1.waveforms = None
@@ -0,0 +1,125 @@
+"""
+Tests of neo.io.blkio on synthetic BLK files
+"""
+
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import quantities as pq
+
+from neo.io.blkio import BlkIO, _blk_header_dtype, _blk_vdaq_header_dtype, _blk_user_header_dtype
+from neo.io.proxyobjects import ImageSequenceProxy
+
+
+class TestBlkIO(unittest.TestCase):
+    nstim = 3
+    nframes = 5
+    width = 6
+    height = 4
+
+    def write_blk(self, filename, with_reference_frame=False):
+        """Write a uint16 VDAQ BLK file, frames hold distinct values. Return the frames
+        as a (stim, frame, height, width) array, including the reference frames."""
+        nfr2 = self.nframes + 1 if with_reference_frame else self.nframes
+        frames = np.arange(self.nstim * nfr2 * self.height * self.width, dtype="<u2")
+        frames = frames.reshape(self.nstim, nfr2, self.height, self.width)
+
+        header = np.zeros(1, dtype=_blk_header_dtype)
+        vdaq_header = np.zeros(1, dtype=_blk_vdaq_header_dtype)
+        user_header = np.zeros(1, dtype=_blk_user_header_dtype)
+        lenheader = header.nbytes + vdaq_header.nbytes + user_header.nbytes
+
+        header["lenheader"] = lenheader
+        header["file_size"] = lenheader + frames.nbytes
+        header["filesubtype"] = 1
+        header["datatype"] = 12  # ushort
+        header["framewidth"] = self.width
+        header["frameheight"] = self.height
+        header["nframesperstim"] = self.nframes
+        header["nstimuli"] = self.nstim
+        header["framesize"] = self.width * self.height * 2
+        header["username"][0, :4] = np.frombuffer(b"neo!", dtype="u1")
+        vdaq_header["includesrefframe"] = int(with_reference_frame)
+        vdaq_header["ntrials"] = 7
+
+        with open(filename, "wb") as f:
+            for part in (header, vdaq_header, user_header, frames):
+                f.write(part.tobytes())
+        return frames
+
+    def read_block(self, filename, lazy=False):
+        io = BlkIO(str(filename), units="V", sampling_rate=10.0 * pq.Hz, spatial_scale=1.0 * pq.um)
+        return io.read_block(lazy=lazy)
+
+    def check_block(self, block, frames):
+        self.assertEqual(len(block.segments), self.nstim)
+        for stim, segment in enumerate(block.segments):
+            self.assertEqual(segment.description, f"stim nb:{stim}")
+            self.assertEqual(len(segment.imagesequences), 1)
+            image_sequence = segment.imagesequences[0]
+            self.assertEqual(image_sequence.shape, (self.nframes, self.height, self.width))
+            self.assertEqual(image_sequence.sampling_rate, 10.0 * pq.Hz)
+            self.assertEqual(image_sequence.spatial_scale, 1.0 * pq.um)
+            np.testing.assert_array_equal(image_sequence.magnitude, frames[stim, -self.nframes :])
+
+    def test_read_block(self):
+        with TemporaryDirectory() as tmpdir:
+            filename = Path(tmpdir) / "synthetic.BLK"
+            frames = self.write_blk(filename)
+            block = self.read_block(filename)
+            self.check_block(block, frames)
+
+    def test_read_block_with_reference_frame(self):
+        with TemporaryDirectory() as tmpdir:
+            filename = Path(tmpdir) / "synthetic.BLK"
+            frames = self.write_blk(filename, with_reference_frame=True)
+            with self.assertWarns(UserWarning):
+                block = self.read_block(filename)
+            # the reference frame is neither part of the image sequences nor subtracted
+            self.check_block(block, frames)
+
+    def test_read_block_lazy(self):
+        with TemporaryDirectory() as tmpdir:
+            filename = Path(tmpdir) / "synthetic.BLK"
+            frames = self.write_blk(filename, with_reference_frame=True)
+            with self.assertWarns(UserWarning):
+                block = self.read_block(filename, lazy=True)
+            self.assertEqual(len(block.segments), self.nstim)
+            for stim, segment in enumerate(block.segments):
+                proxy = segment.imagesequences[0]
+                self.assertIsInstance(proxy, ImageSequenceProxy)
+                self.assertEqual(proxy.shape, (self.nframes, self.height, self.width))
+
+                image_sequence = proxy.load(
+                    time_slice=(0.1 * pq.s, 0.4 * pq.s), spatial_slice=(slice(1, 3), slice(2, None))
+                )
+                np.testing.assert_array_equal(image_sequence.magnitude, frames[stim, 2:5, 1:3, 2:])
+                self.assertEqual(image_sequence.t_start, 0.1 * pq.s)
+
+                np.testing.assert_array_equal(proxy.load().magnitude, frames[stim, 1:])
+            del block, proxy, image_sequence
+
+    def test_annotations(self):
+        with TemporaryDirectory() as tmpdir:
+            filename = Path(tmpdir) / "synthetic.BLK"
+            frames = self.write_blk(filename)
+            block = self.read_block(filename)
+            self.assertEqual(block.file_origin, str(filename))
+            annotations = block.annotations
+            self.assertEqual(annotations["nstimuli"], self.nstim)
+            self.assertEqual(annotations["nframesperstim"], self.nframes)
+            self.assertEqual(annotations["framewidth"], self.width)
+            self.assertEqual(annotations["frameheight"], self.height)
+            self.assertEqual(annotations["datatype"], 12)
+            self.assertEqual(annotations["ntrials"], 7)
+            self.assertEqual(annotations["includesrefframe"], 0)
+            self.assertEqual(annotations["lenheader"] + frames.nbytes, annotations["actuallength"])
+            self.assertEqual("".join(annotations["username"][:4]), "neo!")
+            self.assertEqual(len(annotations["whichblocks"]), 16)
+            self.assertEqual(len(annotations["comment"]), 256)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,10 @@
 from pathlib import Path
+import subprocess
+import sys
 from tempfile import TemporaryDirectory
 import platform
-from neo.io import get_io, list_candidate_ios, NixIO
+import neo.io
+from neo.io import get_io, list_candidate_ios, detect_io, NixIO, BlackrockIO, NeuralynxIO, SpikeGLXIO
 import pytest
 
 try:
@@ -49,3 +52,91 @@ def test_get_io_non_existant_file_writable_io():
 
     # cleanup
     non_existant_file.unlink(missing_ok=True)  # cleanup will fail on Windows so need to skip
+
+
+def test_io_registry_matches_io_classes():
+    for name, (_, _, extensions, mode) in neo.io._io_registry.items():
+        io_class = getattr(neo.io, name)
+        assert io_class.extensions == extensions, name
+        assert io_class.mode == mode, name
+    assert len(neo.io.iolist) == len(neo.io._io_registry)
+
+
+def test_import_does_not_import_ios():
+    code = "import sys, neo; print(any(m.startswith(('neo.io.', 'neo.rawio.')) for m in sys.modules))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "False"
+
+
+def test_star_import():
+    code = "from neo.io import *; print(AxonIO.__name__, AxonIO in iolist, AxonIO in io_by_extension['abf'], get_io)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.split()[:5] == ["AxonIO", "True", "True", "<function", "get_io"]
+    assert set(neo.io.__all__) <= set(dir(neo.io))
+
+
+def test_neo_star_import():
+    code = (
+        "from neo import *; "
+        "print(Block.__name__, AnalogSignal.__name__, AxonIO.__name__, AxonIO in iolist, get_io.__name__)"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.split() == ["Block", "AnalogSignal", "AxonIO", "True", "get_io"]
+    assert set(neo.io.__all__) <= set(neo.__all__)
+    assert set(neo.__all__) <= set(dir(neo)) | set(neo.io.__all__)
+
+
+def test_detect_io_signatures():
+    with TemporaryDirectory(prefix="detect_io_test_") as test_folder:
+        test_folder = Path(test_folder)
+
+        # .nev files are supported by both Blackrock and Neuralynx: magic bytes decide
+        (test_folder / "blackrock").mkdir()
+        (test_folder / "blackrock" / "file.nev").write_bytes(b"NEURALEV" + bytes(8))
+        (test_folder / "neuralynx").mkdir()
+        (test_folder / "neuralynx" / "file.nev").write_bytes(b"######## Neuralynx Data File Header")
+        ranking = detect_io(test_folder / "blackrock" / "file.nev")
+        assert ranking[0] == (BlackrockIO, 1.0)
+        assert ranking[1][0] is NeuralynxIO and ranking[1][1] < 1
+        assert detect_io(test_folder / "neuralynx")[0] == (NeuralynxIO, 1.0)
+
+        # nested .meta/.bin pair
+        spikeglx_folder = test_folder / "spikeglx" / "run_g0" / "run_g0_imec0"
+        spikeglx_folder.mkdir(parents=True)
+        (spikeglx_folder / "run_g0_t0.imec0.ap.bin").touch()
+        (spikeglx_folder / "run_g0_t0.imec0.ap.meta").touch()
+        assert detect_io(test_folder / "spikeglx")[0] == (SpikeGLXIO, 1.0)
+        with pytest.raises(ValueError):
+            detect_io(test_folder / "spikeglx", max_depth=1)
+
+        # results are cached until the folder is modified
+        from neo.io.formatdetection import _detection_cache
+
+        assert any(key[0] == str((test_folder / "spikeglx").resolve()) for key in _detection_cache)
+        (test_folder / "spikeglx" / "file.plx").touch()
+        assert "PlexonIO" in [io.__name__ for io in list_candidate_ios(test_folder / "spikeglx")]
+        # including a modification in a nested directory
+        (spikeglx_folder / "file.abf").touch()
+        assert "AxonIO" in [io.__name__ for io in list_candidate_ios(test_folder / "spikeglx")]
+
+
+def test_detect_io_cache(monkeypatch):
+    from neo.io import formatdetection
+
+    monkeypatch.setattr(formatdetection, "_detection_cache", {})
+    monkeypatch.setattr(formatdetection, "_detection_cache_size", 2)
+    with TemporaryDirectory(prefix="detect_io_test_") as test_folder:
+        test_folder = Path(test_folder)
+        for name in ("a", "b", "c"):
+            (test_folder / name).mkdir()
+            (test_folder / name / "file.plx").touch()
+
+        detect_io(test_folder / "a", use_cache=False)
+        assert not formatdetection._detection_cache
+
+        # the least recently used folder is dropped
+        for name in ("a", "b", "a", "c"):
+            detect_io(test_folder / name)
+        assert [key[0] for key in formatdetection._detection_cache] == [
+            str((test_folder / name).resolve()) for name in ("a", "c")
+        ]
@@ -8,9 +8,9 @@ import numpy as np
 import quantities as pq
 from neo.core import NeoReadWriteError
 from neo.rawio.examplerawio import ExampleRawIO
-from neo.io.proxyobjects import AnalogSignalProxy, SpikeTrainProxy, EventProxy, EpochProxy
+from neo.io.proxyobjects import AnalogSignalProxy, SpikeTrainProxy, EventProxy, EpochProxy, ImageSequenceProxy
 
-from neo.core import Segment, AnalogSignal, Epoch, Event, SpikeTrain
+from neo.core import Segment, AnalogSignal, Epoch, Event, ImageSequence, SpikeTrain
 
 
 from neo.test.tools import assert_arrays_almost_equal, assert_neo_object_is_compliant, assert_same_attributes
@@ -233,6 +233,38 @@ class TestEpochProxy(BaseProxyTest):
         assert "nickname" in proxy_epoch.annotations
 
 
+class TestImageSequenceProxy(unittest.TestCase):
+
+    def test_ImageSequenceProxy(self):
+        frames = np.arange(10 * 6 * 8, dtype="uint16").reshape(10, 6, 8)
+        proxy_imgseq = ImageSequenceProxy(
+            frames, units="V", sampling_rate=10 * pq.Hz, spatial_scale=1 * pq.um, name="imgseq", file_origin="frames"
+        )
+        assert proxy_imgseq.shape == (10, 6, 8)
+        assert proxy_imgseq.t_stop == 1 * pq.s
+        assert proxy_imgseq.file_origin == "frames"
+
+        # full load
+        imgseq = proxy_imgseq.load()
+        assert isinstance(imgseq, ImageSequence)
+        assert imgseq.dtype == "float32"
+        assert imgseq.units == pq.V
+        assert imgseq.name == "imgseq"
+        np.testing.assert_array_equal(imgseq.magnitude, frames)
+
+        # time slice, region and raw magnitude
+        imgseq = proxy_imgseq.load(
+            time_slice=(0.2 * pq.s, 0.5 * pq.s), spatial_slice=(slice(1, 3), slice(None)), magnitude_mode="raw"
+        )
+        assert imgseq.dtype == "uint16"
+        assert imgseq.shape == (3, 2, 8)
+        assert imgseq.t_start == 0.2 * pq.s
+        np.testing.assert_array_equal(imgseq.magnitude, frames[2:5, 1:3])
+
+        with self.assertRaises(ValueError):
+            proxy_imgseq.load(time_slice=(2 * pq.s, 3 * pq.s))
+
+
 class TestSegmentWithProxy(BaseProxyTest):
     def test_segment_with_proxy(self):
         seg = Segment()
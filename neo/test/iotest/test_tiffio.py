@@ -4,6 +4,7 @@ from PIL import Image
 import numpy as np
 import shutil
 from neo.io.tiffio import TiffIO
+from neo.io.proxyobjects import ImageSequenceProxy
 import quantities as pq
 
 
@@ -51,6 +52,13 @@ class TestTiffIO(unittest.TestCase):
             places=3,
         )
 
+        blck_lazy = ioclass.read_block(lazy=True)
+        proxy = blck_lazy.segments[0].imagesequences[0]
+        self.assertIsInstance(proxy, ImageSequenceProxy)
+        self.assertEqual(proxy.shape, (10, 50, 50))
+        imgseq = proxy.load(time_slice=(2 * pq.s, 5 * pq.s), spatial_slice=(slice(10, 20), slice(None)))
+        np.testing.assert_array_equal(imgseq.magnitude, blck.segments[0].imagesequences[0].magnitude[2:5, 10:20])
+
         # end of directory
         shutil.rmtree(directory)
 
@@ -23,12 +23,16 @@ Author: Samuel Garcia
 """
 
 import logging
+import struct
 import tempfile
 import unittest
 
 from pathlib import Path, PureWindowsPath
 
-from neo.rawio.alphaomegarawio import AlphaOmegaRawIO
+import numpy as np
+from numpy.testing import assert_equal
+
+from neo.rawio.alphaomegarawio import AlphaOmegaRawIO, DataBlockPosition, _build_block_index, scan_mpx_datablocks
 
 from neo.test.rawiotest.common_rawio_test import BaseTestRawIO
 
@@ -281,5 +285,51 @@ class TestAlphaOmegaRawIO(BaseTestRawIO, unittest.TestCase):
                         )
 
 
+class TestScanMpxDatablocks(unittest.TestCase):
+    def test_scan(self):
+        datablocks = [
+            # first datablock (type h), skipped by the scan
+            struct.pack("<Hcx", 4, b"h"),
+            # analog channel data: header, 3 samples, first sample number
+            struct.pack("<HcBh3hI", 16, b"5", 0, 10, 1, 2, 3, 100),
+            # any other datablock
+            struct.pack("<Hc5x", 8, b"2"),
+            # digital channel data: header, sample number, value
+            struct.pack("<HcBhIh", 12, b"5", 1, 20, 42, -1),
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = Path(tmpdir) / "file.mpx"
+            filename.write_bytes(b"".join(datablocks) + struct.pack("<H", 65535))
+            scan = scan_mpx_datablocks(filename)
+
+        assert_equal(scan["block_positions"], [4, 20, 28])
+        assert_equal(scan["block_lengths"], [16, 8, 12])
+        assert_equal(scan["block_types"], [b"5", b"2", b"5"])
+        channel_data = scan["channel_data"]
+        assert_equal(channel_data["position"], [4, 28])
+        assert_equal(channel_data["length"], [16, 12])
+        assert_equal(channel_data["unit_number"], [0, 1])
+        assert_equal(channel_data["channel_number"], [10, 20])
+        self.assertEqual(channel_data["first_sample_number"][0], 100)
+        self.assertEqual(channel_data["payload"][1].tobytes(), struct.pack("<Ih", 42, -1))
+
+
+class TestBuildBlockIndex(unittest.TestCase):
+    def test_index(self):
+        positions = {
+            "a.mpx": np.array([(0, 100, 10), (20, 200, 10)], dtype=DataBlockPosition),
+            # the first block of b.mpx overlaps the first one of a.mpx
+            "b.mpx": np.array([(5, 300, 30), (10, 400, 5)], dtype=DataBlockPosition),
+        }
+        index = _build_block_index(positions)
+        self.assertEqual(index["files"], ["a.mpx", "b.mpx"])
+        assert_equal(index["blocks"]["sample_number"], [0, 5, 10, 20])
+        assert_equal(index["blocks"]["file"], [0, 1, 1, 0])
+        assert_equal(index["blocks"]["offset"], [100, 300, 400, 200])
+        # running maximum of the block ends, sorted although the blocks overlap
+        assert_equal(index["block_ends"], [10, 35, 35, 35])
+        self.assertEqual(index["size"], 55)
+
+
 if __name__ == "__main__":
     unittest.main()
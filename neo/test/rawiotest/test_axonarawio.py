@@ -5,7 +5,12 @@ Author: Steffen Buergers
 
 """
 
+import tempfile
 import unittest
+from pathlib import Path
+
+import numpy as np
+from numpy.testing import assert_equal
 
 from neo.rawio.axonarawio import AxonaRawIO
 
@@ -22,5 +27,37 @@ class TestAxonaRawIO(BaseTestRawIO, unittest.TestCase):
     ]
 
 
+class TestAxonaPacketMemmap(unittest.TestCase):
+    def test_analogsignal_chunk(self):
+        num_packets = 5
+        lines = [
+            "trial_date Friday, 15 Aug 2014",
+            "trial_time 18:00:00",
+            "rawRate 48000",
+            "ADC_fullscale_mv 1500",
+            "collectMask_1 1",
+            "collectMask_2 1",
+        ] + [f"gain_ch_{i} 1000" for i in range(64)]
+        # packets of 432 bytes: 32 bytes of head, 3 x 64 int16 samples, 16 bytes of tail
+        data = np.random.default_rng(0).integers(-1000, 1000, num_packets * 216, dtype="int16")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            set_file = Path(tmpdir) / "rec.set"
+            set_file.write_text("\r\n".join(lines) + "\r\ndata_start", encoding="cp1252")
+            data.tofile(set_file.with_suffix(".bin"))
+
+            reader = AxonaRawIO(filename=set_file)
+            reader.parse_header()
+            self.assertEqual(reader.get_signal_size(0, 0, 0), num_packets * 3)
+            for i_start, i_stop in [(0, 15), (1, 14), (4, 5), (7, 7)]:
+                chunk = reader.get_analogsignal_chunk(0, 0, i_start, i_stop, stream_index=0, channel_indexes=[6, 0, 3])
+                # sample i of a channel is at its remapped position within sample i % 3 of packet i // 3
+                samples = np.arange(i_start, i_stop)
+                positions = np.array(AxonaRawIO.channel_memory_offset)[[6, 0, 3]]
+                flat_indexes = (samples // 3 * 216 + 16 + samples % 3 * 64)[:, np.newaxis] + positions
+                assert_equal(chunk, data[flat_indexes])
+            del reader
+
+
 if __name__ == "__main__":
     unittest.main()
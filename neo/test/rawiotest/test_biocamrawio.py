@@ -2,9 +2,13 @@
 Tests of neo.rawio.BiocamRawIO
 """
 
+import struct
 import unittest
 
-from neo.rawio.biocamrawio import BiocamRawIO
+import numpy as np
+from numpy.testing import assert_equal
+
+from neo.rawio.biocamrawio import BiocamRawIO, decode_event_based_raw_data, parse_event_based_raw_headers
 from neo.test.rawiotest.common_rawio_test import BaseTestRawIO
 
 
@@ -23,5 +27,44 @@ class TestBiocamRawIO(
     ]
 
 
+class TestEventBasedSparseRaw(unittest.TestCase):
+    def setUp(self):
+        # channel blocks: (channel index, ranges of (first frame, frame after the last one, samples))
+        blocks = [(3, [(10, 13, [1, 2, 3]), (20, 22, [4, 5])]), (7, [(11, 15, [6, 7, 8, 9])])]
+        buffer = b""
+        for ch_idx, ranges in blocks:
+            ch_data = b"".join(
+                struct.pack("<QQ", start, stop) + np.array(samples, dtype="<u2").tobytes()
+                for start, stop, samples in ranges
+            )
+            buffer += struct.pack("<II", ch_idx, len(ch_data)) + ch_data
+        self.binary_data = np.frombuffer(buffer, dtype=np.uint8)
+
+    def test_parse_headers(self):
+        ch_indexes, range_starts, range_stops, range_positions = parse_event_based_raw_headers(self.binary_data)
+        assert_equal(ch_indexes, [3, 3, 7])
+        assert_equal(range_starts, [10, 20, 11])
+        assert_equal(range_stops, [13, 22, 15])
+        assert_equal(range_positions, [24, 46, 74])
+
+    def test_decode(self):
+        rf = {
+            "TOC": np.array([[0, 0], [0, 1000]]),
+            "Well_A1": {
+                "EventsBasedSparseRawTOC": np.array([0, self.binary_data.size]),
+                "EventsBasedSparseRaw": self.binary_data,
+            },
+        }
+        data = np.full((8, 21), 2048, dtype=np.uint16)
+        data = decode_event_based_raw_data(rf, data, "Well_A1", 0, 21)
+
+        expected = np.full((8, 21), 2048, dtype=np.uint16)
+        expected[3, 10:13] = [1, 2, 3]
+        # the second range of channel 3 is clipped to the requested frames
+        expected[3, 20] = 4
+        expected[7, 11:15] = [6, 7, 8, 9]
+        assert_equal(data, expected)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -4,7 +4,7 @@ Tests of neo.rawio.examplerawio
 
 import unittest
 
-from neo.rawio.blackrockrawio import BlackrockRawIO
+from neo.rawio.blackrockrawio import BlackrockRawIO, NSX_DATA_HEADER_TYPES, scan_ptp_timestamps
 from neo.test.rawiotest.common_rawio_test import BaseTestRawIO
 
 import numpy as np
@@ -375,5 +375,28 @@ class TestBlackrockRawIO(
         self.assertEqual(segments_strict, 3)  #
 
 
+class TestScanPtpTimestamps(unittest.TestCase):
+    def test_gap_table(self):
+        packets = np.zeros(1000, dtype=NSX_DATA_HEADER_TYPES["3.0-ptp"](2))
+        packets["num_data_points"] = 1
+        steps = np.full(packets.size - 1, 1000, dtype="int64")
+        steps[[99, 600]] = [50_000, 2_000_000]
+        steps[700] = 1001
+        packets["timestamps"] = 10**18 + np.concatenate(([0], np.cumsum(steps)))
+
+        # chunks smaller than the data must give the same table
+        for chunk_size in (7, 100, 2**22):
+            gaps = scan_ptp_timestamps(packets, gap_threshold=2000.0, chunk_size=chunk_size)
+            self.assertTrue(gaps["single_sample_packets"])
+            assert_equal(gaps["gap_indices"], [99, 600])
+            assert_equal(gaps["gap_timestamps"], packets["timestamps"][[99, 600]].astype("int64"))
+            assert_equal(gaps["gap_durations"], [50_000, 2_000_000])
+            assert_equal(gaps["min_steps"], [1000, 1000, 1000])
+            assert_equal(gaps["max_steps"], [1000, 1000, 1001])
+
+        packets["num_data_points"][500] = 2
+        self.assertFalse(scan_ptp_timestamps(packets, gap_threshold=2000.0)["single_sample_packets"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -3,8 +3,12 @@ Tests of neo.rawio.edfrawio
 """
 
 import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
 
-from neo.rawio.edfrawio import EDFRawIO
+import numpy as np
+
+from neo.rawio.edfrawio import EDFRawIO, HAS_PYEDF
 from neo.test.rawiotest.common_rawio_test import BaseTestRawIO
 
 
@@ -41,5 +45,83 @@ class TestExampleRawIO(
         io2.close()
 
 
+@unittest.skipUnless(HAS_PYEDF, "requires pyedflib")
+class TestEDFDataRecords(unittest.TestCase):
+    """Signals read from the memory mapped data records of synthetic files"""
+
+    sampling_rates = [100, 50, 100]
+    num_records = 4
+
+    def write_file(self, filename, file_type):
+        import pyedflib
+
+        signal_headers = [
+            dict(
+                label=f"ch{i}",
+                dimension="uV",
+                sample_frequency=rate,
+                physical_min=-3276.8,
+                physical_max=3276.7,
+                digital_min=-32768,
+                digital_max=32767,
+            )
+            for i, rate in enumerate(self.sampling_rates)
+        ]
+        # distinct digital values for each sample of each channel
+        data = [
+            np.arange(rate * self.num_records, dtype=np.int32) + 1000 * i for i, rate in enumerate(self.sampling_rates)
+        ]
+        writer = pyedflib.EdfWriter(str(filename), len(signal_headers), file_type=file_type)
+        writer.setSignalHeaders(signal_headers)
+        writer.writeSamples(data, digital=True)
+        if file_type == pyedflib.FILETYPE_EDFPLUS:
+            writer.writeAnnotation(1.5, -1, "event")
+        writer.close()
+        return data
+
+    def test_get_analogsignal_chunk(self):
+        import pyedflib
+
+        for file_type in (pyedflib.FILETYPE_EDF, pyedflib.FILETYPE_EDFPLUS):
+            with TemporaryDirectory() as tmpdir:
+                filename = Path(tmpdir) / "mixed_rates.edf"
+                data = self.write_file(filename, file_type)
+                reader = EDFRawIO(filename=str(filename))
+                reader.parse_header()
+
+                # one stream per sampling rate, with 100 and 50 samples per data record
+                self.assertEqual(reader.signal_streams_count(), 2)
+                self.assertEqual(reader._channel_samples_per_record, [100, 50, 100])
+                for stream_index, channels in [(0, [0, 2]), (1, [1])]:
+                    expected = np.stack([data[c] for c in channels], axis=1)
+                    size = reader.get_signal_size(block_index=0, seg_index=0, stream_index=stream_index)
+                    self.assertEqual(size, expected.shape[0])
+
+                    full = reader.get_analogsignal_chunk(stream_index=stream_index)
+                    np.testing.assert_array_equal(full, expected)
+
+                    samples_per_record = self.sampling_rates[channels[0]]
+                    # chunks starting, ending and spanning data record boundaries
+                    for i_start, i_stop in [
+                        (0, samples_per_record),
+                        (samples_per_record, 2 * samples_per_record),
+                        (samples_per_record - 1, samples_per_record + 1),
+                        (samples_per_record - 5, 3 * samples_per_record + 5),
+                        (size - 1, size),
+                    ]:
+                        chunk = reader.get_analogsignal_chunk(stream_index=stream_index, i_start=i_start, i_stop=i_stop)
+                        np.testing.assert_array_equal(chunk, expected[i_start:i_stop])
+
+                # unordered channel indexes of a stream
+                chunk = reader.get_analogsignal_chunk(stream_index=0, i_start=95, i_stop=205, channel_indexes=[1, 0])
+                np.testing.assert_array_equal(chunk, np.stack([data[2][95:205], data[0][95:205]], axis=1))
+
+                if file_type == pyedflib.FILETYPE_EDFPLUS:
+                    self.assertEqual(reader.event_count(event_channel_index=0), 1)
+
+                reader.close()
+                del reader
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,7 @@
+import subprocess
+import sys
+
+import neo.rawio
 from neo.rawio import get_rawio
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -25,3 +29,18 @@ def test_get_rawio_class_nonsupported_rawio():
 
     # cleanup
     non_existant_file.unlink(missing_ok=True)
+
+
+def test_rawio_registry_matches_rawio_classes():
+    for name, (_, extensions, rawmode) in neo.rawio._rawio_registry.items():
+        rawio_class = getattr(neo.rawio, name)
+        assert rawio_class.extensions == extensions, name
+        assert rawio_class.rawmode == rawmode, name
+    assert len(neo.rawio.rawiolist) == len(neo.rawio._rawio_registry)
+
+
+def test_star_import():
+    code = "from neo.rawio import *; print(AxonRawIO.__name__, AxonRawIO in rawiolist, get_rawio)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.split()[:4] == ["AxonRawIO", "True", "<function", "get_rawio"]
+    assert set(neo.rawio.__all__) <= set(dir(neo.rawio))
@@ -2,7 +2,7 @@ import unittest
 import numpy as np
 from pathlib import Path
 
-from neo.rawio.intanrawio import IntanRawIO
+from neo.rawio.intanrawio import IntanRawIO, make_stream_block_view
 from neo.test.rawiotest.common_rawio_test import BaseTestRawIO
 
 
@@ -273,5 +273,36 @@ class TestIntanRawIO(
                 np.testing.assert_array_equal(chunk[:, channel_index], expected)
 
 
+class TestStreamBlockView(unittest.TestCase):
+    def setUp(self):
+        dtype = np.dtype(
+            [
+                ("timestamp", "<i4", (4,)),
+                ("A-000", "<u2", (4,)),
+                ("A-001", "<u2", (4,)),
+                ("A-002", "<u2", (4,)),
+                ("VDD1", "<u2"),
+                ("VDD2", "<u2"),
+            ]
+        )
+        self.raw_data = np.zeros(3, dtype=dtype)
+        for name in dtype.names:
+            self.raw_data[name] = np.arange(self.raw_data[name].size).reshape(self.raw_data[name].shape) + len(name)
+
+    def test_view(self):
+        for field_names in (["A-000", "A-001", "A-002"], ["A-001"], ["VDD1", "VDD2"]):
+            view = make_stream_block_view(self.raw_data, field_names)
+            self.assertFalse(view.flags.writeable)
+            self.assertTrue(np.shares_memory(view, self.raw_data))
+            expected = np.stack([self.raw_data[name].reshape(3, -1) for name in field_names], axis=1)
+            np.testing.assert_array_equal(view, expected)
+
+    def test_no_single_stride(self):
+        # fields not evenly spaced
+        self.assertIsNone(make_stream_block_view(self.raw_data, ["A-000", "A-002", "A-001"]))
+        # fields with different dtypes
+        self.assertIsNone(make_stream_block_view(self.raw_data, ["timestamp", "A-000"]))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,21 @@
 import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import quantities as pq
+
+from neo.core import AnalogSignal, Block, Group, Segment, SpikeTrain
 from neo.rawio.nixrawio import NIXRawIO
 from neo.test.rawiotest.common_rawio_test import BaseTestRawIO
 
+try:
+    import nixio
+
+    HAVE_NIX = True
+except ImportError:
+    HAVE_NIX = False
+
 testfname = ""
 
 
@@ -11,5 +25,71 @@ class TestNixRawIO(BaseTestRawIO, unittest.TestCase):
     entities_to_test = ["nix/nixrawio-1.5.nix"]
 
 
+@unittest.skipUnless(HAVE_NIX, "Requires NIX")
+class TestNixRawIOWrittenBlock(unittest.TestCase):
+    """Read with NIXRawIO a small Block written by NixIO"""
+
+    def setUp(self):
+        from neo.io.nixio import NixIO
+
+        self.tmpdir = TemporaryDirectory()
+        self.filename = str(Path(self.tmpdir.name) / "block.nix")
+
+        block = Block()
+        for seg_index in range(2):
+            segment = Segment(name=f"segment {seg_index}")
+            signal = np.arange(30, dtype="float32").reshape(10, 3) + 100 * seg_index
+            segment.analogsignals.append(AnalogSignal(signal, units="mV", sampling_rate=1 * pq.kHz))
+            for unit_index in range(2):
+                # a different number of spikes in each unit and segment
+                times = np.arange(2 + unit_index + seg_index) * pq.s
+                segment.spiketrains.append(SpikeTrain(times, t_stop=10 * pq.s, name=f"unit {unit_index}"))
+            block.segments.append(segment)
+        # groups which are not segments are also stored as NIX groups
+        block.groups.append(Group(objects=[seg.spiketrains[0] for seg in block.segments], name="unit 0"))
+
+        with NixIO(self.filename, "ow") as io:
+            io.write_block(block)
+        self.block = block
+
+        self.reader = NIXRawIO(filename=self.filename)
+        self.reader.parse_header()
+
+    def tearDown(self):
+        self.reader.file.close()
+        self.tmpdir.cleanup()
+
+    def test_spike_count(self):
+        self.assertEqual(self.reader.segment_count(block_index=0), 2)
+        self.assertEqual(self.reader.spike_channels_count(), 2)
+        for seg_index, segment in enumerate(self.block.segments):
+            for unit_index, spiketrain in enumerate(segment.spiketrains):
+                count = self.reader.spike_count(block_index=0, seg_index=seg_index, spike_channel_index=unit_index)
+                self.assertEqual(count, spiketrain.size)
+                timestamps = self.reader.get_spike_timestamps(
+                    block_index=0, seg_index=seg_index, spike_channel_index=unit_index
+                )
+                self.assertEqual(count, len(timestamps))
+
+    def test_get_analogsignal_chunk(self):
+        for seg_index, segment in enumerate(self.block.segments):
+            expected = segment.analogsignals[0].magnitude
+
+            chunk = self.reader.get_analogsignal_chunk(block_index=0, seg_index=seg_index, stream_index=0)
+            np.testing.assert_array_equal(chunk, expected)
+
+            chunk = self.reader.get_analogsignal_chunk(
+                block_index=0, seg_index=seg_index, i_start=2, i_stop=5, stream_index=0, channel_indexes=[2, 0]
+            )
+            self.assertEqual(chunk.dtype, np.float32)
+            np.testing.assert_array_equal(chunk, expected[2:5, [2, 0]])
+
+            chunk = self.reader.get_analogsignal_chunk(
+                block_index=0, seg_index=seg_index, i_start=2, i_stop=5, stream_index=0, channel_indexes=[]
+            )
+            self.assertEqual(chunk.shape, (3, 0))
+            self.assertEqual(chunk.dtype, np.float32)
+
+
 if __name__ == "__main__":
     unittest.main()
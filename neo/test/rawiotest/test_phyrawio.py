@@ -7,6 +7,8 @@ Author: Regimantas Jurkus
 
 import unittest
 
+import numpy as np
+
 from neo.rawio.phyrawio import PhyRawIO
 
 from neo.test.rawiotest.common_rawio_test import BaseTestRawIO
@@ -91,5 +93,75 @@ class TestPhyRawIO(BaseTestRawIO, unittest.TestCase):
         self.assertRaises(ValueError, PhyRawIO._parse_tsv_or_csv_to_list_of_dict, txt_tempfile)
 
 
+class TestPhyRawIOSynthetic(unittest.TestCase):
+    """Spikes of a synthetic phy folder whose spike times are not sorted within clusters"""
+
+    sampling_rate = 1000.0
+
+    def write_phy_folder(self, dirname):
+        # cluster 4 has no spike in the first half and spikes of clusters 2 and 7 are interleaved
+        spike_times = np.array([500, 30, 20, 900, 400, 10, 700, 40, 600, 800, 200], dtype="uint64")
+        spike_clusters = np.array([2, 7, 2, 4, 7, 2, 2, 7, 4, 2, 7], dtype="int32")
+        # values derived from the spike times to check their alignment
+        spike_templates = (spike_times // 100).astype("uint32")
+        amplitudes = spike_times / 10.0
+        num_templates = spike_templates.max() + 1
+        pc_features = (spike_times[:, None, None] + np.arange(6).reshape(1, 3, 2)).astype("float32")
+        pc_feature_ind = np.arange(num_templates * 2, dtype="uint32").reshape(num_templates, 2)
+
+        # kilosort saves spike times and amplitudes as (n, 1) arrays
+        np.save(dirname / "spike_times.npy", spike_times[:, None])
+        np.save(dirname / "spike_clusters.npy", spike_clusters)
+        np.save(dirname / "spike_templates.npy", spike_templates)
+        np.save(dirname / "amplitudes.npy", amplitudes[:, None])
+        np.save(dirname / "pc_features.npy", pc_features)
+        np.save(dirname / "pc_feature_ind.npy", pc_feature_ind)
+        with open(dirname / "params.py", "w") as f:
+            f.write(f"dat_path = 'recording.dat'\nn_channels_dat = 4\nsample_rate = {self.sampling_rate}\n")
+        return spike_times, spike_clusters
+
+    def test_spikes_sorted_within_clusters(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dirname = Path(tmpdir)
+            spike_times, spike_clusters = self.write_phy_folder(dirname)
+            reader = PhyRawIO(dirname=dirname, load_amplitudes=True, load_pcs=True)
+            reader.parse_header()
+
+            self.assertEqual(reader.unit_labels, [2, 4, 7])
+            self.assertEqual(reader.segment_t_stop(block_index=0, seg_index=0), 0.9)
+            spike_annotations = reader.raw_annotations["blocks"][0]["segments"][0]["spikes"]
+            for spike_channel_index, cluster_id in enumerate([2, 4, 7]):
+                # spikes are returned sorted by time within a cluster, as a 1D array
+                expected = np.sort(spike_times[spike_clusters == cluster_id])
+                self.assertEqual(reader.spike_count(spike_channel_index=spike_channel_index), expected.size)
+                timestamps = reader.get_spike_timestamps(spike_channel_index=spike_channel_index)
+                self.assertEqual(timestamps.ndim, 1)
+                np.testing.assert_array_equal(timestamps, expected)
+
+                times = reader.rescale_spike_timestamp(timestamps, dtype="float64")
+                np.testing.assert_allclose(times, expected / self.sampling_rate)
+
+                # time slices keep the spikes in [t_start, t_stop)
+                timestamps = reader.get_spike_timestamps(
+                    spike_channel_index=spike_channel_index, t_start=0.02, t_stop=0.7
+                )
+                np.testing.assert_array_equal(timestamps, expected[(expected >= 20) & (expected < 700)])
+
+                # annotations are aligned with the sorted timestamps
+                annotations = spike_annotations[spike_channel_index]
+                self.assertEqual(annotations["cluster_id"], cluster_id)
+                array_annotations = annotations["__array_annotations__"]
+                np.testing.assert_array_equal(array_annotations["templates"], expected // 100)
+                np.testing.assert_array_equal(annotations["templates"], np.unique(expected // 100))
+                np.testing.assert_array_equal(array_annotations["amplitudes"], expected / 10.0)
+                for pc_idx in range(3):
+                    for channel_idx in range(2):
+                        np.testing.assert_array_equal(
+                            array_annotations[f"channel{channel_idx}_pc{pc_idx}"], expected + 2 * pc_idx + channel_idx
+                        )
+
+            del reader
+
+
 if __name__ == "__main__":
     unittest.main()
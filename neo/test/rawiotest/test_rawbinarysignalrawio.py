@@ -1,5 +1,10 @@
+import asyncio
+import os
+import tempfile
 import unittest
 
+import numpy as np
+
 from neo.rawio.rawbinarysignalrawio import RawBinarySignalRawIO
 from neo.test.rawiotest.common_rawio_test import BaseTestRawIO
 
@@ -13,5 +18,62 @@ class TestRawBinarySignalRawIO(
     entities_to_test = ["rawbinarysignal/File_rawbinary_10kHz_2channels_16bit.raw"]
 
 
+class TestRawBinarySignalRawIOFollow(unittest.TestCase):
+    def setUp(self):
+        fd, self.filename = tempfile.mkstemp(suffix=".raw")
+        os.close(fd)
+        self.data = np.arange(3000, dtype="int16").reshape(-1, 3)
+        self.data[:100].tofile(self.filename)
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def append(self, data):
+        with open(self.filename, mode="ab") as f:
+            f.write(data.tobytes())
+
+    def test_refresh(self):
+        reader = RawBinarySignalRawIO(self.filename, dtype="int16", nb_channel=3, sampling_rate=1000.0)
+        reader.parse_header()
+        self.assertEqual(reader.get_signal_size(0, 0, 0), 100)
+        self.assertFalse(reader.refresh())
+
+        # an incomplete frame is ignored until it is fully written
+        self.append(self.data[100:250])
+        self.append(self.data[250, :2])
+        self.assertTrue(reader.refresh())
+        self.assertEqual(reader.get_signal_size(0, 0, 0), 250)
+        self.assertEqual(reader.segment_t_stop(0, 0), 0.25)
+        np.testing.assert_array_equal(reader.get_analogsignal_chunk(i_start=90, i_stop=250), self.data[90:250])
+
+        self.append(self.data[250, 2:])
+        self.assertTrue(reader.refresh())
+        self.assertEqual(reader.get_signal_size(0, 0, 0), 251)
+
+    def test_follow_analogsignal_chunks(self):
+        reader = RawBinarySignalRawIO(self.filename, dtype="int16", nb_channel=3, sampling_rate=1000.0)
+        reader.parse_header()
+
+        chunks = reader.follow_analogsignal_chunks(chunk_size=60, poll_interval=0.0, timeout=0.0)
+        i_start, chunk = next(chunks)
+        self.assertEqual(i_start, 0)
+        np.testing.assert_array_equal(chunk, self.data[:60])
+        self.append(self.data[100:130])
+        followed = [(i_start, chunk)] + list(chunks)
+        self.assertEqual([i_start for i_start, chunk in followed], [0, 60, 100])
+        np.testing.assert_array_equal(np.concatenate([chunk for _, chunk in followed]), self.data[:130])
+
+        async def follow():
+            return [
+                chunk
+                async for _, chunk in reader.afollow_analogsignal_chunks(
+                    i_start=110, channel_indexes=[2], poll_interval=0.0, timeout=0.0
+                )
+            ]
+
+        chunks = asyncio.run(follow())
+        np.testing.assert_array_equal(np.concatenate(chunks), self.data[110:130, [2]])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,11 @@
+import tempfile
 import unittest
+from pathlib import Path
 
-from neo.rawio.spike2rawio import Spike2RawIO
+import numpy as np
+from numpy.testing import assert_equal
+
+from neo.rawio.spike2rawio import Spike2RawIO, get_channel_dtype
 
 from neo.test.rawiotest.common_rawio_test import BaseTestRawIO
 
@@ -21,5 +26,63 @@ class TestSpike2RawIO(
     ]
 
 
+class TestSpike2TimestampIndex(unittest.TestCase):
+    def test_get_timestamp_slice(self):
+        # an AdcMark channel (markers and waveforms of 4 samples) with two data blocks
+        chan_info = {"kind": 6, "n_extra": 8}
+        dt = get_channel_dtype(chan_info)
+        blocks = [
+            ([10, 30, 50], [1, 2, 1]),
+            # only the lowest byte of the marker is the unit code
+            ([20, 40, 60], [2, 1, 258]),
+        ]
+        content = b""
+        data_blocks = []
+        for ticks, markers in blocks:
+            records = np.zeros(len(ticks), dtype=dt)
+            records["tick"] = ticks
+            records["marker"] = markers
+            records["waveform"] = np.array(ticks)[:, np.newaxis] + np.arange(4)
+            # block header
+            content += bytes(20)
+            data_blocks.append((len(content), len(ticks), 0, ticks[0], ticks[-1]))
+            content += records.tobytes()
+        data_blocks = np.array(
+            data_blocks,
+            dtype=[
+                ("pos", "int32"),
+                ("size", "int32"),
+                ("cumsum", "int32"),
+                ("start_time", "int32"),
+                ("end_time", "int32"),
+            ],
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = Path(tmpdir) / "file.smr"
+            filename.write_bytes(content)
+            reader = Spike2RawIO.__new__(Spike2RawIO)
+            reader._memmap = np.memmap(filename, dtype="u1", mode="r")
+            reader._channel_infos = [chan_info]
+            reader._all_data_blocks = {0: data_blocks}
+            reader._timestamp_indexes = {}
+
+            ticks, positions = reader._get_timestamp_slice(0, 15, 50)
+            assert_equal(ticks, [20, 30, 40, 50])
+            assert_equal(reader._gather_record_field(positions, dt, "tick"), ticks)
+            assert_equal(reader._gather_record_field(positions, dt, "waveform"), ticks[:, np.newaxis] + np.arange(4))
+
+            for marker_filter, expected in [(1, [40, 50]), (2, [20, 30]), (3, [])]:
+                ticks, positions = reader._get_timestamp_slice(0, 15, 50, marker_filter=marker_filter)
+                assert_equal(ticks, expected)
+                assert_equal(
+                    reader._gather_record_field(positions, dt, "marker") & 255, [marker_filter] * len(expected)
+                )
+
+            ticks, _ = reader._get_timestamp_slice(0, 0, 100, marker_filter=2)
+            assert_equal(ticks, [20, 30, 60])
+            del reader
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,7 +2,9 @@ import unittest
 from pathlib import Path
 import tempfile
 
-from neo.rawio.spikegadgetsrawio import SpikeGadgetsRawIO
+import numpy as np
+
+from neo.rawio.spikegadgetsrawio import SpikeGadgetsRawIO, make_packet_stream_view
 from neo.test.rawiotest.common_rawio_test import BaseTestRawIO
 from numpy.testing import assert_array_equal
 
@@ -95,3 +97,30 @@ class TestSpikeGadgetsRawIO(
                 reader.parse_header()
 
             self.assertIn("xml header does not contain '</Configuration>'", str(cm.exception))
+
+
+class TestPacketStreamView(unittest.TestCase):
+    def setUp(self):
+        # 4 packets of 11 bytes
+        self.raw_memmap = np.random.default_rng(0).integers(0, 256, (4, 11), dtype="uint8")
+
+    def expected_samples(self, offsets):
+        return np.stack(
+            [self.raw_memmap[:, offset : offset + 2].copy().view("<i2")[:, 0] for offset in offsets], axis=1
+        )
+
+    def test_view(self):
+        # odd offsets: the samples are not aligned
+        for offsets in ([3, 5, 7], [0, 3, 6, 9], [6]):
+            offsets = np.array(offsets)
+            stream_view = make_packet_stream_view(self.raw_memmap, offsets)
+            self.assertTrue(np.shares_memory(stream_view, self.raw_memmap))
+            assert_array_equal(stream_view, self.expected_samples(offsets))
+
+    def test_no_view(self):
+        # channels not evenly spaced, or in decreasing order
+        self.assertIsNone(make_packet_stream_view(self.raw_memmap, np.array([3, 5, 9])))
+        self.assertIsNone(make_packet_stream_view(self.raw_memmap, np.array([7, 5, 3])))
+        # no channel or empty file
+        self.assertIsNone(make_packet_stream_view(self.raw_memmap, np.array([], dtype="int64")))
+        self.assertIsNone(make_packet_stream_view(self.raw_memmap[:0], np.array([3, 5])))
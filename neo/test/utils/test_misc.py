@@ -21,7 +21,15 @@ from neo.test.tools import (
     assert_same_annotations,
 )
 
-from neo.utils import get_events, get_epochs, add_epoch, match_events, cut_block_by_epochs
+from neo.utils import (
+    get_events,
+    get_epochs,
+    add_epoch,
+    add_epochs,
+    match_events,
+    match_event_labels,
+    cut_block_by_epochs,
+)
 
 
 class BaseProxyTest(unittest.TestCase):
@@ -328,6 +336,43 @@ class TestUtilsWithoutProxyObjects(unittest.TestCase):
         assert_same_attributes(matched_starts2, starts)
         assert_same_attributes(matched_stops2, stops)
 
+    def test__match_events_delays(self):
+        starts = Event(times=[0.5, 10.0, 25.2] * pq.s)
+        stops = Event(times=[5.5, 10.3, 14.9, 30.1] * pq.s)
+
+        # the stop at 10.3 s is too close to the start at 10.0 s
+        matched_starts, matched_stops = match_events(starts, stops, min_delay=500 * pq.ms)
+        assert_arrays_equal(matched_starts.times, [0.5, 10.0, 25.2] * pq.s)
+        assert_arrays_equal(matched_stops.times, [5.5, 14.9, 30.1] * pq.s)
+
+        # only the start at 10.0 s is followed by a stop within 1 s
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            matched_starts, matched_stops = match_events(starts, stops, max_delay=1 * pq.s)
+        assert_arrays_equal(matched_starts.times, [10.0] * pq.s)
+        assert_arrays_equal(matched_stops.times, [10.3] * pq.s)
+
+    def test__match_event_labels(self):
+        event = Event(
+            times=[0.5, 1.0, 5.5, 10.0, 12.0, 14.9, 25.2, 30.1] * pq.s,
+            labels=["start", "cue", "stop", "start", "cue", "stop", "start", "stop"],
+        )
+        event.array_annotate(trial_id=[1, 1, 1, 2, 2, 2, 3, 3])
+
+        matched = match_event_labels(event, {"trial": ("start", "stop"), "cue": ("cue", "stop")})
+        assert_arrays_equal(matched["trial"][0].times, [0.5, 10.0, 25.2] * pq.s)
+        assert_arrays_equal(matched["trial"][1].times, [5.5, 14.9, 30.1] * pq.s)
+        assert_arrays_equal(matched["cue"][0].times, [1.0, 12.0] * pq.s)
+        assert_arrays_equal(matched["cue"][1].array_annotations["trial_id"], np.array([1, 2]))
+
+        seg = Segment()
+        epochs = add_epochs(seg, event, {"trial": ("start", "stop"), "cue": ("cue", "stop")}, post=100 * pq.ms)
+        self.assertEqual([id(ep) for ep in seg.epochs], [id(epochs["trial"]), id(epochs["cue"])])
+        assert_neo_object_is_compliant(epochs["trial"])
+        self.assertEqual(epochs["cue"].name, "cue")
+        assert_arrays_equal(epochs["cue"].labels, np.array(["cue_0", "cue_1"]))
+        assert_arrays_almost_equal(epochs["trial"].durations, [5.1, 5.0, 5.0] * pq.s, 1e-12)
+
     def test__cut_block_by_epochs(self):
         epoch = Epoch([0.5, 10.0, 25.2] * pq.s, durations=[5.1, 4.8, 5.0] * pq.s, t_start=0.1 * pq.s)
         epoch.annotate(epoch_type="a", pick="me", nix_name="neo.epoch.0")
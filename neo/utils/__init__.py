@@ -6,7 +6,9 @@ from .misc import (
     get_events,
     get_epochs,
     add_epoch,
+    add_epochs,
     match_events,
+    match_event_labels,
     cut_block_by_epochs,
     cut_segment_by_epoch,
     is_block_rawio_compatible,
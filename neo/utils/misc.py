@@ -10,6 +10,7 @@ import numpy as np
 import quantities as pq
 
 import neo
+import neo.io.proxyobjects
 
 reserved_annotations = ["nix_name"]
 
@@ -328,15 +329,15 @@ def add_epoch(segment, event1, event2=None, pre=0 * pq.s, post=0 * pq.s, attach_
     times = event1.times + pre
     durations = event2.times + post - times
 
-    if any(durations < 0):
+    if np.any(durations.magnitude < 0):
         raise ValueError(f"Can not create epoch with negative duration. " "Requested durations {durations}.")
-    elif any(durations == 0):
+    elif np.any(durations.magnitude == 0):
         raise ValueError("Can not create epoch with zero duration.")
 
     if "name" not in kwargs:
         kwargs["name"] = "epoch"
     if "labels" not in kwargs:
-        kwargs["labels"] = [f"{kwargs['name']}_{i}" for i in range(len(times))]
+        kwargs["labels"] = np.char.add(f"{kwargs['name']}_", np.arange(len(times)).astype("U"))
 
     ep = neo.Epoch(times=times, durations=durations, **kwargs)
 
@@ -350,7 +351,7 @@ def add_epoch(segment, event1, event2=None, pre=0 * pq.s, post=0 * pq.s, attach_
     return ep
 
 
-def match_events(event1, event2):
+def match_events(event1, event2, min_delay=None, max_delay=None):
     """
     Finds pairs of Event entries in event1 and event2 with the minimum delay,
     such that the entry of event1 directly precedes the entry of event2.
@@ -361,6 +362,11 @@ def match_events(event1, event2):
     ----------
     event1, event2: Event
         The two Event objects to match up.
+    min_delay: Quantity (time) | None, default: None
+        If given, an entry of event1 must precede the entry of event2 by more
+        than min_delay to be matched.
+    max_delay: Quantity (time) | None, default: None
+        If given, matched pairs separated by more than max_delay are discarded.
 
     Returns
     -------
@@ -375,36 +381,13 @@ def match_events(event1, event2):
     if isinstance(event2, neo.io.proxyobjects.EventProxy):
         event2 = event2.load()
 
-    id1, id2 = 0, 0
-    match_ev1, match_ev2 = [], []
-    while id1 < len(event1) and id2 < len(event2):
-        time1 = event1.times[id1]
-        time2 = event2.times[id2]
-
-        # wrong order of events
-        if time1 >= time2:
-            id2 += 1
-
-        # shorter epoch possible by later event1 entry
-        elif id1 + 1 < len(event1) and event1.times[id1 + 1] < time2:
-            # there is no event in 2 until the next event in 1
-            id1 += 1
-
-        # found a match
-        else:
-            match_ev1.append(id1)
-            match_ev2.append(id2)
-            id1 += 1
-            id2 += 1
-
-    if id1 < len(event1):
-        warnings.warn(
-            "Could not match all events to generate epochs. Missed " f"{len(event1) - id1} event entries in event1 list"
-        )
-    if id2 < len(event2):
-        warnings.warn(
-            "Could not match all events to generate epochs. Missed " f"{len(event2) - id2} event entries in event2 list"
-        )
+    units = event1.units
+    match_ev1, match_ev2 = _match_times(
+        event1.times.magnitude,
+        event2.times.rescale(units).magnitude,
+        min_delay=None if min_delay is None else min_delay.rescale(units).magnitude,
+        max_delay=None if max_delay is None else max_delay.rescale(units).magnitude,
+    )
 
     event1_matched = _event_epoch_slice_by_valid_ids(obj=event1, valid_ids=match_ev1)
     event2_matched = _event_epoch_slice_by_valid_ids(obj=event2, valid_ids=match_ev2)
@@ -412,7 +395,194 @@ def match_events(event1, event2):
     return event1_matched, event2_matched
 
 
-def cut_block_by_epochs(block, properties=None, reset_time=False):
+def match_event_labels(event, label_pairs, min_delay=None, max_delay=None):
+    """
+    Matches several types of entries of a single Event at once, the types
+    being given by the labels of the entries. See match_events() for the
+    matching rule.
+
+    Parameters
+    ----------
+    event: Event
+        The Event object containing all entries, e.g. all the TTLs of a session.
+    label_pairs: dict
+        Maps a name to a pair (label1, label2): the entries labelled label1
+        are matched to the following entries labelled label2.
+    min_delay, max_delay: Quantity (time) | None, default: None
+        See match_events().
+
+    Returns
+    -------
+    matched: dict
+        Maps each name of label_pairs to a pair of Event objects of identical
+        length containing the matched entries.
+
+    Example
+    -------
+    >>> matched = match_event_labels(ttl_event, {"trial": ("start", "stop"), "reward": ("cue", "reward")})
+    >>> trial_starts, trial_stops = matched["trial"]
+    """
+    if isinstance(event, neo.io.proxyobjects.EventProxy):
+        event = event.load()
+
+    matched = {}
+    for name, (ids1, ids2) in _match_labels(event, label_pairs, min_delay, max_delay).items():
+        matched[name] = (
+            _event_epoch_slice_by_valid_ids(obj=event, valid_ids=ids1),
+            _event_epoch_slice_by_valid_ids(obj=event, valid_ids=ids2),
+        )
+    return matched
+
+
+def add_epochs(
+    segment,
+    event,
+    label_pairs,
+    pre=0 * pq.s,
+    post=0 * pq.s,
+    min_delay=None,
+    max_delay=None,
+    attach_result=True,
+    **kwargs,
+):
+    """
+    Create several Epochs from a single Event in one pass, the start and stop
+    entries of each Epoch being given by their labels. Entries are matched as
+    in match_events().
+
+    Parameters
+    ----------
+    segment : Segment
+        The segment in which the final Epoch objects are added.
+    event : Event
+        The Event object containing all start and stop entries.
+    label_pairs: dict
+        Maps the name of each Epoch to a pair (start label, stop label).
+    pre, post: Quantity (time)
+        Time offsets to modify the start (pre) and end (post) of the resulting
+        Epochs, see add_epoch().
+    min_delay, max_delay: Quantity (time) | None, default: None
+        See match_events().
+    attach_result: bool
+        If True, the resulting Epoch objects are added to segment.
+    **kwargs
+        Additional keyword arguments passed to all Epoch objects.
+
+    Returns
+    -------
+    epochs: dict
+        Maps each name of label_pairs to the corresponding Epoch.
+    """
+    if isinstance(event, neo.io.proxyobjects.EventProxy):
+        event = event.load()
+
+    epochs = {}
+    for name, (start_event, stop_event) in match_event_labels(event, label_pairs, min_delay, max_delay).items():
+        epochs[name] = add_epoch(
+            segment,
+            start_event,
+            stop_event,
+            pre=pre,
+            post=post,
+            attach_result=attach_result,
+            **{"name": name, **kwargs},
+        )
+    return epochs
+
+
+def _match_labels(event, label_pairs, min_delay=None, max_delay=None):
+    """
+    Internal function
+
+    Returns a dict mapping each name of label_pairs to the indices of the
+    matched entries of event.
+    """
+    units = event.units
+    if min_delay is not None:
+        min_delay = min_delay.rescale(units).magnitude
+    if max_delay is not None:
+        max_delay = max_delay.rescale(units).magnitude
+    times = event.times.magnitude
+
+    # group the entries by label, each group sorted by time
+    labels, codes = np.unique(event.labels, return_inverse=True)
+    order = np.lexsort((times, codes))
+    offsets = np.searchsorted(codes[order], np.arange(labels.size + 1))
+    groups = {label: order[offsets[i] : offsets[i + 1]] for i, label in enumerate(labels.tolist())}
+    empty = np.array([], dtype="int64")
+
+    matched = {}
+    for name, (label1, label2) in label_pairs.items():
+        group1 = groups.get(label1, empty)
+        group2 = groups.get(label2, empty)
+        ids1, ids2 = _match_times(
+            times[group1],
+            times[group2],
+            min_delay=min_delay,
+            max_delay=max_delay,
+            event_names=(f"{label1!r}", f"{label2!r}"),
+        )
+        matched[name] = (group1[ids1], group2[ids2])
+    return matched
+
+
+def _match_times(times1, times2, min_delay=None, max_delay=None, event_names=("event1", "event2")):
+    """
+    Internal function
+
+    Match each entry of times2 with the nearest preceding entry of times1,
+    each entry being used at most once. Returns the matched indices in times1
+    and times2.
+
+    For each entry of times2 the nearest preceding entry of times1 is found
+    with a single searchsorted, and only the first entry of times2 after each
+    entry of times1 is kept: this gives the pairs with the minimum delays in
+    linear time, as would a sequential scan of both sorted lists.
+    """
+    times1 = np.asarray(times1, dtype="float64")
+    times2 = np.asarray(times2, dtype="float64")
+    # matching works on time-sorted entries, indices are mapped back at the end
+    order1 = order2 = None
+    if np.any(np.diff(times1) < 0):
+        order1 = np.argsort(times1, kind="stable")
+        times1 = times1[order1]
+    if np.any(np.diff(times2) < 0):
+        order2 = np.argsort(times2, kind="stable")
+        times2 = times2[order2]
+
+    # index of the last entry of times1 strictly preceding each entry of times2
+    preceding = np.searchsorted(times1, times2 if min_delay is None else times2 - min_delay, side="left") - 1
+    is_match = preceding >= 0
+    is_match[1:] &= preceding[1:] != preceding[:-1]
+    ids2 = np.flatnonzero(is_match)
+    ids1 = preceding[ids2]
+
+    # warn about trailing entries the sequential scan would not have reached
+    if ids1.size == 0:
+        end1, end2 = 0, len(times2) if len(times1) else 0
+    elif ids1[-1] + 1 == len(times1):
+        end1, end2 = len(times1), ids2[-1] + 1
+    else:
+        end1, end2 = ids1[-1] + 1, len(times2)
+    for name, n_entries, end in zip(event_names, (len(times1), len(times2)), (end1, end2)):
+        if end < n_entries:
+            warnings.warn(
+                "Could not match all events to generate epochs. Missed "
+                f"{n_entries - end} event entries in {name} list"
+            )
+
+    if max_delay is not None:
+        within_delay = times2[ids2] - times1[ids1] <= max_delay
+        ids1, ids2 = ids1[within_delay], ids2[within_delay]
+
+    if order1 is not None:
+        ids1 = order1[ids1]
+    if order2 is not None:
+        ids2 = order2[ids2]
+    return ids1, ids2
+
+
+def cut_block_by_epochs(block, properties=None, reset_time=False, deep_copy=True):
     """
     This function cuts Segments in a Block according to multiple Neo
     Epoch objects.
@@ -457,6 +627,12 @@ def cut_block_by_epochs(block, properties=None, reset_time=False):
         in the range from 0 to the duration of the epoch duration.
         If False, original time stamps are retained.
         Default is False.
+    deep_copy: bool
+        If True the data objects of the new segments are copies of the
+        original data objects. If False, they share their data with the
+        original objects wherever possible, which saves memory when cutting
+        many epochs. See :meth:`Segment.time_slices`.
+        Default is True.
 
     Returns
     -------
@@ -484,7 +660,7 @@ def cut_block_by_epochs(block, properties=None, reset_time=False):
             )
 
         for epoch in epochs:
-            new_segments = cut_segment_by_epoch(seg, epoch=epoch, reset_time=reset_time)
+            new_segments = cut_segment_by_epoch(seg, epoch=epoch, reset_time=reset_time, deep_copy=deep_copy)
             new_block.segments.extend(new_segments)
 
     new_block.check_relationships()
@@ -492,7 +668,7 @@ def cut_block_by_epochs(block, properties=None, reset_time=False):
     return new_block
 
 
-def cut_segment_by_epoch(seg, epoch, reset_time=False):
+def cut_segment_by_epoch(seg, epoch, reset_time=False, deep_copy=True):
     """
     Cuts a Segment according to an Epoch object
 
@@ -515,6 +691,11 @@ def cut_segment_by_epoch(seg, epoch, reset_time=False):
         in the range from 0 to the duration of the epoch duration.
         If False, original time stamps are retained.
         Default is False.
+    deep_copy: bool
+        If True the data objects of the new segments are copies of the
+        original data objects. If False, they share their data with the
+        original objects wherever possible. See :meth:`Segment.time_slices`.
+        Default is True.
 
     Returns
     -------
@@ -529,10 +710,8 @@ def cut_segment_by_epoch(seg, epoch, reset_time=False):
     if not isinstance(epoch, neo.Epoch):
         raise TypeError(f"Epoch needs to be of type Epoch, not {type(epoch)}")
 
-    segments = []
-    for ep_id in range(len(epoch)):
-        subseg = seg.time_slice(epoch.times[ep_id], epoch.times[ep_id] + epoch.durations[ep_id], reset_time=reset_time)
-
+    segments = seg.time_slices(epoch.times, epoch.times + epoch.durations, reset_time=reset_time, deep_copy=deep_copy)
+    for ep_id, subseg in enumerate(segments):
         subseg.annotations = clean_annotations(subseg.annotations)
         subseg.annotate(**clean_annotations(epoch.annotations))
 
@@ -541,8 +720,6 @@ def cut_segment_by_epoch(seg, epoch, reset_time=False):
             if len(val):
                 subseg.annotations[key] = copy.copy(val[ep_id])
 
-        segments.append(subseg)
-
     return segments
 
 